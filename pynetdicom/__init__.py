@@ -1,6 +1,8 @@
 """Set module shortcuts and globals"""
 
+import importlib
 import logging
+import sys
 
 from pydicom.uid import UID
 
@@ -30,41 +32,82 @@ PYNETDICOM_IMPLEMENTATION_UID = UID(
 assert PYNETDICOM_IMPLEMENTATION_UID.is_valid
 
 
-# Convenience imports
-from pynetdicom import events as evt
-from pynetdicom.ae import ApplicationEntity as AE
-from pynetdicom.association import Association
-from pynetdicom._globals import (
-    ALL_TRANSFER_SYNTAXES, DEFAULT_TRANSFER_SYNTAXES
-)
-from pynetdicom.presentation import (
-    build_context,
-    build_role,
-    AllStoragePresentationContexts,
-    ApplicationEventLoggingPresentationContexts,
-    BasicWorklistManagementPresentationContexts,
-    ColorPalettePresentationContexts,
-    DefinedProcedureProtocolPresentationContexts,
-    DisplaySystemPresentationContexts,
-    HangingProtocolPresentationContexts,
-    ImplantTemplatePresentationContexts,
-    InstanceAvailabilityPresentationContexts,
-    MediaCreationManagementPresentationContexts,
-    MediaStoragePresentationContexts,
-    ModalityPerformedPresentationContexts,
-    NonPatientObjectPresentationContexts,
-    PrintManagementPresentationContexts,
-    ProcedureStepPresentationContexts,
-    ProtocolApprovalPresentationContexts,
-    QueryRetrievePresentationContexts,
-    RelevantPatientInformationPresentationContexts,
-    RTMachineVerificationPresentationContexts,
-    StoragePresentationContexts,
-    StorageCommitmentPresentationContexts,
-    SubstanceAdministrationPresentationContexts,
-    UnifiedProcedurePresentationContexts,
-    VerificationPresentationContexts,
-)
+# Convenience imports, which are only made when first used so that importing
+#   pynetdicom doesn't also import the entire package
+_LAZY_IMPORTS = {
+    'evt': ('pynetdicom.events', None),
+    'AE': ('pynetdicom.ae', 'ApplicationEntity'),
+    'Association': ('pynetdicom.association', 'Association'),
+}
+_LAZY_IMPORTS.update({
+    name: ('pynetdicom._globals', name)
+    for name in ('ALL_TRANSFER_SYNTAXES', 'DEFAULT_TRANSFER_SYNTAXES')
+})
+_LAZY_IMPORTS.update({
+    name: ('pynetdicom.presentation', name)
+    for name in (
+        'build_context',
+        'build_role',
+        'AllStoragePresentationContexts',
+        'ApplicationEventLoggingPresentationContexts',
+        'BasicWorklistManagementPresentationContexts',
+        'ColorPalettePresentationContexts',
+        'DefinedProcedureProtocolPresentationContexts',
+        'DisplaySystemPresentationContexts',
+        'HangingProtocolPresentationContexts',
+        'ImplantTemplatePresentationContexts',
+        'InstanceAvailabilityPresentationContexts',
+        'MediaCreationManagementPresentationContexts',
+        'MediaStoragePresentationContexts',
+        'ModalityPerformedPresentationContexts',
+        'NonPatientObjectPresentationContexts',
+        'PrintManagementPresentationContexts',
+        'ProcedureStepPresentationContexts',
+        'ProtocolApprovalPresentationContexts',
+        'QueryRetrievePresentationContexts',
+        'RelevantPatientInformationPresentationContexts',
+        'RTMachineVerificationPresentationContexts',
+        'StoragePresentationContexts',
+        'StorageCommitmentPresentationContexts',
+        'SubstanceAdministrationPresentationContexts',
+        'UnifiedProcedurePresentationContexts',
+        'VerificationPresentationContexts',
+    )
+})
+
+
+def __getattr__(name):
+    """Return the convenience import `name`, importing it on first access.
+
+    .. versionadded:: 2.0
+    """
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """Return the package's attributes, including the convenience imports
+    that haven't been made yet.
+
+    .. versionadded:: 2.0
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Module __getattr__() requires Python 3.7+
+if sys.version_info < (3, 7):
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
 
 
 # Setup default logging
@@ -81,3 +124,13 @@ def debug_logger():
     formatter = logging.Formatter('%(levelname).1s: %(message)s')
     handler.setFormatter(formatter)
     logger.addHandler(handler)
+
+
+# The convenience imports aren't package globals until first used so they
+#   have to be listed for `from pynetdicom import *`
+__all__ = sorted(
+    set(_LAZY_IMPORTS) | {
+        _name for _name, _obj in globals().items()
+        if not _name.startswith('_') and not isinstance(_obj, type(sys))
+    }
+)
@@ -9,6 +9,12 @@ LOG_HANDLER_LEVEL = 'standard'
 * If ``'standard'`` then certain events will be logged (association
   negotiation, DIMSE messaging, etc)
 
+.. versionchanged:: 2.0
+
+    With ``'standard'`` the PDU logging handlers are only called when the
+    ``'pynetdicom'`` logger is enabled for ``DEBUG`` and the DIMSE logging
+    handlers when it's enabled for ``INFO``.
+
 Examples
 --------
 
@@ -116,8 +122,15 @@ memory required when:
 * Sending large datasets
 * Sending many datasets concurrently
 
-As it's not possible to change the dataset encoding without loading it into
-memory, an exact matching accepted presentation context will be required.
+As the dataset isn't decoded its encoding can only be changed between
+*Implicit VR Little Endian*, *Explicit VR Little Endian* and *Deflated
+Explicit VR Little Endian*, which is done while the dataset is being sent.
+Otherwise an exact matching accepted presentation context will be required.
+
+.. versionchanged:: 2.0
+
+    Added conversion between *Implicit VR Little Endian*, *Explicit VR Little
+    Endian* and *Deflated Explicit VR Little Endian*
 
 Default: ``False``.
 
@@ -128,6 +141,36 @@ Examples
 >>> _config.STORE_SEND_CHUNKED_DATASET = True
 """
 
+STORE_SEND_CACHE_SIZE = None
+"""The maximum size of the cache of encoded C-STORE datasets.
+
+.. versionadded:: 2.0
+
+If not ``None``, then datasets encoded by
+:meth:`~pynetdicom.association.Association.send_c_store` are kept in a
+cache of up to the given total size (in bytes), so sending the same
+:class:`~pydicom.dataset.Dataset` again with the same transfer syntax, such
+as when forwarding it to several destinations, reuses the encoded data rather
+than encoding it again. Once the cache is full the least recently used
+datasets are removed.
+
+Datasets are identified by their identity and are encoded again if any of
+their elements have been added, removed or had a new value set, however
+values that have been modified in-place (such as by appending to a
+multi-valued element) aren't detected. A dataset's encoded data is removed
+from the cache once the dataset itself has been garbage collected.
+
+Default: ``None``.
+
+Examples
+--------
+
+Cache up to 256 MB of encoded datasets
+
+>>> from pynetdicom import _config
+>>> _config.STORE_SEND_CACHE_SIZE = 256 * 1024**2
+"""
+
 STORE_RECV_CHUNKED_DATASET = False
 """Chunk a dataset file when receiving it to minimise memory usage.
 
@@ -151,3 +194,186 @@ Examples
 >>> from pynetdicom import _config
 >>> _config.STORE_RECV_CHUNKED_DATASET = True
 """
+
+
+STORE_RECV_MEMORY_BUDGET = None
+"""The maximum memory used to receive C-STORE datasets across all
+associations.
+
+.. versionadded:: 2.0
+
+If not ``None``, then when the total size (in bytes) of all the C-STORE
+request datasets currently being received in memory would exceed the budget,
+any dataset that's being received is moved to a temporary file instead, as
+with :attr:`ApplicationEntity.store_recv_spill_threshold
+<pynetdicom.ae.ApplicationEntity.store_recv_spill_threshold>`. This limits
+the memory used when many large datasets are received at once, while
+allowing small datasets to be kept in memory. The memory for a dataset kept
+in memory is counted until the ``evt.EVT_C_STORE`` handler has returned,
+including the extra copy briefly made once the dataset has been received.
+
+Default: ``None``.
+
+Examples
+--------
+
+Limit the memory used to receive datasets to 1 GB
+
+>>> from pynetdicom import _config
+>>> _config.STORE_RECV_MEMORY_BUDGET = 1024**3
+"""
+
+
+ASYNC_NOTIFICATION_HANDLERS = False
+"""Call the handlers bound to notification events from a separate thread.
+
+.. versionadded:: 2.0
+
+If ``False`` (default) then the handlers bound to notification events such as
+``evt.EVT_PDU_RECV`` or ``evt.EVT_DIMSE_SENT`` are called by the thread that
+triggered the event, so a slow handler delays the association. If ``True``
+then the events are instead added to a queue and their handlers called, in
+order, by a single dispatcher thread. Handlers bound to intervention events
+are always called straight away.
+
+If the queue is full then the event is dropped, the number of dropped events
+can be checked using :func:`~pynetdicom.events.dispatch_statistics`.
+
+.. warning::
+
+    As the handlers are called after the event has occurred, the state of the
+    event's :class:`~pynetdicom.association.Association` may have changed by
+    the time they're called.
+
+Default: ``False``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.ASYNC_NOTIFICATION_HANDLERS = True
+"""
+
+
+NOTIFICATION_QUEUE_SIZE = 10000
+"""The maximum number of notification events waiting to be handled when
+:attr:`~pynetdicom._config.ASYNC_NOTIFICATION_HANDLERS` is ``True``.
+
+.. versionadded:: 2.0
+
+The size is used when the dispatcher thread is started, which happens the
+first time a notification event is queued.
+
+Default: ``10000``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.NOTIFICATION_QUEUE_SIZE = 1000
+"""
+
+
+FIND_SCP_PIPELINE_DEPTH = None
+"""The number of C-FIND SCP results to fetch and encode in advance.
+
+.. versionadded:: 2.0
+
+If not ``None``, then when acting as a C-FIND SCP the handler bound to
+``evt.EVT_C_FIND`` is iterated over in a separate thread, which fetches up to
+the given number of results and encodes their *Identifiers* while the
+responses for the earlier results are being sent. This can make queries with
+many matches complete much faster, particularly when the handler is waiting
+on a database.
+
+If a C-CANCEL request is received then any results that have already been
+fetched aren't sent, and a response with a Cancel status is sent instead.
+
+.. warning::
+
+    As the handler is run in a separate thread it shouldn't rely on being
+    called from the association's thread.
+
+Default: ``None``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.FIND_SCP_PIPELINE_DEPTH = 20
+"""
+
+
+CODEC_POOL_THRESHOLD = 16384
+"""The minimum size of a dataset encoded or decoded using the AE's process
+pool.
+
+.. versionadded:: 2.0
+
+When :attr:`ApplicationEntity.codec_processes
+<pynetdicom.ae.ApplicationEntity.codec_processes>` is set, datasets with an
+encoded length (in bytes) of at least the given value are encoded or decoded
+by the pool of worker processes. Smaller datasets, such as most query
+*Identifiers*, are quicker to encode and decode in the association's own
+thread than to pass to another process.
+
+Default: ``16384``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.CODEC_POOL_THRESHOLD = 1024**2
+"""
+
+
+NEGOTIATION_CACHE_SIZE = 128
+"""The number of presentation context negotiation results to cache.
+
+.. versionadded:: 2.0
+
+When acting as the association *Acceptor*, the results of negotiating the
+presentation contexts and SCP/SCU roles proposed by the *Requestor* are
+cached by each association server, so a peer that sends the same proposal
+each time is only negotiated with once. Once the cache is full the least
+recently used results are removed. Set to ``0`` to disable the cache.
+
+The cache is only used while the association's supported presentation
+contexts are shared with the server, so it's not used if they've been
+accessed or replaced using :attr:`ServiceUser.supported_contexts
+<pynetdicom.association.ServiceUser.supported_contexts>` before the
+negotiation.
+
+Default: ``128``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.NEGOTIATION_CACHE_SIZE = 0
+"""
+
+
+PDATA_QUEUE_SIZE = 16
+"""The maximum number of P-DATA primitives waiting to be sent by each
+association.
+
+.. versionadded:: 2.0
+
+When sending a DIMSE message its P-DATA primitives are produced as the
+message is being encoded, so once the given number are waiting to be sent
+the encoding is paused until the earlier ones have been written to the
+socket. This keeps the memory used to send large datasets, such as an
+:class:`~pynetdicom.dsutils.EncodedDataset` read from a file, from growing
+with the size of the dataset. Set to ``None`` for no limit.
+
+The size is used when the association is created.
+
+Default: ``16``.
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.PDATA_QUEUE_SIZE = 64
+"""
@@ -16,6 +16,10 @@ from pynetdicom.utils import pretty_bytes
 
 LOGGER = logging.getLogger('pynetdicom.events')
 
+# DIMSE messages with sub-handlers that log at INFO
+_INFO_RECV = (C_ECHO_RQ, C_ECHO_RSP, C_STORE_RQ, C_STORE_RSP, N_GET_RSP)
+_INFO_SENT = (C_STORE_RQ, )
+
 
 # Debugging handlers
 def debug_fsm(event):
@@ -163,6 +167,31 @@ def debug_data(event, pdu_type=None, print_raw=True, print_summary=False):
 
 
 # Standard logging handlers
+def _log_level(level):
+    """Return a decorator marking a standard logging handler as only being
+    required when ``LOGGER`` is enabled for `level`.
+
+    The decorated handler gets an ``_is_enabled`` attribute that is checked by
+    :func:`~pynetdicom.events.trigger` before the handler's
+    :class:`~pynetdicom.events.Event` is created. As
+    :meth:`logging.Logger.isEnabledFor` is used the check follows any changes
+    made to the logging configuration.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    level : int
+        The lowest logging level used by the handler.
+    """
+    def decorator(func):
+        func._is_enabled = lambda: LOGGER.isEnabledFor(level)
+        return func
+
+    return decorator
+
+
+@_log_level(logging.DEBUG)
 def standard_pdu_recv_handler(event):
     """Standard handler when a PDU is received and decoded.
 
@@ -197,6 +226,7 @@ def standard_pdu_recv_handler(event):
     with event.assoc.lock:
         return handlers[type(pdu)](event)
 
+@_log_level(logging.DEBUG)
 def standard_pdu_sent_handler(event):
     """Standard handler when a PDU is encoded and sent.
 
@@ -230,6 +260,7 @@ def standard_pdu_sent_handler(event):
     with event.assoc.lock:
         return handlers[type(pdu)](event)
 
+@_log_level(logging.INFO)
 def standard_dimse_recv_handler(event):
     """Standard handler for the ACSE receiving a primitive from the DUL.
 
@@ -247,6 +278,13 @@ def standard_dimse_recv_handler(event):
         * :attr:`~pynetdicom.events.Event.timestamp`: the date and time that
           the message was decoded as :class:`datetime.datetime`.
     """
+    # Most messages are only logged at DEBUG
+    if (
+        type(event.message) not in _INFO_RECV
+        and not LOGGER.isEnabledFor(logging.DEBUG)
+    ):
+        return None
+
     handlers = {
         C_ECHO_RQ: _recv_c_echo_rq,
         C_ECHO_RSP: _recv_c_echo_rsp,
@@ -276,6 +314,7 @@ def standard_dimse_recv_handler(event):
     with event.assoc.lock:
         return handlers[type(event.message)](event)
 
+@_log_level(logging.INFO)
 def standard_dimse_sent_handler(event):
     """Standard handler for the ACSE receiving a primitive from the DUL.
 
@@ -293,6 +332,13 @@ def standard_dimse_sent_handler(event):
         * :attr:`~pynetdicom.events.Event.timestamp`: the date and time that
           the message was decode as :class:`datetime.datetime`.
     """
+    # Most messages are only logged at DEBUG
+    if (
+        type(event.message) not in _INFO_SENT
+        and not LOGGER.isEnabledFor(logging.DEBUG)
+    ):
+        return None
+
     handlers = {
         C_ECHO_RQ: _send_c_echo_rq,
         C_ECHO_RSP: _send_c_echo_rsp,
@@ -914,7 +960,10 @@ def _send_c_store_rq(event):
     dataset = "None"
     if msg.data_set and msg.data_set.getvalue() != b"":
         dataset = "Present"
-    elif msg._data_set_path is not None:
+    elif (
+        msg._data_set_path is not None
+        or msg._data_set_source is not None
+    ):
         dataset = "Present"
 
     if cs.AffectedSOPClassUID.name == "CT Image Storage":
@@ -926,6 +975,10 @@ def _send_c_store_rq(event):
 
     LOGGER.info(f"Sending Store Request: MsgID {cs.MessageID}{dataset_type}")
 
+    # The rest is only logged at DEBUG
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return []
+
     s = [
         f"{' OUTGOING DIMSE MESSAGE ':=^76}",
         "Message Type                  : C-STORE RQ",
@@ -1227,6 +1280,10 @@ def _recv_c_echo_rq(event):
 
     LOGGER.info(f"Received Echo Request (MsgID {cs.MessageID})")
 
+    # The rest is only logged at DEBUG
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return []
+
     s = [
         f"{' INCOMING DIMSE MESSAGE ':=^76}",
         "Message Type                  : C-ECHO RQ",
@@ -1302,9 +1359,15 @@ def _recv_c_store_rq(event):
     dataset = "None"
     if msg.data_set and msg.data_set.getvalue() != b"":
         dataset = "Present"
+    elif msg._data_set_sink is not None:
+        dataset = "Present"
 
     LOGGER.info("Received Store Request")
 
+    # The rest is only logged at DEBUG
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return []
+
     s = [
         f"{' INCOMING DIMSE MESSAGE ':=^76}",
         "Message Type                  : C-STORE RQ",
@@ -1353,6 +1416,10 @@ def _recv_c_store_rsp(event):
 
     LOGGER.info(f"Received Store Response (Status: {status_str})")
 
+    # The rest is only logged at DEBUG
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return []
+
     s = [
         f"{' INCOMING DIMSE MESSAGE ':=^76}",
         "Message Type                  : C-STORE RSP",
@@ -1973,6 +2040,10 @@ def _recv_n_get_rsp(event):
         dataset = "Present"
 
     LOGGER.info("Received Get Response")
+
+    # The rest is only logged at DEBUG
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return []
     s = [
         f"{' INCOMING DIMSE MESSAGE ':=^76}",
         "Message Type                  : N-GET RSP",
@@ -2729,6 +2800,22 @@ def doc_handle_store(event, *args):
         * :attr:`~pynetdicom.events.Event.dataset_path`: when
           :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` is ``True``,
           this is the path to the received dataset as :class:`pathlib.Path`.
+        * :attr:`~pynetdicom.events.Event.dataset_sink`: the object returned
+          by the handler bound to ``evt.EVT_C_STORE_SINK`` that the encoded
+          dataset was written to, or ``None`` if no sink was used. If a sink
+          was used then :attr:`~pynetdicom.events.Event.dataset` will be an
+          empty :class:`~pydicom.dataset.Dataset` (*added in v2.0*).
+        * :attr:`~pynetdicom.events.Event.dataset_sink_error`: the exception
+          raised when writing to the sink, in which case the sink doesn't
+          contain the complete dataset, or ``None`` otherwise. If the handler
+          returns a success or warning status when writing to the sink failed
+          then a response with status ``0xA700`` is sent instead (*added in
+          v2.0*).
+        * :attr:`~pynetdicom.events.Event.encoded_dataset`: the C-STORE
+          request's *Data Set* as an
+          :class:`~pynetdicom.dsutils.EncodedDataset`, which can be used to
+          forward the dataset to another association without decoding it
+          (*added in v2.0*).
         * :attr:`~pynetdicom.events.Event.file_meta`: a
           :class:`~pydicom.dataset.Dataset` containing DICOM
           conformant File Meta Information that can be used with the decoded
@@ -2767,6 +2854,7 @@ def doc_handle_store(event, *args):
     :class:`~pynetdicom.dimse_primitives.C_STORE`
     :class:`~pynetdicom.service_class.StorageServiceClass`
     :class:`~pynetdicom.service_class.NonPatientObjectStorageServiceClass`
+    :func:`~pynetdicom._handlers.doc_handle_store_sink`
 
     References
     ----------
@@ -2780,6 +2868,118 @@ def doc_handle_store(event, *args):
     """
     pass
 
+
+def doc_handle_store_sink(event, *args):
+    """Documentation for handlers bound to ``evt.EVT_C_STORE_SINK``.
+
+    .. versionadded:: 2.0
+
+    User implementation of this event handler is optional. If a handler is
+    bound to ``evt.EVT_C_STORE_SINK`` then it will be called as soon as a
+    C-STORE request's *Command Set* has been received, before any of the
+    *Data Set* has arrived. If the handler returns an object with a
+    ``write()`` method then each fragment of the encoded *Data Set* will be
+    written to it as it's received, instead of being kept in memory or
+    written to a temporary file. This allows the dataset to be streamed
+    directly into its final destination, such as a file, a hash object
+    wrapper or another connection, while keeping the memory used by each
+    association constant.
+
+    The data written to the sink is the *Data Set* encoded using the
+    transfer syntax of the presentation context the request was sent
+    under, without any File Meta Information. Each fragment is passed as a
+    :class:`memoryview` which is only valid for the duration of the
+    ``write()`` call unless copied.
+
+    Once the *Data Set* has been completely received the handler bound to
+    ``evt.EVT_C_STORE`` will be called as normal, with the sink available
+    via the :attr:`Event.dataset_sink
+    <pynetdicom.events.Event.dataset_sink>` property. Closing the sink is the
+    responsibility of the user. If the sink raises an exception while
+    being written to then the exception will be logged and the rest of the
+    *Data Set* will be discarded.
+
+    **Event**
+
+    ``evt.EVT_C_STORE_SINK``
+
+    **Supported Service Classes**
+
+    * :dcm:`Storage Service Class<part04/chapter_B.html>`
+    * :dcm:`Non-Patient Object Storage Service Class<part04/chapter_GG.html>`
+
+    Parameters
+    ----------
+    event : events.Event
+        The event representing a service class receiving a C-STORE
+        request message's *Command Set*. :class:`~pynetdicom.events.Event`
+        attributes are:
+
+        * :attr:`~pynetdicom.events.Event.assoc`: the
+          :class:`~pynetdicom.association.Association`
+          that is receiving the C-STORE request.
+        * :attr:`~pynetdicom.events.Event.context`: the presentation context
+          the request was sent under
+          as a :class:`~pynetdicom.presentation.PresentationContextTuple`.
+        * :attr:`~pynetdicom.events.Event.event`: the event that occurred as
+          :class:`~pynetdicom.events.InterventionEvent`.
+        * :attr:`~pynetdicom.events.Event.request`: the
+          :class:`C-STORE request <pynetdicom.dimse_primitives.C_STORE>`
+          with an empty *Data Set* parameter.
+        * :attr:`~pynetdicom.events.Event.timestamp`: the date and time
+          that the C-STORE request's *Command Set* was received as
+          :class:`datetime.datetime`.
+
+        :class:`~pynetdicom.events.Event` properties are:
+
+        * :attr:`~pynetdicom.events.Event.file_meta`: a
+          :class:`~pydicom.dataset.Dataset` containing DICOM
+          conformant File Meta Information that can be written to the sink
+          before the *Data Set* when storing in the DICOM File Format.
+        * :attr:`~pynetdicom.events.Event.message_id`: the C-STORE request's
+          *Message ID* as :class:`int`.
+    args
+        If the handler was bound to the event using
+        ``bind(event, handler, args)`` or by passing
+        ``evt_handlers=[(event, handler, args), ...]``, where `args` is a
+        :class:`list` then there will be one or more optional extra parameters
+        matching the contents of `args`.
+
+    Returns
+    -------
+    object or None
+        An object with a ``write()`` method that the encoded *Data Set* will
+        be written to, or ``None`` to receive the *Data Set* normally.
+
+    Examples
+    --------
+
+    Write each dataset directly to its final location in the DICOM File
+    Format.
+
+    .. code-block:: python
+
+        from pydicom.filewriter import write_file_meta_info
+
+        def handle_sink(event):
+            f = open(f"{event.request.AffectedSOPInstanceUID}.dcm", 'wb')
+            f.write(b'\\x00' * 128)
+            f.write(b'DICM')
+            write_file_meta_info(f, event.file_meta)
+            return f
+
+        def handle_store(event):
+            event.dataset_sink.close()
+            return 0x0000
+
+    See Also
+    --------
+
+    :func:`~pynetdicom._handlers.doc_handle_store`
+    :class:`~pynetdicom.dimse_primitives.C_STORE`
+    """
+    pass
+
 def doc_handle_action(event, *args):
     """Documentation for handlers bound to ``evt.EVT_N_ACTION``.
 
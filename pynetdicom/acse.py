@@ -379,11 +379,19 @@ class ACSE(object):
             for uid, item in self.requestor.role_selection.items()
         }
 
-        result, ac_roles = negotiate_as_acceptor(
-            assoc_rq.presentation_context_definition_list,
-            self.acceptor.supported_contexts,
-            rq_roles
-        )
+        # pylint: disable=protected-access
+        cache = self.acceptor._negotiation_cache
+        # pylint: enable=protected-access
+        if cache is not None:
+            result, ac_roles = cache.negotiate(
+                assoc_rq.presentation_context_definition_list, rq_roles
+            )
+        else:
+            result, ac_roles = negotiate_as_acceptor(
+                assoc_rq.presentation_context_definition_list,
+                self.acceptor.supported_contexts,
+                rq_roles
+            )
 
         # pylint: disable=protected-access
         # Accepted contexts are stored as {context ID : context}
@@ -9,6 +9,7 @@ import threading
 from pydicom.uid import UID
 
 from pynetdicom.association import Association
+from pynetdicom.dsutils import _CodecPool
 from pynetdicom.presentation import PresentationContext
 from pynetdicom.transport import (
     AssociationSocket, AssociationServer, ThreadedAssociationServer
@@ -37,6 +38,10 @@ class ApplicationEntity(object):
         messages. A value of ``None`` means no timeout. (default: ``30``)
     ae_title : bytes
         The local AE's *AE title*.
+    codec_processes : int or None
+        The number of worker processes used to encode and decode large
+        datasets. A value of ``None`` means datasets are encoded and decoded
+        in the association's thread (default).
     dimse_timeout : int or float or None
         The maximum amount of time (in seconds) to wait for DIMSE related
         messages. A value of ``None`` means no timeout. (default: ``30``)
@@ -59,6 +64,10 @@ class ApplicationEntity(object):
         Association *acceptor* only. If ``True``, the association request's
         *Called AE Title* value must match :attr:`ae_title` (default
         ``False``).
+    store_recv_spill_threshold : int or None
+        The maximum size (in bytes) of a received C-STORE request's dataset
+        that will be kept in memory, larger datasets are written to a
+        temporary file instead. A value of ``None`` means no limit (default).
     """
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(self, ae_title=b'PYNETDICOM'):
@@ -100,6 +109,13 @@ class ApplicationEntity(object):
         self.require_calling_aet = []
         self.require_called_aet = False
 
+        # Maximum size of a received dataset kept in memory - None for no limit
+        self.store_recv_spill_threshold = None
+
+        # Pool of processes used to encode and decode large datasets
+        self._codec_pool = None
+        self.codec_processes = None
+
         self._servers = []
         self._lock = threading.Lock()
 
@@ -572,6 +588,67 @@ class ApplicationEntity(object):
 
         return assoc
 
+    @property
+    def codec_processes(self):
+        """The number of worker processes used to encode and decode large
+        datasets.
+
+        .. versionadded:: 2.0
+        """
+        return self._codec_processes
+
+    @codec_processes.setter
+    def codec_processes(self, value):
+        """Set the number of worker processes used to encode and decode.
+
+        Encoding and decoding datasets is CPU-bound and holds the GIL, so
+        when there are many concurrent associations it's limited to a single
+        core. Setting `value` creates a pool of worker processes shared by all
+        the AE's associations, which is then used to encode and decode
+        datasets with an encoded length of at least
+        :attr:`~pynetdicom._config.CODEC_POOL_THRESHOLD` bytes. The pool is
+        used to encode the datasets sent by
+        :meth:`Association.send_c_store()
+        <pynetdicom.association.Association.send_c_store>` and the datasets
+        in the responses sent by the service class SCPs, such as C-FIND
+        *Identifiers* and N-GET *Attribute Lists*, and to decode the datasets
+        returned by
+        :attr:`Event.dataset<pynetdicom.events.Event.dataset>`,
+        :attr:`Event.identifier<pynetdicom.events.Event.identifier>` and the
+        other ``Event`` dataset attributes.
+
+        Large element values, such as *Pixel Data*, aren't pickled. They're
+        passed to the worker processes using shared memory, and decoded values
+        are taken from the encoded dataset the association already has.
+        Datasets decoded by the pool have all their element values converted
+        in the worker process, so they're best suited to handlers that use
+        most of the dataset's elements. Handlers that only write the dataset
+        to file should use :attr:`Event.encoded_dataset
+        <pynetdicom.events.Event.encoded_dataset>` instead.
+
+        The worker processes are started when first needed, using the
+        ``'spawn'`` start method, so the main module of the application
+        must be importable without side effects (i.e. guarded by
+        ``if __name__ == '__main__':``). They're stopped by :meth:`shutdown`
+        or when the value is changed.
+
+        Parameters
+        ----------
+        value : int or None
+            The number of worker processes, or ``None`` (default) to encode
+            and decode datasets in the association's thread.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if value is not None and (not isinstance(value, int) or value < 1):
+            LOGGER.warning("codec_processes set to None")
+            value = None
+
+        if self._codec_pool:
+            self._codec_pool.shutdown()
+
+        self._codec_processes = value
+        self._codec_pool = _CodecPool(value) if value else None
+
     def _create_socket(self, assoc, address, tls_args):
         """Create an :class:`~pynetdicom.transport.AssociationSocket` for the current association.
 
@@ -1127,6 +1204,47 @@ class ApplicationEntity(object):
             validate_ae_title(aet) for aet in ae_titles
         ]
 
+    @property
+    def store_recv_spill_threshold(self):
+        """The maximum size (in bytes) of a received C-STORE request's
+        dataset that will be kept in memory.
+
+        .. versionadded:: 2.0
+        """
+        return self._store_recv_spill_threshold
+
+    @store_recv_spill_threshold.setter
+    def store_recv_spill_threshold(self, value):
+        """Set the maximum size of a received dataset kept in memory.
+
+        When a C-STORE request's *Data Set* is received it's buffered in
+        memory until it exceeds `value` bytes, at which point the received
+        data is moved to a temporary file in the DICOM File Format and the
+        rest of the *Data Set* is written to the file as it arrives. The
+        path to the file is available to the ``evt.EVT_C_STORE`` handler
+        using the :attr:`Event.dataset_path
+        <pynetdicom.events.Event.dataset_path>` attribute and the file is
+        deleted once the handler returns. This allows small datasets to be
+        handled quickly without limiting the size of the datasets that can be
+        received.
+
+        A dataset may also be moved to a temporary file earlier if the total
+        memory used to receive datasets across all associations exceeds
+        :attr:`~pynetdicom._config.STORE_RECV_MEMORY_BUDGET`.
+
+        Parameters
+        ----------
+        value : int or None
+            The maximum size (in bytes) of a dataset kept in memory, or
+            ``None`` (default) for no limit.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if value is None or (isinstance(value, int) and value >= 0):
+            self._store_recv_spill_threshold = value
+        else:
+            LOGGER.warning("store_recv_spill_threshold set to None")
+            self._store_recv_spill_threshold = None
+
     def start_server(self, address, block=True, ssl_context=None,
                      evt_handlers=None, ae_title=None, contexts=None):
         """Start the AE as an association *acceptor*.
@@ -1242,6 +1360,9 @@ class ApplicationEntity(object):
 
         self._servers = []
 
+        if self._codec_pool:
+            self._codec_pool.shutdown()
+
     def __str__(self):
         """ Prints out the attribute values and status for the AE """
         str_out = "\n"
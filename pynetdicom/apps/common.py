@@ -610,7 +610,7 @@ def handle_store(event, args, app_logger):
         app_logger.warning('DICOM file already exists, overwriting')        
         
     try:
-        if event.context.transfer_syntax == DeflatedExplicitVRLittleEndian:
+        if ds.file_meta.TransferSyntaxUID == DeflatedExplicitVRLittleEndian:
             # Workaround for pydicom issue #1086
             with open(filename, 'wb') as f:
                 f.write(b'\x00' * 128)
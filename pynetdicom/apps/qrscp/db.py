@@ -25,10 +25,12 @@ except ImportError:
     sys.exit("qrscp requires the sqlalchemy package")
 
 from sqlalchemy import (
-    create_engine, Column, ForeignKey, Integer, String
+    create_engine, event, inspect, Column, ForeignKey, Integer, String
 )
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import contains_eager, relationship, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from pydicom.dataset import Dataset
 
@@ -93,6 +95,11 @@ _ATTRIBUTES = {
     'SOPInstanceUID' : ('IMAGE', 'U', 'UI', 1),
     'InstanceNumber' : ('IMAGE', 'R', 'UI', 1),
 }
+# The level of each db attribute
+_LEVELS = {_TRANSLATION[kw]: value[0] for kw, value in _ATTRIBUTES.items()}
+# The number of search results to fetch from the database at a time
+_YIELD_PER = 100
+
 _PATIENT_ROOT_ATTRIBUTES = OrderedDict({
     'PATIENT' : ['PatientID', 'PatientName'],
     'STUDY' : [
@@ -149,18 +156,15 @@ def add_instance(ds, session, fpath=None):
     fpath : str, optional
         The path to where the SOP Instance is stored, taken relative
         to the database file.
-    """
-    # Check if instance is already in the database
-    result = session.query(Instance).filter(
-        Instance.sop_instance_uid == ds.SOPInstanceUID
-    ).all()
-    if result:
-        instance = result[0]
-        instance_exists = True
-    else:
-        instance = Instance()
-        instance_exists = False
 
+    Returns
+    -------
+    bool
+        ``True`` if the SOP Instance was added to the database, ``False`` if
+        an existing instance was updated.
+
+        .. versionadded:: 2.0
+    """
     # Unique or Required attributes
     required = [
         # (Instance attribute, DICOM keyword, max length, req'd)
@@ -179,6 +183,7 @@ def add_instance(ds, session, fpath=None):
     ]
 
     # Unique and Required attributes
+    values = {}
     for attr, keyword, max_len, unique in required:
         if not unique and keyword not in ds:
             value = None
@@ -197,16 +202,16 @@ def add_instance(ds, session, fpath=None):
             else:
                 assert -2**31 <= value <= 2**31 - 1
 
-        setattr(instance, attr, value)
+        values[attr] = value
 
-    instance.filename = fpath
+    values['filename'] = fpath
 
     # Transfer Syntax UID
     try:
         tsyntax = ds.file_meta.TransferSyntaxUID
         if tsyntax:
             assert len(tsyntax) < 64
-            instance.transfer_syntax_uid = tsyntax
+            values['transfer_syntax_uid'] = tsyntax
     except (AttributeError, AssertionError) as exc:
         pass
 
@@ -215,13 +220,65 @@ def add_instance(ds, session, fpath=None):
         uid = ds.SOPClassUID
         if uid:
             assert len(uid) < 64
-            instance.sop_class_uid = uid
+            values['sop_class_uid'] = uid
     except (AttributeError, AssertionError):
         pass
 
-    session.add(instance)
+    added = _add_instance(values, session)
     session.commit()
 
+    return added
+
+
+def _add_instance(values, session):
+    """Add or update an Instance and its Series, Study and Patient.
+
+    Parameters
+    ----------
+    values : dict
+        The values to use for the Instance and its parents, as
+        ``{attribute name: value}``.
+    session : sqlalchemy.orm.session.Session
+        The session we are using to query the database.
+
+    Returns
+    -------
+    bool
+        ``True`` if the Instance was added, ``False`` if it was updated.
+    """
+    with session.no_autoflush:
+        patient, _ = _get_or_add(
+            session, Patient, patient_id=values['patient_id']
+        )
+        study, _ = _get_or_add(
+            session, Study, {'patient': patient},
+            study_instance_uid=values['study_instance_uid']
+        )
+        series, _ = _get_or_add(
+            session, Series, {'study': study},
+            series_instance_uid=values['series_instance_uid']
+        )
+        instance, added = _get_or_add(
+            session, Instance, {'series': series},
+            sop_instance_uid=values['sop_instance_uid']
+        )
+        study.patient = patient
+        series.study = study
+        instance.series = series
+
+        # The Patient, Study and Series attributes are taken from the most
+        #   recently added Instance
+        rows = {
+            'PATIENT': patient, 'STUDY': study, 'SERIES': series,
+            'IMAGE': instance
+        }
+        for attr, value in values.items():
+            setattr(rows[_LEVELS.get(attr, 'IMAGE')], attr, value)
+
+    session.flush()
+
+    return added
+
 
 def build_query(identifier, session, query=None):
     """Perform a query against the database.
@@ -357,13 +414,13 @@ def clear(session):
     session : sqlalchemy.orm.session.Session
         The session we are using to clear the database.
     """
-    for instance in session.query(Instance).all():
-        session.delete(instance)
+    for table in (Instance, Series, Study, Patient):
+        session.query(table).delete()
 
     session.commit()
 
 
-def create(db_location, echo=False):
+def create(db_location, echo=False, pool_size=None, pragmas=None):
     """Create a new database at `db_location` if one doesn't already exist.
 
     Parameters
@@ -372,8 +429,55 @@ def create(db_location, echo=False):
         The location of the database.
     echo : bool, optional
         Turn the sqlalchemy logging on (default ``False``).
+    pool_size : int, optional
+        If used then keep up to `pool_size` connections to the database open
+        so they can be reused by later sessions, otherwise use the default
+        sqlalchemy connection pool for the database.
+    pragmas : dict, optional
+        SQLite ``PRAGMA`` statements to run on each new connection to the
+        database, as ``{name: value}``, such as ``{'journal_mode': 'WAL'}``.
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+        The engine to use to connect to the database. If the database is
+        SQLite then transactions are started by sqlalchemy rather than the
+        driver so that savepoints work, and the ``sqlite_begin`` execution
+        option can be used to start them with ``BEGIN IMMEDIATE``, such as
+        ``engine.execution_options(sqlite_begin='IMMEDIATE')``.
     """
-    engine = create_engine(db_location, echo=echo)
+    kwargs = {}
+    if pool_size:
+        # Pooled connections may be used by any of the association threads
+        kwargs['poolclass'] = QueuePool
+        kwargs['pool_size'] = pool_size
+        kwargs['connect_args'] = {'check_same_thread': False}
+
+    engine = create_engine(db_location, echo=echo, **kwargs)
+
+    if pragmas:
+        @event.listens_for(engine, 'connect')
+        def _set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+
+            cursor.close()
+
+    if engine.dialect.name == 'sqlite':
+        # pysqlite doesn't emit BEGIN until the first INSERT or UPDATE and
+        #   never emits BEGIN IMMEDIATE, so emit BEGIN ourselves
+        @event.listens_for(engine, 'connect')
+        def _disable_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def _begin(conn):
+            mode = conn.get_execution_options().get('sqlite_begin')
+            conn.execute(f"BEGIN {mode}" if mode else "BEGIN")
+
+    # Update databases created by earlier versions of qrscp
+    migrate(engine)
 
     # Create the tables (won't recreate tables already present)
     Base.metadata.create_all(engine)
@@ -381,6 +485,104 @@ def create(db_location, echo=False):
     return engine
 
 
+def _get_or_add(session, table, defaults=None, **kwargs):
+    """Return the row in `table` that matches the unique `kwargs`, or if
+    there's no match then add a new one.
+
+    Parameters
+    ----------
+    session : sqlalchemy.orm.session.Session
+        The session we are using to query the database.
+    table : sqlalchemy.ext.declarative.api.DeclarativeMeta
+        The table to use.
+    defaults : dict, optional
+        Additional attributes to use when adding a new row, such as the row's
+        parent.
+    **kwargs
+        The unique attribute to match against.
+
+    Returns
+    -------
+    row, bool
+        The row and ``True`` if it was added, ``False`` otherwise.
+    """
+    query = session.query(table).filter_by(**kwargs)
+    row = query.first()
+    if row is not None:
+        return row, False
+
+    try:
+        # If another session has added a matching row since the query then
+        #   only the savepoint is rolled back and we use its row instead
+        with session.begin_nested():
+            row = table(**kwargs, **(defaults or {}))
+            session.add(row)
+    except IntegrityError:
+        row = query.first()
+        if row is None:
+            raise
+
+        return row, False
+
+    return row, True
+
+
+def migrate(engine):
+    """Migrate a database created by an earlier version of qrscp to the
+    current schema.
+
+    Earlier versions stored the attributes for all levels in a single
+    ``instance`` table, which is moved to ``instance_old`` and then copied
+    into the current Patient, Study, Series and Instance tables. If the copy
+    fails, ``instance_old`` is kept and the migration continues the next time
+    the database is opened.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine for the database.
+
+    Returns
+    -------
+    bool
+        ``True`` if the database was migrated, ``False`` otherwise.
+    """
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+
+    def columns(table):
+        return [col['name'] for col in inspector.get_columns(table)]
+
+    if 'instance' in tables and 'patient_id' in columns('instance'):
+        engine.execute('ALTER TABLE instance RENAME TO instance_old')
+        tables.append('instance_old')
+
+    if 'instance_old' not in tables:
+        return False
+
+    # The previous Patient, Study, Series and Image tables were never used
+    with engine.begin() as conn:
+        for table in ('image', 'patient', 'study', 'series'):
+            if table in tables and 'id' not in columns(table):
+                conn.execute(f'DROP TABLE {table}')
+
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        for row in session.execute('SELECT * FROM instance_old').fetchall():
+            _add_instance(dict(row), session)
+
+        session.execute('DROP TABLE instance_old')
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    return True
+
+
 def remove_instance(instance_uid, session):
     """Remove a SOP Instance from the database.
 
@@ -392,12 +594,31 @@ def remove_instance(instance_uid, session):
     session : sqlalchemy.orm.session.Session
         The session to use when querying the database for the instance.
     """
-    matches = session.query(Instance).filter(
+    instance = session.query(Instance).filter(
         Instance.sop_instance_uid == instance_uid
-    ).all()
-    if matches:
-        session.delete(matches[0])
-        session.commit()
+    ).first()
+    if not instance:
+        return
+
+    series = instance.series
+    study = series.study
+    patient = study.patient
+    session.delete(instance)
+
+    # Remove the Series, Study and Patient if they no longer have any children
+    parents = [
+        (Instance.series_key, series),
+        (Series.study_key, study),
+        (Study.patient_key, patient),
+    ]
+    for column, parent in parents:
+        session.flush()
+        if session.query(column).filter(column == parent.id).first():
+            break
+
+        session.delete(parent)
+
+    session.commit()
 
 
 def search(model, identifier, session):
@@ -421,8 +642,11 @@ def search(model, identifier, session):
 
     Returns
     -------
-    list of Instance
-        The matching database Instances.
+    sqlalchemy.orm.query.Query
+        The query for the matching database Instances. The matches are
+        fetched from the database as the query is iterated over, so
+        `session` must remain open until iteration is finished. The number
+        of matches can be found using ``Query.count()``.
 
     Raises
     ------
@@ -462,8 +686,9 @@ def _search_qr(model, identifier, session):
 
     Returns
     -------
-    list of db.Instance
-        The Instances that match the query.
+    sqlalchemy.orm.query.Query
+        The query for the Instances that match, which fetches them from the
+        database as it's iterated over.
     """
     # Will raise InvalidIdentifier if check failed
     _check_identifier(identifier, model)
@@ -486,7 +711,29 @@ def _search_qr(model, identifier, session):
         if level == identifier.QueryRetrieveLevel:
             break
 
-    return query.all()
+    return query.yield_per(_YIELD_PER)
+
+
+def _column(keyword):
+    """Return the table column for the element with `keyword`."""
+    return getattr(_TABLES[_ATTRIBUTES[keyword][0]], _TRANSLATION[keyword])
+
+
+def _query(session):
+    """Return a query for the Instances, joined to their Series, Study and
+    Patient.
+    """
+    return session.query(Instance).join(
+        Instance.series
+    ).join(
+        Series.study
+    ).join(
+        Study.patient
+    ).options(
+        contains_eager(Instance.series)
+        .contains_eager(Series.study)
+        .contains_eager(Study.patient)
+    )
 
 
 def _search_range(elem, session, query=None):
@@ -516,9 +763,9 @@ def _search_range(elem, session, query=None):
     #   date: 20060705-20060707 + time: 1000-1800 matches July 5, 10 am to
     #       July 7, 6 pm.
     start, end = elem.value.split('-')
-    attr = getattr(Instance, _TRANSLATION[elem.keyword])
+    attr = _column(elem.keyword)
     if not query:
-        query = session.query(Instance)
+        query = _query(session)
 
     if start and end:
         return query.filter(attr >= start, attr <= end)
@@ -557,14 +804,14 @@ def _search_single_value(elem, session, query=None):
     sqlalchemy.orm.query.Query
         The resulting query.
     """
-    attr = getattr(Instance, _TRANSLATION[elem.keyword])
+    attr = _column(elem.keyword)
     if elem.VR == 'PN':
         value = str(elem.value)
     else:
         value = elem.value
 
     if not query:
-        query = session.query(Instance)
+        query = _query(session)
 
     return query.filter(attr == value)
 
@@ -593,9 +840,9 @@ def _search_uid_list(elem, session, query=None):
     if not elem.value:
         return _search_universal(elem, session, query)
 
-    attr = getattr(Instance, _TRANSLATION[elem.keyword])
+    attr = _column(elem.keyword)
     if not query:
-        query = session.query(Instance)
+        query = _query(session)
 
     return query.filter(attr.in_(elem.value))
 
@@ -621,7 +868,7 @@ def _search_universal(elem, session, query=None):
     """
     # If the value is zero length then all entities shall match
     if not query:
-        query = session.query(Instance)
+        query = _query(session)
 
     return query
 
@@ -648,7 +895,7 @@ def _search_wildcard(elem, session, query=None):
     # Contains '*' or '?', case-sensitive if not PN
     #   '*' shall match any sequence of characters (incl. zero length)
     #   '?' shall match any single character
-    attr = getattr(Instance, _TRANSLATION[elem.keyword])
+    attr = _column(elem.keyword)
     if elem.VR == 'PN':
         value = str(elem.value)
     else:
@@ -661,7 +908,7 @@ def _search_wildcard(elem, session, query=None):
     value = value.replace('?', '_')
 
     if not query:
-        query = session.query(Instance)
+        query = _query(session)
 
     return query.filter(attr.like(value))
 
@@ -670,16 +917,32 @@ def _search_wildcard(elem, session, query=None):
 Base = declarative_base()
 
 
-class Image(Base):
-    __tablename__ = 'image'
-    # (0008,0018) SOP Instance UID | VR UI, VM 1, U
-    sop_instance_uid = Column(String(64), primary_key=True)
-    # (0020,0013) Instance Number | VR IS, VM 1, R
-    instance_number = Column(Integer)
+def _parent(level, attr):
+    """Return a read-only property for the `attr` attribute of the Instance's
+    parent at `level`.
+    """
+    path = {
+        'SERIES': ['series'],
+        'STUDY': ['series', 'study'],
+        'PATIENT': ['series', 'study', 'patient'],
+    }[level]
+
+    def fget(self):
+        obj = self
+        for name in path:
+            obj = getattr(obj, name)
+
+        return getattr(obj, attr)
+
+    return property(fget)
 
 
 class Instance(Base):
     __tablename__ = 'instance'
+    # (0008,0018) SOP Instance UID | VR UI, VM 1, U
+    sop_instance_uid = Column(String(64), primary_key=True)
+    # (0020,0013) Instance Number | VR IS, VM 1, R
+    instance_number = Column(String)
 
     # Absolute path to the stored SOP Instance
     filename = Column(String)
@@ -687,25 +950,22 @@ class Instance(Base):
     transfer_syntax_uid = Column(String(64))
     sop_class_uid = Column(String(64))
 
-    patient_id = Column(String, ForeignKey('patient.patient_id'))
-    patient_name = Column(String, ForeignKey('patient.patient_id'))
-
-    study_instance_uid = Column(String, ForeignKey('study.study_instance_uid'))
-    study_date = Column(String, ForeignKey('study.study_date'))
-    study_time = Column(String, ForeignKey('study.study_time'))
-    accession_number = Column(String, ForeignKey('study.accession_number'))
-    study_id = Column(String, ForeignKey('study.study_id'))
-
-    series_instance_uid = Column(
-        String, ForeignKey('series.series_instance_uid')
-    )
-    modality = Column(String, ForeignKey('series.modality'))
-    series_number = Column(String, ForeignKey('series.series_number'))
-
-    sop_instance_uid = Column(
-        String, ForeignKey('image.sop_instance_uid'), primary_key=True,
+    series_key = Column(
+        Integer, ForeignKey('series.id'), nullable=False, index=True
     )
-    instance_number = Column(String, ForeignKey('image.instance_number'))
+    series = relationship('Series', back_populates='instances')
+
+    # The attributes of the Instance's Patient, Study and Series
+    patient_id = _parent('PATIENT', 'patient_id')
+    patient_name = _parent('PATIENT', 'patient_name')
+    study_instance_uid = _parent('STUDY', 'study_instance_uid')
+    study_date = _parent('STUDY', 'study_date')
+    study_time = _parent('STUDY', 'study_time')
+    accession_number = _parent('STUDY', 'accession_number')
+    study_id = _parent('STUDY', 'study_id')
+    series_instance_uid = _parent('SERIES', 'series_instance_uid')
+    modality = _parent('SERIES', 'modality')
+    series_number = _parent('SERIES', 'series_number')
 
     def as_identifier(self, identifier, model):
         """Return an Identifier dataset matching the elements from a query.
@@ -771,31 +1031,61 @@ class Instance(Base):
 
 class Patient(Base):
     __tablename__ = 'patient'
+    id = Column(Integer, primary_key=True)
     # (0010,0020) Patient ID | VR LO, VM 1, U
-    patient_id = Column(String(16), primary_key=True)
+    patient_id = Column(String(64), index=True, unique=True)
     # (0010,0010) Patient's Name | VR PN, VM 1, R
-    patient_name = Column(String(64))
+    patient_name = Column(String(64), index=True)
+
+    studies = relationship('Study', back_populates='patient')
 
 
 class Series(Base):
     __tablename__ = 'series'
+    id = Column(Integer, primary_key=True)
     # (0020,000E) Series Instance UID | VR UI, VM 1, U
-    series_instance_uid = Column(String(64), primary_key=True)
+    series_instance_uid = Column(
+        String(64), nullable=False, index=True, unique=True
+    )
     # (0008,0060) Modality | VR CS, VM 1, R
-    modality = Column(String(16))
+    modality = Column(String(16), index=True)
     # (0020,0011) Series Number | VR IS, VM 1, R
-    series_number = Column(Integer)
+    series_number = Column(String)
+
+    study_key = Column(
+        Integer, ForeignKey('study.id'), nullable=False, index=True
+    )
+    study = relationship('Study', back_populates='series')
+    instances = relationship('Instance', back_populates='series')
 
 
 class Study(Base):
     __tablename__ = 'study'
+    id = Column(Integer, primary_key=True)
     # (0020,000D) Study Instance UID | VR UI, VM 1, U
-    study_instance_uid = Column(String(64), primary_key=True)
+    study_instance_uid = Column(
+        String(64), nullable=False, index=True, unique=True
+    )
     # (0008,0020) Study Date | VR DA, VM 1, R
-    study_date = Column(String(8))
+    study_date = Column(String(8), index=True)
     # (0008,0030) Study Time | VR TM, VM 1, R
     study_time = Column(String(14))
     # (0008,0050) Accession Number | VR SH, VM 1, R
-    accession_number = Column(String(16))
+    accession_number = Column(String(16), index=True)
     # (0020,0010) Study ID | VR SH, VM 1, R
     study_id = Column(String(16))
+
+    patient_key = Column(
+        Integer, ForeignKey('patient.id'), nullable=False, index=True
+    )
+    patient = relationship('Patient', back_populates='studies')
+    series = relationship('Series', back_populates='study')
+
+
+# The table used for the attributes at each query level
+_TABLES = {
+    'PATIENT': Patient,
+    'STUDY': Study,
+    'SERIES': Series,
+    'IMAGE': Instance,
+}
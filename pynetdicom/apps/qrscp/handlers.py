@@ -4,9 +4,7 @@ import os
 
 from pydicom import dcmread
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
+from pynetdicom import build_context
 from pynetdicom.apps.qrscp.db import (
     add_instance, search, InvalidIdentifier, Instance
 )
@@ -39,15 +37,15 @@ def handle_echo(event, cli_config, logger):
     return 0x0000
 
 
-def handle_find(event, db_path, cli_config, logger):
+def handle_find(event, session_factory, cli_config, logger):
     """Handler for evt.EVT_C_FIND.
 
     Parameters
     ----------
     event : pynetdicom.events.Event
         The C-FIND request :class:`~pynetdicom.events.Event`.
-    db_path : str
-        The database path to use with create_engine().
+    session_factory : sqlalchemy.orm.scoping.scoped_session
+        The factory for the thread-local database sessions.
     cli_config : dict
         A :class:`dict` containing configuration settings passed via CLI.
     logger : logging.Logger
@@ -68,13 +66,12 @@ def handle_find(event, db_path, cli_config, logger):
 
     model = event.request.AffectedSOPClassUID
 
-    engine = create_engine(db_path)
-    with engine.connect() as conn:
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        # Search database using Identifier as the query
+    session = session_factory()
+    try:
+        # Search database using Identifier as the query, the matches are
+        #   fetched from the database as they're iterated over
         try:
-            matches = search(model, event.identifier, session)
+            matches = iter(search(model, event.identifier, session))
         except InvalidIdentifier as exc:
             session.rollback()
             logger.error('Invalid C-FIND Identifier received')
@@ -87,35 +84,42 @@ def handle_find(event, db_path, cli_config, logger):
             logger.exception(exc)
             yield 0xC320, None
             return
-        finally:
-            session.close()
-
-    # Yield results
-    for match in matches:
-        if event.is_cancelled:
-            yield 0xFE00, None
-            return
 
+        # Yield results, the database may still raise while the remaining
+        #   matches are being fetched
         try:
-            response = match.as_identifier(event.identifier, model)
-            response.RetrieveAETitle = event.assoc.ae.ae_title
+            for match in matches:
+                if event.is_cancelled:
+                    yield 0xFE00, None
+                    return
+
+                try:
+                    response = match.as_identifier(event.identifier, model)
+                    response.RetrieveAETitle = event.assoc.ae.ae_title
+                except Exception as exc:
+                    logger.error("Error creating response Identifier")
+                    logger.exception(exc)
+                    yield 0xC322, None
+
+                yield 0xFF00, response
         except Exception as exc:
-            logger.error("Error creating response Identifier")
+            session.rollback()
+            logger.error('Exception occurred while querying database')
             logger.exception(exc)
-            yield 0xC322, None
-
-        yield 0xFF00, response
+            yield 0xC320, None
+    finally:
+        session_factory.remove()
 
 
-def handle_get(event, db_path, cli_config, logger):
+def handle_get(event, session_factory, cli_config, logger):
     """Handler for evt.EVT_C_GET.
 
     Parameters
     ----------
     event : pynetdicom.events.Event
         The C-GET request :class:`~pynetdicom.events.Event`.
-    db_path : str
-        The database path to use with create_engine().
+    session_factory : sqlalchemy.orm.scoping.scoped_session
+        The factory for the thread-local database sessions.
     cli_config : dict
         A :class:`dict` containing configuration settings passed via CLI.
     logger : logging.Logger
@@ -138,13 +142,13 @@ def handle_get(event, db_path, cli_config, logger):
 
     model = event.request.AffectedSOPClassUID
 
-    engine = create_engine(db_path)
-    with engine.connect() as conn:
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        # Search database using Identifier as the query
+    session = session_factory()
+    try:
+        # Search database using Identifier as the query, the matches are
+        #   fetched from the database as they're iterated over
         try:
             matches = search(model, event.identifier, session)
+            count = matches.count()
         except InvalidIdentifier as exc:
             session.rollback()
             logger.error('Invalid C-GET Identifier received')
@@ -157,29 +161,36 @@ def handle_get(event, db_path, cli_config, logger):
             logger.exception(exc)
             yield 0xC420, None
             return
-        finally:
-            session.close()
 
-    # Yield number of sub-operations
-    yield len(matches)
-
-    # Yield results
-    for match in matches:
-        if event.is_cancelled:
-            yield 0xFE00, None
-            return
+        # Yield number of sub-operations
+        yield count
 
+        # Yield results, the database may still raise while the remaining
+        #   matches are being fetched
         try:
-            ds = dcmread(match.filename)
+            for match in matches:
+                if event.is_cancelled:
+                    yield 0xFE00, None
+                    return
+
+                try:
+                    ds = dcmread(match.filename)
+                except Exception as exc:
+                    logger.error(f"Error reading file: {match.filename}")
+                    logger.exception(exc)
+                    yield 0xC421, None
+
+                yield 0xFF00, ds
         except Exception as exc:
-            logger.error(f"Error reading file: {match.filename}")
+            session.rollback()
+            logger.error('Exception occurred while querying database')
             logger.exception(exc)
-            yield 0xC421, None
-
-        yield 0xFF00, ds
+            yield 0xC420, None
+    finally:
+        session_factory.remove()
 
 
-def handle_move(event, destinations, db_path, cli_config, logger):
+def handle_move(event, destinations, session_factory, cli_config, logger):
     """Handler for evt.EVT_C_MOVE.
 
     Parameters
@@ -189,8 +200,8 @@ def handle_move(event, destinations, db_path, cli_config, logger):
     destinations : dict
         A :class:`dict` containing know move destinations as
         ``{b'AE_TITLE: (addr, port)}``
-    db_path : str
-        The database path to use with create_engine().
+    session_factory : sqlalchemy.orm.scoping.scoped_session
+        The factory for the thread-local database sessions.
     cli_config : dict
         A :class:`dict` containing configuration settings passed via CLI.
     logger : logging.Logger
@@ -223,13 +234,18 @@ def handle_move(event, destinations, db_path, cli_config, logger):
         return
 
     model = event.request.AffectedSOPClassUID
-    engine = create_engine(db_path)
-    with engine.connect() as conn:
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        # Search database using Identifier as the query
+    session = session_factory()
+    try:
+        # Search database using Identifier as the query, the matches are
+        #   fetched from the database as they're iterated over
         try:
             matches = search(model, event.identifier, session)
+            count = matches.count()
+            # The distinct (SOP Class UID, Transfer Syntax UID) pairs
+            #   needed to send the matches
+            pairs = matches.with_entities(
+                Instance.sop_class_uid, Instance.transfer_syntax_uid
+            ).distinct().all()
         except InvalidIdentifier as exc:
             session.rollback()
             logger.error('Invalid C-MOVE Identifier received')
@@ -242,36 +258,43 @@ def handle_move(event, destinations, db_path, cli_config, logger):
             logger.exception(exc)
             yield 0xC520, None
             return
-        finally:
-            session.close()
-
-    # Yield `Move Destination` IP and port, plus required contexts
-    # We should be able to reduce the number of contexts by using the
-    # implicit context conversion between:
-    #   implicit VR <-> explicit VR <-> deflated transfer syntaxes
-    contexts = list(set([ii.context for ii in matches]))
-    yield addr, port, {'contexts' : contexts[:128]}
-
-    # Yield number of sub-operations
-    yield len(matches)
-
-    # Yield results
-    for match in matches:
-        if event.is_cancelled:
-            yield 0xFE00, None
-            return
 
+        # Yield `Move Destination` IP and port, plus required contexts
+        # We should be able to reduce the number of contexts by using the
+        # implicit context conversion between:
+        #   implicit VR <-> explicit VR <-> deflated transfer syntaxes
+        contexts = [build_context(*pair) for pair in pairs]
+        yield addr, port, {'contexts' : contexts[:128]}
+
+        # Yield number of sub-operations
+        yield count
+
+        # Yield results, the database may still raise while the remaining
+        #   matches are being fetched
         try:
-            ds = dcmread(match.filename)
+            for match in matches:
+                if event.is_cancelled:
+                    yield 0xFE00, None
+                    return
+
+                try:
+                    ds = dcmread(match.filename)
+                except Exception as exc:
+                    logger.error(f"Error reading file: {match.filename}")
+                    logger.exception(exc)
+                    yield 0xC521, None
+
+                yield 0xFF00, ds
         except Exception as exc:
-            logger.error(f"Error reading file: {match.filename}")
+            session.rollback()
+            logger.error('Exception occurred while querying database')
             logger.exception(exc)
-            yield 0xC521, None
-
-        yield 0xFF00, ds
+            yield 0xC520, None
+    finally:
+        session_factory.remove()
 
 
-def handle_store(event, storage_dir, db_path, cli_config, logger):
+def handle_store(event, storage_dir, session_factory, cli_config, logger):
     """Handler for evt.EVT_C_STORE.
 
     Parameters
@@ -280,8 +303,8 @@ def handle_store(event, storage_dir, db_path, cli_config, logger):
         The C-STORE request :class:`~pynetdicom.events.Event`.
     storage_dir : str
         The path to the directory where instances will be stored.
-    db_path : str
-        The database path to use with create_engine().
+    session_factory : sqlalchemy.orm.scoping.scoped_session
+        The factory for the thread-local database sessions.
     cli_config : dict
         A :class:`dict` containing configuration settings passed via CLI.
     logger : logging.Logger
@@ -320,7 +343,6 @@ def handle_store(event, storage_dir, db_path, cli_config, logger):
     # Try and add the instance to the database
     #   If we fail then don't even try to store
     fpath = os.path.join(storage_dir, sop_instance)
-    db_dir = os.path.dirname(db_path)
 
     if os.path.exists(fpath):
         logger.warning(
@@ -338,26 +360,18 @@ def handle_store(event, storage_dir, db_path, cli_config, logger):
     logger.info("Instance written to storage directory")
 
     # Dataset successfully written, try to add to/update database
-    engine = create_engine(db_path)
-    with engine.connect() as conn:
-        Session = sessionmaker(bind=engine)
-        session = Session()
-
-        try:
-            # Path is relative to the database file
-            matches = session.query(Instance).filter(
-                Instance.sop_instance_uid == ds.SOPInstanceUID
-            ).all()
-            add_instance(ds, session, os.path.abspath(fpath))
-            if not matches:
-                logger.info("Instance added to database")
-            else:
-                logger.info("Database entry for instance updated")
-        except Exception as exc:
-            session.rollback()
-            logger.error('Unable to add instance to the database')
-            logger.exception(exc)
-        finally:
-            session.close()
+    session = session_factory()
+    try:
+        # Path is relative to the database file
+        if add_instance(ds, session, os.path.abspath(fpath)):
+            logger.info("Instance added to database")
+        else:
+            logger.info("Database entry for instance updated")
+    except Exception as exc:
+        session.rollback()
+        logger.error('Unable to add instance to the database')
+        logger.exception(exc)
+    finally:
+        session_factory.remove()
 
     return 0x0000
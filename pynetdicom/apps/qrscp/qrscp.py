@@ -9,6 +9,8 @@ import sys
 import pydicom.config
 from pydicom.dataset import Dataset
 
+from sqlalchemy.orm import scoped_session, sessionmaker
+
 from pynetdicom import (
     AE, evt, AllStoragePresentationContexts, ALL_TRANSFER_SYNTAXES
 )
@@ -70,6 +72,14 @@ def _log_config(config, logger):
     logger.debug(f"    ACSE: {acse}, DIMSE: {dimse}, Network: {network}")
     logger.debug(f"  Storage directory: {app['instance_location']}")
     logger.debug(f"  Database location: {app['database_location']}")
+    pool = app.get("database_pool_size", "5")
+    journal = app.get("database_journal_mode", "WAL")
+    sync = app.get("database_synchronous", "NORMAL")
+    cache = app.get("database_cache_size", "-16000")
+    logger.debug(f"    Connection pool size: {pool}")
+    logger.debug(
+        f"    Journal mode: {journal}, Synchronous: {sync}, Cache size: {cache}"
+    )
 
     if config.sections():
         logger.debug("  Move destinations: ")
@@ -196,14 +206,14 @@ def _setup_argparser():
     return parser.parse_args()
 
 
-def clean(db_path, logger):
+def clean(session_factory, logger):
     """Remove all entries from the database and delete the corresponding
     stored instances.
 
     Parameters
     ----------
-    db_path : str
-        The database path to use with create_engine().
+    session_factory : sqlalchemy.orm.scoping.scoped_session
+        The factory for the thread-local database sessions.
     logger : logging.Logger
         The application logger.
 
@@ -213,48 +223,44 @@ def clean(db_path, logger):
         ``True`` if the storage directory and database were both cleaned
         successfully, ``False`` otherwise.
     """
-    engine = create_engine(db_path)
-    with engine.connect() as conn:
-        Session = sessionmaker(bind=engine)
-        session = Session()
-
+    session = session_factory()
+    try:
+        fpaths = [ii.filename for ii in session.query(db.Instance).all()]
+    except Exception as exc:
+        logger.error("Exception raised while querying the database")
+        logger.exception(exc)
+        session.rollback()
+        session_factory.remove()
+        return False
+
+    storage_cleaned = True
+    for fpath in fpaths:
         try:
-            fpaths = [ii.filename for ii in session.query(Instance).all()]
+            # Instances are stored using their absolute path
+            os.remove(fpath)
         except Exception as exc:
-            logger.error("Exception raised while querying the database")
+            logger.error(f"Unable to delete the instance at '{fpath}'")
             logger.exception(exc)
-            session.rollback()
-        finally:
-            session.close()
-            return False
-
-        storage_cleaned = True
-        for fpath in fpaths:
-            try:
-                os.remove(os.path.join(config.INSTANCE_LOCATION, fpath))
-            except Exception as exc:
-                logger.error(f"Unable to delete the instance at '{fpath}'")
-                logger.exception(exc)
-                storage_cleaned = False
-
-        if storage_cleaned:
-            logger.info("Storage directory cleaned successfully")
-        else:
-            logger.error("Failed to clean storage directory")
+            storage_cleaned = False
 
-        database_cleaned = False
-        try:
-            clear(session)
-            database_cleaned = True
-            logger.info("Database cleaned successfully")
-        except Exception as exc:
-            logger.error("Failed to clean the database")
-            logger.exception(exc)
-            session.rollback()
-        finally:
-            session.close()
+    if storage_cleaned:
+        logger.info("Storage directory cleaned successfully")
+    else:
+        logger.error("Failed to clean storage directory")
 
-        return database_cleaned and storage_cleaned
+    database_cleaned = False
+    try:
+        db.clear(session)
+        database_cleaned = True
+        logger.info("Database cleaned successfully")
+    except Exception as exc:
+        logger.error("Failed to clean the database")
+        logger.exception(exc)
+        session.rollback()
+    finally:
+        session_factory.remove()
+
+    return database_cleaned and storage_cleaned
 
 
 def main(args=None):
@@ -315,7 +321,23 @@ def main(args=None):
 
     # The path to the database
     db_path = f"sqlite:///{db_path}"
-    db.create(db_path)
+    # Create the database engine, which is shared by all the associations
+    engine = db.create(
+        db_path,
+        pool_size=app_config.getint("database_pool_size", 5),
+        pragmas={
+            "journal_mode": app_config.get("database_journal_mode", "WAL"),
+            "synchronous": app_config.get("database_synchronous", "NORMAL"),
+            "cache_size": app_config.getint("database_cache_size", -16000),
+        }
+    )
+    # Each association's thread uses its own session
+    session_factory = scoped_session(sessionmaker(bind=engine))
+    # C-STORE sessions take the write lock when they begin, so concurrent
+    #   stores wait for each other rather than adding the same rows
+    store_factory = scoped_session(
+        sessionmaker(bind=engine.execution_options(sqlite_begin='IMMEDIATE'))
+    )
 
     # Clean up the database and storage directory
     if args.clean:
@@ -326,7 +348,7 @@ def main(args=None):
         if response != "yes":
             sys.exit()
 
-        if clean(db_path, APP_LOGGER):
+        if clean(session_factory, APP_LOGGER):
             sys.exit()
         else:
             sys.exit(1)
@@ -362,13 +384,17 @@ def main(args=None):
     # Set our handler bindings
     handlers = [
         (evt.EVT_C_ECHO, handle_echo, [args, APP_LOGGER]),
-        (evt.EVT_C_FIND, handle_find, [db_path, args, APP_LOGGER]),
-        (evt.EVT_C_GET, handle_get, [db_path, args, APP_LOGGER]),
-        (evt.EVT_C_MOVE, handle_move, [dests, db_path, args, APP_LOGGER]),
+        (evt.EVT_C_FIND, handle_find, [session_factory, args, APP_LOGGER]),
+        (evt.EVT_C_GET, handle_get, [session_factory, args, APP_LOGGER]),
+        (
+            evt.EVT_C_MOVE,
+            handle_move,
+            [dests, session_factory, args, APP_LOGGER]
+        ),
         (
             evt.EVT_C_STORE,
             handle_store,
-            [instance_dir, db_path, args, APP_LOGGER]
+            [instance_dir, store_factory, args, APP_LOGGER]
         ),
     ]
 
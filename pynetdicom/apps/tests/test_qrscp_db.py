@@ -2,12 +2,14 @@
 
 import os
 import tempfile
+import threading
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.schema import MetaData
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Query, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from pydicom import dcmread
 import pydicom.config
@@ -123,7 +125,6 @@ class TestConnect(object):
         assert 'patient' in meta.tables
         assert 'study' in meta.tables
         assert 'series' in meta.tables
-        assert 'image' in meta.tables
         assert 'instance' in meta.tables
 
     def test_create_new_existing(self):
@@ -139,9 +140,205 @@ class TestConnect(object):
         assert 'patient' in meta.tables
         assert 'study' in meta.tables
         assert 'series' in meta.tables
-        assert 'image' in meta.tables
         assert 'instance' in meta.tables
 
+    def test_create_pool(self):
+        """Test creating the database with a connection pool."""
+        db_file = tempfile.NamedTemporaryFile()
+        db_location = 'sqlite:///{}'.format(db_file.name)
+        engine = db.create(db_location, pool_size=3)
+        assert isinstance(engine.pool, QueuePool)
+        assert 3 == engine.pool.size()
+
+        # Pooled connections are reused
+        with engine.connect() as conn:
+            dbapi_conn = conn.connection.connection
+
+        with engine.connect() as conn:
+            assert dbapi_conn is conn.connection.connection
+
+    def test_create_pragmas(self):
+        """Test the pragmas are set for each connection."""
+        db_file = tempfile.NamedTemporaryFile()
+        db_location = 'sqlite:///{}'.format(db_file.name)
+        pragmas = {
+            'journal_mode': 'WAL', 'synchronous': 'OFF', 'cache_size': -1000
+        }
+        engine = db.create(db_location, pool_size=2, pragmas=pragmas)
+        connections = [engine.connect() for ii in range(2)]
+        for conn in connections:
+            assert 'wal' == conn.execute('PRAGMA journal_mode').scalar()
+            assert 0 == conn.execute('PRAGMA synchronous').scalar()
+            assert -1000 == conn.execute('PRAGMA cache_size').scalar()
+            conn.close()
+
+        # Scoped sessions use the pooled connections
+        Session = scoped_session(sessionmaker(bind=engine))
+        session = Session()
+        assert session is Session()
+        assert 0 == session.execute('PRAGMA synchronous').scalar()
+        Session.remove()
+
+
+    def test_indexes(self):
+        """Test the matching keys are indexed."""
+        engine = db.create('sqlite:///:memory:')
+        inspector = inspect(engine)
+        indexed = {
+            (table, column)
+            for table in inspector.get_table_names()
+            for index in inspector.get_indexes(table)
+            for column in index['column_names']
+        }
+        assert ('patient', 'patient_id') in indexed
+        assert ('patient', 'patient_name') in indexed
+        assert ('study', 'study_instance_uid') in indexed
+        assert ('study', 'study_date') in indexed
+        assert ('study', 'accession_number') in indexed
+        assert ('study', 'patient_key') in indexed
+        assert ('series', 'series_instance_uid') in indexed
+        assert ('series', 'modality') in indexed
+        assert ('series', 'study_key') in indexed
+        assert ('instance', 'series_key') in indexed
+
+    def test_unique(self):
+        """Test the unique keys are unique."""
+        engine = db.create('sqlite:///:memory:')
+        inspector = inspect(engine)
+        unique = {
+            (table, column)
+            for table in inspector.get_table_names()
+            for index in inspector.get_indexes(table) if index['unique']
+            for column in index['column_names']
+        }
+        assert ('patient', 'patient_id') in unique
+        assert ('study', 'study_instance_uid') in unique
+        assert ('series', 'series_instance_uid') in unique
+
+    def test_begin_immediate(self):
+        """Test using BEGIN IMMEDIATE with the sqlite_begin option."""
+        db_file = tempfile.NamedTemporaryFile()
+        db_location = 'sqlite:///{}'.format(db_file.name)
+        engine = db.create(db_location)
+        immediate = engine.execution_options(sqlite_begin='IMMEDIATE')
+
+        # The write lock is taken before the first statement
+        session = sessionmaker(bind=immediate)()
+        session.query(db.Patient).all()
+        with engine.connect() as conn:
+            conn.execute('PRAGMA busy_timeout = 0')
+            with pytest.raises(OperationalError, match='database is locked'):
+                conn.execute('BEGIN IMMEDIATE')
+
+        session.rollback()
+
+
+# The tables used by the previous schema
+OLD_SCHEMA = [
+    (
+        "CREATE TABLE patient (patient_id VARCHAR(16) NOT NULL, "
+        "patient_name VARCHAR(64), PRIMARY KEY (patient_id))"
+    ),
+    (
+        "CREATE TABLE study (study_instance_uid VARCHAR(64) NOT NULL, "
+        "study_date VARCHAR(8), study_time VARCHAR(14), "
+        "accession_number VARCHAR(16), study_id VARCHAR(16), "
+        "PRIMARY KEY (study_instance_uid))"
+    ),
+    (
+        "CREATE TABLE series (series_instance_uid VARCHAR(64) NOT NULL, "
+        "modality VARCHAR(16), series_number INTEGER, "
+        "PRIMARY KEY (series_instance_uid))"
+    ),
+    (
+        "CREATE TABLE image (sop_instance_uid VARCHAR(64) NOT NULL, "
+        "instance_number INTEGER, PRIMARY KEY (sop_instance_uid))"
+    ),
+    (
+        "CREATE TABLE instance (filename VARCHAR, "
+        "transfer_syntax_uid VARCHAR(64), sop_class_uid VARCHAR(64), "
+        "patient_id VARCHAR, patient_name VARCHAR, "
+        "study_instance_uid VARCHAR, study_date VARCHAR, study_time VARCHAR, "
+        "accession_number VARCHAR, study_id VARCHAR, "
+        "series_instance_uid VARCHAR, modality VARCHAR, "
+        "series_number VARCHAR, sop_instance_uid VARCHAR NOT NULL, "
+        "instance_number VARCHAR, PRIMARY KEY (sop_instance_uid))"
+    ),
+]
+
+
+class TestMigrate(object):
+    """Tests for db.migrate()."""
+    def setup(self):
+        """Run prior to each test"""
+        pydicom.config.use_none_as_empty_text_VR_value = True
+        # A database using the previous, single table, schema
+        self.tfile = tempfile.NamedTemporaryFile()
+        self.db_location = 'sqlite:///{}'.format(self.tfile.name)
+        engine = create_engine(self.db_location)
+        for statement in OLD_SCHEMA:
+            engine.execute(statement)
+
+        self.rows = []
+        for fname, values in DATASETS.items():
+            row = dict(values)
+            row['filename'] = os.path.join(DATA_DIR, fname)
+            self.rows.append(row)
+            columns = ', '.join(row.keys())
+            params = ', '.join(f':{kk}' for kk in row.keys())
+            engine.execute(
+                text(f"INSERT INTO instance ({columns}) VALUES ({params})"),
+                **row
+            )
+
+    def test_migrate(self):
+        """Test migrating a database using the previous schema."""
+        engine = create_engine(self.db_location)
+        assert db.migrate(engine)
+        assert not db.migrate(engine)
+
+        tables = inspect(engine).get_table_names()
+        assert 'instance_old' not in tables
+        assert 'image' not in tables
+        session = sessionmaker(bind=engine)()
+        assert 5 == session.query(db.Instance).count()
+        assert 4 == session.query(db.Patient).count()
+        assert 4 == session.query(db.Study).count()
+        assert 4 == session.query(db.Series).count()
+
+        for row in self.rows:
+            instance = session.query(db.Instance).filter(
+                db.Instance.sop_instance_uid == row['sop_instance_uid']
+            ).one()
+            for kk, vv in row.items():
+                assert vv == getattr(instance, kk)
+
+    def test_create(self):
+        """Test create() migrates the database."""
+        engine = db.create(self.db_location)
+        session = sessionmaker(bind=engine)()
+        assert 5 == session.query(db.Instance).count()
+
+        identifier = Dataset()
+        identifier.QueryRetrieveLevel = 'PATIENT'
+        identifier.PatientID = '4MR1'
+        model = PatientRootQueryRetrieveInformationModelFind
+        assert 2 == len(list(db.search(model, identifier, session)))
+
+    def test_resume(self):
+        """Test a partially migrated database is completed."""
+        engine = create_engine(self.db_location)
+        engine.execute('ALTER TABLE instance RENAME TO instance_old')
+        assert db.migrate(engine)
+
+        session = sessionmaker(bind=engine)()
+        assert 5 == session.query(db.Instance).count()
+
+    def test_current(self):
+        """Test a database using the current schema isn't changed."""
+        engine = db.create('sqlite:///:memory:')
+        assert not db.migrate(engine)
+
 
 class TestAddInstance(object):
     """Tests for db.add_instance()."""
@@ -181,8 +378,9 @@ class TestAddInstance(object):
 
         obj = self.session.query(db.Instance).all()
         assert 5 == len(obj)
-        obj = self.session.query(db.Instance, db.Instance.patient_name).all()
-        names = [val[1] for val in obj]
+        obj = self.session.query(db.Patient.patient_name).all()
+        assert 4 == len(obj)
+        names = [val[0] for val in obj]
         assert 'CompressedSamples^CT1' in names
         assert 'CompressedSamples^MR1' in names
         assert 'ANON^A^B^C^D' in names
@@ -259,6 +457,25 @@ class TestAddInstance(object):
 
         assert not self.session.query(db.Instance).all()
 
+    def test_hierarchy(self):
+        """Test instances are added to their Patient, Study and Series."""
+        for fname in DATASETS:
+            fpath = os.path.join(DATA_DIR, fname)
+            ds = dcmread(fpath)
+            db.add_instance(ds, self.session)
+
+        assert 4 == self.session.query(db.Patient).count()
+        assert 4 == self.session.query(db.Study).count()
+        assert 4 == self.session.query(db.Series).count()
+
+        # The MR instances are in the same Series
+        series = self.session.query(db.Series).filter(
+            db.Series.modality == 'MR'
+        ).one()
+        assert 2 == len(series.instances)
+        assert '4MR1' == series.study.patient.patient_id
+        assert [series.study] == series.study.patient.studies
+
     def test_instance_exists(self):
         """Test that adding already existing instance updates it."""
         db.add_instance(self.minimal, self.session)
@@ -274,6 +491,102 @@ class TestAddInstance(object):
         assert 1 == len(result)
         assert 'CT' == result[0].modality
 
+    def test_added(self):
+        """Test the return value indicates if the instance was added."""
+        assert db.add_instance(self.minimal, self.session)
+        assert not db.add_instance(self.minimal, self.session)
+        self.minimal.SOPInstanceUID = '1.2.3.5'
+        assert db.add_instance(self.minimal, self.session)
+
+    def test_added_concurrently(self, monkeypatch):
+        """Test a row added by another session after the query is used."""
+        db.add_instance(self.minimal, self.session)
+        patient = self.session.query(db.Patient).one()
+
+        # Make it look like the Patient was added after the query
+        monkeypatch.setattr(Query, 'first', lambda self: None, raising=True)
+        with pytest.raises(IntegrityError):
+            db._get_or_add(self.session, db.Patient, patient_id='1234')
+
+        monkeypatch.undo()
+        self.session.rollback()
+
+        first = Query.first
+        calls = []
+
+        def miss_once(query):
+            calls.append(query)
+            return None if len(calls) == 1 else first(query)
+
+        monkeypatch.setattr(Query, 'first', miss_once)
+        row, added = db._get_or_add(self.session, db.Patient, patient_id='1234')
+        assert row is patient
+        assert not added
+        assert 2 == len(calls)
+        self.session.commit()
+        assert 1 == self.session.query(db.Patient).count()
+
+
+class TestConcurrentAddInstance(object):
+    """Tests for db.add_instance() with concurrent sessions."""
+    def setup(self):
+        """Run prior to each test"""
+        pydicom.config.use_none_as_empty_text_VR_value = True
+        self.db_file = tempfile.NamedTemporaryFile()
+        self.engine = db.create(
+            'sqlite:///{}'.format(self.db_file.name),
+            pool_size=8,
+            pragmas={'journal_mode': 'WAL'}
+        )
+
+    def teardown(self):
+        """Clear the database after each test"""
+        self.engine.dispose()
+        self.db_file.close()
+
+    def test_new_study(self):
+        """Test storing instances in the same new study at once."""
+        Session = scoped_session(sessionmaker(
+            bind=self.engine.execution_options(sqlite_begin='IMMEDIATE')
+        ))
+        nr_threads = 8
+        barrier = threading.Barrier(nr_threads)
+        errors = []
+
+        def store(ii):
+            ds = Dataset()
+            ds.PatientID = '1234'
+            ds.StudyInstanceUID = '1.2'
+            ds.SeriesInstanceUID = '1.2.3'
+            ds.SOPInstanceUID = f'1.2.3.{ii}'
+            session = Session()
+            try:
+                barrier.wait()
+                db.add_instance(ds, session)
+            except Exception as exc:
+                session.rollback()
+                errors.append(exc)
+            finally:
+                Session.remove()
+
+        threads = [
+            threading.Thread(target=store, args=(ii,))
+            for ii in range(nr_threads)
+        ]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert [] == errors
+        session = Session()
+        assert 1 == session.query(db.Patient).count()
+        assert 1 == session.query(db.Study).count()
+        assert 1 == session.query(db.Series).count()
+        assert nr_threads == session.query(db.Instance).count()
+        Session.remove()
+
 
 class TestRemoveInstance(object):
     """Tests for db.remove_instance()."""
@@ -306,7 +619,27 @@ class TestRemoveInstance(object):
         assert not self.session.query(db.Patient).all()
         assert not self.session.query(db.Study).all()
         assert not self.session.query(db.Series).all()
-        assert not self.session.query(db.Image).all()
+
+    def test_remove_shared_parents(self):
+        """Test removing keeps the parents used by other instances."""
+        ds = self.minimal[:]
+        ds.SOPInstanceUID = '1.2.3.5'
+        db.add_instance(ds, self.session)
+        ds = self.minimal[:]
+        ds.SeriesInstanceUID = '1.2.4'
+        ds.SOPInstanceUID = '1.2.4.1'
+        db.add_instance(ds, self.session)
+        assert 2 == self.session.query(db.Series).count()
+
+        db.remove_instance('1.2.3.4', self.session)
+        assert 2 == self.session.query(db.Instance).count()
+        assert 2 == self.session.query(db.Series).count()
+
+        db.remove_instance('1.2.4.1', self.session)
+        assert 1 == self.session.query(db.Instance).count()
+        assert 1 == self.session.query(db.Series).count()
+        assert 1 == self.session.query(db.Study).count()
+        assert 1 == self.session.query(db.Patient).count()
 
     def test_remove_not_existing(self):
         """Test removing if doesn't exist in database."""
@@ -340,6 +673,9 @@ class TestClear(object):
 
         db.clear(self.session)
         assert not self.session.query(db.Instance).all()
+        assert not self.session.query(db.Series).all()
+        assert not self.session.query(db.Study).all()
+        assert not self.session.query(db.Patient).all()
 
 
 class TestSearch(object):
@@ -667,7 +1003,24 @@ class TestSearchFind(object):
         model = PatientRootQueryRetrieveInformationModelFind
 
         result = db._search_qr(model, query, self.session)
-        assert 3 == len(result)
+        assert 3 == len(list(result))
+
+    def test_results_streamed(self):
+        """Test the matches are fetched as the results are iterated over."""
+        query = Dataset()
+        query.QueryRetrieveLevel = 'PATIENT'
+        query.PatientID = None
+        query.PatientName = 'CompressedSamples^??1'
+
+        model = PatientRootQueryRetrieveInformationModelFind
+
+        result = db._search_qr(model, query, self.session)
+        assert isinstance(result, Query)
+        assert db._YIELD_PER == result._yield_per
+        assert 3 == result.count()
+        matches = list(result)
+        assert 3 == len(matches)
+        assert all(isinstance(ii, db.Instance) for ii in matches)
 
     def test_check_identifier_patient(self):
         """Tests for check_find_identifier()."""
@@ -0,0 +1,147 @@
+"""Unit tests for the QRSCP app's event handlers."""
+
+from datetime import datetime
+import logging
+import os
+from types import SimpleNamespace
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from pydicom import dcmread
+import pydicom.config
+from pydicom.dataset import Dataset
+
+from pynetdicom.sop_class import (
+    PatientRootQueryRetrieveInformationModelFind,
+    PatientRootQueryRetrieveInformationModelGet,
+    PatientRootQueryRetrieveInformationModelMove,
+)
+
+from pynetdicom.apps.qrscp import db, handlers
+
+
+TEST_DIR = os.path.dirname(__file__)
+DATA_DIR = os.path.join(TEST_DIR, '../', '../', 'tests', 'dicom_files')
+DATASETS = ['CTImageStorage.dcm', 'RTImageStorage.dcm']
+
+
+class BrokenQuery(object):
+    """A query that raises while fetching its second match."""
+    def __init__(self, query):
+        self.query = query
+
+    def __getattr__(self, name):
+        return getattr(self.query, name)
+
+    def __iter__(self):
+        for ii, match in enumerate(self.query):
+            if ii == 1:
+                raise OperationalError(
+                    'SELECT', {}, Exception('disk I/O error')
+                )
+
+            yield match
+
+
+class TestHandlersFetchError(object):
+    """Tests for the handlers when fetching the matches fails."""
+    def setup(self):
+        """Run prior to each test"""
+        pydicom.config.use_none_as_empty_text_VR_value = True
+        engine = db.create('sqlite:///:memory:')
+        self.session_factory = scoped_session(sessionmaker(bind=engine))
+        session = self.session_factory()
+        self.uids = []
+        for fname in DATASETS:
+            fpath = os.path.join(DATA_DIR, fname)
+            ds = dcmread(fpath)
+            ds.PatientID = '1234'
+            db.add_instance(ds, session, fpath)
+            self.uids.append(ds.SOPInstanceUID)
+
+        self.session_factory.remove()
+        self.logger = logging.getLogger('pynetdicom.tests.qrscp')
+
+    def teardown(self):
+        """Run after each test"""
+        self.session_factory.remove()
+
+    def event(self, model):
+        """Return a C-FIND, C-GET or C-MOVE event for all the instances."""
+        identifier = Dataset()
+        identifier.QueryRetrieveLevel = 'IMAGE'
+        identifier.PatientID = '1234'
+        identifier.StudyInstanceUID = None
+        identifier.SeriesInstanceUID = None
+        identifier.SOPInstanceUID = None
+
+        requestor = SimpleNamespace(address='localhost', port=11113)
+        return SimpleNamespace(
+            assoc=SimpleNamespace(
+                requestor=requestor, ae=SimpleNamespace(ae_title=b'QRSCP')
+            ),
+            timestamp=datetime.now(),
+            request=SimpleNamespace(AffectedSOPClassUID=model),
+            identifier=identifier,
+            is_cancelled=False,
+            move_destination=b'STORESCP',
+        )
+
+    def search(self, monkeypatch):
+        """Make the handlers search using a BrokenQuery."""
+        def search(model, identifier, session):
+            return BrokenQuery(db.search(model, identifier, session))
+
+        monkeypatch.setattr(handlers, 'search', search)
+
+    def test_find(self, monkeypatch, caplog):
+        """Test handle_find() when fetching the matches raises."""
+        self.search(monkeypatch)
+        event = self.event(PatientRootQueryRetrieveInformationModelFind)
+        with caplog.at_level(logging.ERROR, logger=self.logger.name):
+            results = list(handlers.handle_find(
+                event, self.session_factory, {}, self.logger
+            ))
+
+        assert 2 == len(results)
+        assert 0xFF00 == results[0][0]
+        assert '1234' == results[0][1].PatientID
+        assert (0xC320, None) == results[1]
+        assert 'Exception occurred while querying database' in caplog.text
+        assert 'disk I/O error' in caplog.text
+
+    def test_get(self, monkeypatch, caplog):
+        """Test handle_get() when fetching the matches raises."""
+        self.search(monkeypatch)
+        event = self.event(PatientRootQueryRetrieveInformationModelGet)
+        with caplog.at_level(logging.ERROR, logger=self.logger.name):
+            results = list(handlers.handle_get(
+                event, self.session_factory, {}, self.logger
+            ))
+
+        assert 3 == len(results)
+        assert 2 == results[0]
+        assert 0xFF00 == results[1][0]
+        assert results[1][1].SOPInstanceUID in self.uids
+        assert (0xC420, None) == results[2]
+        assert 'Exception occurred while querying database' in caplog.text
+
+    def test_move(self, monkeypatch, caplog):
+        """Test handle_move() when fetching the matches raises."""
+        self.search(monkeypatch)
+        event = self.event(PatientRootQueryRetrieveInformationModelMove)
+        destinations = {b'STORESCP': ('localhost', 11113)}
+        with caplog.at_level(logging.ERROR, logger=self.logger.name):
+            results = list(handlers.handle_move(
+                event, destinations, self.session_factory, {}, self.logger
+            ))
+
+        assert 4 == len(results)
+        assert ('localhost', 11113) == results[0][:2]
+        assert 2 == len(results[0][2]['contexts'])
+        assert 2 == results[1]
+        assert 0xFF00 == results[2][0]
+        assert results[2][1].SOPInstanceUID in self.uids
+        assert (0xC520, None) == results[3]
+        assert 'Exception occurred while querying database' in caplog.text
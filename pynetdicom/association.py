@@ -1,17 +1,24 @@
 """
 Defines the Association class which handles associating with peers.
 """
+from copy import deepcopy
 from io import BytesIO
 import logging
 import os
 from pathlib import Path
+import queue
 import threading
 import time
 from typing import Union, Optional
 
 from pydicom import dcmread
+from pydicom.datadict import tag_for_keyword
 from pydicom.dataset import Dataset
-from pydicom.uid import UID
+from pydicom.tag import Tag
+from pydicom.uid import (
+    UID, ImplicitVRLittleEndian, ExplicitVRLittleEndian,
+    DeflatedExplicitVRLittleEndian
+)
 
 # pylint: disable=no-name-in-module
 from pynetdicom.acse import ACSE
@@ -21,7 +28,10 @@ from pynetdicom.dimse_primitives import (
     C_ECHO, C_MOVE, C_STORE, C_GET, C_FIND, C_CANCEL,
     N_EVENT_REPORT, N_GET, N_SET, N_CREATE, N_ACTION, N_DELETE
 )
-from pynetdicom.dsutils import decode, encode, pretty_dataset, split_dataset
+from pynetdicom.dsutils import (
+    decode, encode, pretty_dataset, split_dataset, EncodedDataset,
+    _convert, _deflate, _encode_dataset, _read_chunks, _read_first
+)
 from pynetdicom.dul import DULServiceProvider
 from pynetdicom._globals import (
     MODE_REQUESTOR, MODE_ACCEPTOR, DEFAULT_MAX_LENGTH, STATUS_WARNING,
@@ -54,6 +64,97 @@ from pynetdicom.status import code_to_category, STORAGE_SERVICE_CLASS_STATUS
 # pylint: enable=no-name-in-module
 LOGGER = logging.getLogger('pynetdicom.assoc')
 
+# Transfer syntaxes an encoded dataset can be converted between while sending
+_STREAM_CONVERTIBLE = {
+    ImplicitVRLittleEndian,
+    ExplicitVRLittleEndian,
+    DeflatedExplicitVRLittleEndian,
+}
+
+
+class _Prefetcher(object):
+    """Iterate over the responses from a generator in a separate thread.
+
+    .. versionadded:: 2.0
+
+    Up to `depth` items are fetched from the generator in advance of the
+    caller, so that receiving and decoding the responses from the peer
+    overlaps with the caller processing the earlier ones.
+
+    If the caller stops iterating early then `halt` is set and the rest of
+    the generator's items are discarded, and closing the iterator waits until
+    the generator has finished so no later messages on the association are
+    consumed.
+    """
+    def __init__(self, responses, depth, halt):
+        """Create a new prefetcher.
+
+        Parameters
+        ----------
+        responses : generator
+            The generator yielding the responses.
+        depth : int
+            The maximum number of items to fetch in advance.
+        halt : threading.Event
+            Set when the caller stops iterating, the generator should then
+            finish as soon as it can.
+        """
+        self._responses = responses
+        self._queue = queue.Queue(maxsize=depth)
+        self._halt = halt
+        self._thread = threading.Thread(
+            target=self._run, name="Prefetcher", daemon=True
+        )
+
+    def start(self):
+        """Start fetching items and return a generator that yields them."""
+        self._thread.start()
+        return self._iter()
+
+    def _iter(self):
+        """Yield the fetched items."""
+        try:
+            while True:
+                item, exc = self._queue.get()
+                if exc is not None:
+                    raise exc
+
+                if item is None:
+                    return
+
+                yield item
+        finally:
+            self._halt.set()
+            # Wait for the generator to finish with the association
+            self._thread.join()
+
+    def _put(self, item):
+        """Add `item` to the queue, return ``False`` if the prefetcher has
+        been stopped instead.
+        """
+        while not self._halt.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _run(self):
+        """Fetch the items."""
+        # pylint: disable=broad-except
+        try:
+            for item in self._responses:
+                # If halted then discard the item and continue on until
+                #   the generator is done
+                self._put((item, None))
+        except Exception as exc:
+            self._put((None, exc))
+            return
+
+        self._put((None, None))
+
 
 class Association(threading.Thread):
     """Manage an Association with a peer AE.
@@ -122,6 +223,9 @@ class Association(threading.Thread):
         # Accepted and rejected presentation contexts
         self._accepted_cx = {}
         self._rejected_cx = []
+        # The accepted contexts that _get_valid_context() has matched, as
+        #   (accepted contexts, {(parameters) : context})
+        self._valid_cx = (self._accepted_cx, {})
 
         # Service providers
         self.acse = ACSE(self)
@@ -135,6 +239,9 @@ class Association(threading.Thread):
 
         # Event handlers
         self._handlers = {}
+        # The notification events with bound handlers, used to skip
+        #   triggering the per-PDU and per-transition events
+        self._bound_events = frozenset()
         self._bind_defaults()
 
         # Kills the thread loop in run()
@@ -229,6 +336,8 @@ class Association(threading.Thread):
                 if (handler, args) not in self._handlers[event]:
                     self._handlers[event].append((handler, args))
 
+                self._update_bound_events()
+
             # Intervention events - only one handler allowed
             if event.is_intervention:
                 self._handlers[event] = (handler, args)
@@ -284,6 +393,56 @@ class Association(threading.Thread):
 
         return status
 
+    @staticmethod
+    def _decode_response_identifier(rsp, transfer_syntax, specific_tags=None):
+        """Return the decoded *Identifier* of a C-FIND, C-GET or C-MOVE
+        response.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        rsp : dimse_primitives.C_FIND or C_GET or C_MOVE
+            The response primitive received from the peer.
+        transfer_syntax : pydicom.uid.UID
+            The transfer syntax of the accepted presentation context.
+        specific_tags : list of pydicom.tag.BaseTag, optional
+            If used then only decode the top-level elements with the given
+            tags.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset or None
+            The decoded *Identifier*, or ``None`` if it could not be decoded.
+        """
+        # pylint: disable=broad-except
+        try:
+            identifier = decode(
+                rsp.Identifier,
+                transfer_syntax.is_implicit_VR,
+                transfer_syntax.is_little_endian,
+                transfer_syntax.is_deflated,
+                specific_tags
+            )
+        except Exception as exc:
+            LOGGER.error("Failed to decode the received Identifier dataset")
+            LOGGER.exception(exc)
+            return None
+
+        # Only format the dataset if it's going to be logged
+        if (
+            identifier
+            and _config.LOG_RESPONSE_IDENTIFIERS
+            and LOGGER.isEnabledFor(logging.INFO)
+        ):
+            LOGGER.info('')
+            LOGGER.info('# Response Identifier')
+            for line in pretty_dataset(identifier):
+                LOGGER.info(line)
+            LOGGER.info('')
+
+        return identifier
+
     @property
     def dimse_timeout(self):
         """The DIMSE timeout (in seconds)."""
@@ -370,12 +529,68 @@ class Association(threading.Thread):
         allow_conversion : bool, optional
             If ``True`` (default), then if there's no exact matching accepted
             presentation context then use a convertible one instead. If
-            ``False`` then an exact matching context is required.
+            ``False`` then an exact matching context is required, except that
+            *Implicit VR Little Endian*, *Explicit VR Little Endian* and
+            *Deflated Explicit VR Little Endian* may be used in place of each
+            other as they can be converted while the encoded dataset is being
+            sent.
+
+        Returns
+        -------
+        presentation.PresentationContext
+            An accepted presentation context.
+        """
+        # Matches are cached for the current accepted contexts, so sending
+        #   many messages over the same association only searches once
+        accepted, matches = self._valid_cx
+        if accepted is not self._accepted_cx:
+            accepted = self._accepted_cx
+            matches = {}
+            self._valid_cx = (accepted, matches)
+
+        if context_id not in accepted:
+            context_id = None
+
+        key = (ab_syntax, tr_syntax, role, context_id, allow_conversion)
+        try:
+            return matches[key]
+        except KeyError:
+            pass
+
+        cx = self._find_valid_context(
+            ab_syntax, tr_syntax, role, context_id, allow_conversion
+        )
+        # Don't cache UPS Push matches to other UPS SOP Classes so that the
+        #   fallback continues to be logged
+        if cx.abstract_syntax == ab_syntax:
+            matches[key] = cx
+
+        return cx
+
+    def _find_valid_context(
+        self,
+        ab_syntax: UID,
+        tr_syntax: UID,
+        role: Optional[str],
+        context_id: Optional[int],
+        allow_conversion: bool
+    ) -> PresentationContext:
+        """Search the accepted contexts for one matching the parameters.
+
+        .. versionadded:: 2.0
+
+        See :meth:`~pynetdicom.association.Association._get_valid_context`
+        for the parameters.
 
         Returns
         -------
         presentation.PresentationContext
             An accepted presentation context.
+
+        Raises
+        ------
+        ValueError
+            If no matching accepted context was found.
         """
         ab_syntax = UID(ab_syntax)
         tr_syntax = UID(tr_syntax)
@@ -424,6 +639,7 @@ class Association(threading.Thread):
             ]
 
         matches = []
+        stream_matches = []
         for cx in possible_contexts:
             cx_syntax = cx.transfer_syntax[0]
             if tr_syntax:
@@ -431,6 +647,10 @@ class Association(threading.Thread):
                     # Exact match to transfer syntax
                     return cx
 
+                # Encoded datasets can be converted while being sent
+                if {tr_syntax, cx_syntax} <= _STREAM_CONVERTIBLE:
+                    stream_matches.append(cx)
+
                 # Compressed transfer syntaxes are not convertible
                 #   This excludes deflated transfer syntaxes
                 if tr_syntax.is_compressed or cx_syntax.is_compressed:
@@ -449,6 +669,9 @@ class Association(threading.Thread):
         if allow_conversion and matches:
             return matches[0]
 
+        if stream_matches:
+            return stream_matches[0]
+
         role = role or 'scu'
         msg = (
             f"No presentation context for '{ab_syntax.name}' has been "
@@ -758,10 +981,24 @@ class Association(threading.Thread):
                 if not self._handlers[event]:
                     del self._handlers[event]
 
+                self._update_bound_events()
+
             # Intervention events - unbind and replace with default
             if event.is_intervention and handler in self._handlers[event]:
                 self._handlers[event] = (evt.get_default_handler(event), None)
 
+    def _update_bound_events(self):
+        """Update the notification events that have bound handlers.
+
+        .. versionadded:: 2.0
+
+        Must be called with :attr:`lock` held after changing the bound
+        notification handlers.
+        """
+        self._bound_events = frozenset(
+            event for event in self._handlers if event.is_notification
+        )
+
     # DIMSE-C services provided by the Association
     def _c_store_scp(self, req):
         """A C-STORE SCP implementation.
@@ -828,6 +1065,18 @@ class Association(threading.Thread):
             rsp.Status = 0xC211
             self.dimse.send_msg(rsp, context.context_id)
             return
+        finally:
+            # Remove any temporary file used to receive the dataset
+            if req._dataset_file:
+                req._dataset_file.close()
+                try:
+                    os.unlink(req._dataset_file.name)
+                except OSError:
+                    pass
+
+            # Release any memory reserved for the dataset
+            if req._dataset_reservation:
+                req._dataset_reservation.release()
 
         # Check the callback's returned status
         if isinstance(status, Dataset):
@@ -988,7 +1237,9 @@ class Association(threading.Thread):
 
         return status
 
-    def send_c_find(self, dataset, query_model, msg_id=1, priority=2):
+    def send_c_find(self, dataset, query_model, msg_id=1, priority=2,
+                    decode_identifiers=True, keywords=None, max_results=None,
+                    prefetch=None):
         """Send a C-FIND request to the peer AE.
 
         Yields (*status*, *identifier*) pairs for each response from the peer.
@@ -997,6 +1248,11 @@ class Association(threading.Thread):
 
             `query_model` now only accepts a UID string
 
+        .. versionchanged:: 2.0
+
+            Added `decode_identifiers`, `keywords`, `max_results` and
+            `prefetch` keyword parameters
+
         Parameters
         ----------
         dataset : pydicom.dataset.Dataset
@@ -1017,6 +1273,36 @@ class Association(threading.Thread):
             - ``0`` - Medium
             - ``1`` - High
             - ``2`` - Low (default)
+        decode_identifiers : bool, optional
+            If ``True`` (default) then yield the response *Identifiers* as
+            decoded :class:`~pydicom.dataset.Dataset` instances, otherwise
+            yield them as :class:`io.BytesIO` containing the *Identifier*
+            as received from the peer, encoded using the transfer syntax of
+            the accepted presentation context.
+        keywords : list of str, optional
+            If used then only decode the top-level elements in the response
+            *Identifiers* with the given element keywords, all other
+            elements are skipped over without being decoded. The
+            (0008,0005) *Specific Character Set* element is always included
+            if present. Ignored if `decode_identifiers` is ``False``.
+        max_results : int, optional
+            If used then send a C-CANCEL request to the peer after
+            `max_results` pending responses have been received. Any further
+            pending responses sent by the peer before it acts on the cancel
+            are discarded without being decoded, and the final yielded
+            *status* is the one sent by the peer in response to the cancel,
+            usually ``0xFE00``. Must be at least 1.
+        prefetch : int, optional
+            If used then the responses from the peer are received and have
+            their *Identifiers* decoded in a separate thread, with up to
+            `prefetch` responses held ready while the caller is processing
+            the earlier ones. The responses are yielded in the order they
+            were received. If the generator is closed before the final
+            response, such as by calling its ``close()`` method, then a
+            C-CANCEL request is sent and closing waits until the peer's
+            remaining responses have been received and discarded. If not used
+            (default) then each response is received and decoded as it's
+            iterated over.
 
         Yields
         ------
@@ -1084,9 +1370,10 @@ class Association(threading.Thread):
                 and any Optional Keys were supported in the same manner as
                 Required Keys
 
-        identifier : pydicom.dataset.Dataset or None
+        identifier : pydicom.dataset.Dataset, io.BytesIO or None
             If the status category is 'Pending' then the C-FIND response's
-            *Identifier* :class:`~pydicom.dataset.Dataset` If the status
+            *Identifier* :class:`~pydicom.dataset.Dataset`, or the encoded
+            *Identifier* if `decode_identifiers` is ``False``. If the status
             category is not 'Pending' this will be ``None``. The exact contents
             of the response *Identifier* are Service Class specific (see the
             DICOM Standard, :dcm:`Part 4<part04.html>`).
@@ -1096,8 +1383,10 @@ class Association(threading.Thread):
         RuntimeError
             If ``send_c_find`` is called with no established association.
         ValueError
-            If no accepted Presentation Context for `query_model` exists or if
-            unable to encode the *Identifier* `dataset`.
+            If no accepted Presentation Context for `query_model` exists, if
+            unable to encode the *Identifier* `dataset`, if `keywords`
+            contains an unknown element keyword or if `max_results` is less
+            than 1.
 
         See Also
         --------
@@ -1137,6 +1426,21 @@ class Association(threading.Thread):
             raise RuntimeError("The association with a peer SCP must be "
                                "established before sending a C-FIND request")
 
+        specific_tags = None
+        if decode_identifiers and keywords:
+            specific_tags = []
+            for keyword in keywords:
+                tag = tag_for_keyword(keyword)
+                if tag is None:
+                    raise ValueError(
+                        f"Unknown element keyword '{keyword}' in 'keywords'"
+                    )
+
+                specific_tags.append(Tag(tag))
+
+        if max_results is not None and max_results < 1:
+            raise ValueError("'max_results' must be at least 1")
+
         # Determine the Presentation Context we are operating under
         #   and hence the transfer syntax to use for encoding `dataset`
         context = self._get_valid_context(query_model, '', 'scu')
@@ -1192,7 +1496,20 @@ class Association(threading.Thread):
         # Wrap the generator so the C-FIND-RQ is sent immediately on
         #   executing this function, otherwise sending C-CANCEL requests
         #   may end up being sent first unless next() is called
-        return self._wrap_find_responses(transfer_syntax)
+        stop = threading.Event() if prefetch else None
+        responses = self._wrap_find_responses(
+            transfer_syntax,
+            msg_id=msg_id,
+            context_id=context.context_id,
+            decode_identifiers=decode_identifiers,
+            specific_tags=specific_tags,
+            max_results=max_results,
+            stop=stop
+        )
+        if prefetch:
+            return _Prefetcher(responses, prefetch, stop).start()
+
+        return responses
 
     def send_c_get(self, dataset, query_model, msg_id=1, priority=2):
         """Send a C-GET request to the peer AE.
@@ -1593,15 +1910,23 @@ class Association(threading.Thread):
 
         .. versionchanged:: 2.0
 
-            Changed `dataset` parameter to either be a dataset or the path to
-            a dataset.
+            Changed `dataset` parameter to either be a dataset, the path to
+            a dataset or an :class:`~pynetdicom.dsutils.EncodedDataset`.
 
         Parameters
         ----------
-        dataset : pydicom.dataset.Dataset, str or pathlib.Path
-            The DICOM dataset to send to the peer or the file path to the
-            dataset to be sent. If a file path then the dataset will be read
-            and decoded using :func:`~pydicom.filereader.dcmread`.
+        dataset : pydicom.dataset.Dataset, str, pathlib.Path or EncodedDataset
+            The DICOM dataset to send to the peer, the file path to the
+            dataset to be sent or an already encoded dataset. If a file path
+            then the dataset will be read and decoded using
+            :func:`~pydicom.filereader.dcmread`. If an
+            :class:`~pynetdicom.dsutils.EncodedDataset` then the dataset will
+            be read from its source in chunks as it's being sent and an
+            accepted presentation context with a matching transfer syntax is
+            required, except that a dataset encoded using *Implicit VR Little
+            Endian*, *Explicit VR Little Endian* or *Deflated Explicit VR
+            Little Endian* can be sent using a context with any of the three,
+            as it's converted while being sent.
         msg_id : int, optional
             The C-STORE request's *Message ID*, must be between 0 and 65535,
             inclusive, (default ``1``).
@@ -1632,7 +1957,10 @@ class Association(threading.Thread):
             :class:`~pydicom.dataset.Dataset` containing at least a
             (0000,0900) *Status* element, and, depending on the returned
             value, may optionally contain additional elements (see DICOM
-            Standard, Part 7, :dcm:`Annex C<part07/chapter_C.html>`).
+            Standard, Part 7, :dcm:`Annex C<part07/chapter_C.html>`). If the
+            dataset couldn't be read or converted while it was being sent
+            then the association is aborted and an empty
+            :class:`~pydicom.dataset.Dataset` is returned.
 
             The status for the requested C-STORE operation should be one of the
             following, but as the value depends on the peer SCP this can't be
@@ -1681,8 +2009,9 @@ class Association(threading.Thread):
             (0008,0018) *SOP Instance UID* elements or the (0002,0010)
             *Transfer Syntax UID* file meta information element.
         ValueError
-            If no accepted Presentation Context for `dataset` exists or if
-            unable to encode the `dataset`.
+            If no accepted Presentation Context for `dataset` exists, if
+            unable to encode the `dataset` or if unable to convert the start
+            of an encoded `dataset` to the accepted transfer syntax.
 
         See Also
         --------
@@ -1691,6 +2020,7 @@ class Association(threading.Thread):
         :class:`~pynetdicom.service_class.StorageServiceClass`
         :class:`~pynetdicom.service_class.NonPatientObjectStorageServiceClass`
         :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET`
+        :class:`~pynetdicom.dsutils.EncodedDataset`
 
         References
         ----------
@@ -1724,7 +2054,14 @@ class Association(threading.Thread):
         req.MoveOriginatorMessageID = originator_id
 
         allow_conversion = True
-        if not isinstance(dataset, Dataset):
+        if isinstance(dataset, EncodedDataset):
+            allow_conversion = False
+            req._dataset_source = dataset.source
+            sop_class = dataset.sop_class_uid
+            sop_instance = dataset.sop_instance_uid
+            tsyntax = dataset.transfer_syntax
+            dataset = None
+        elif not isinstance(dataset, Dataset):
             fpath = Path(dataset)
             if not _config.STORE_SEND_CHUNKED_DATASET:
                 dataset = dcmread(os.fspath(fpath))
@@ -1785,26 +2122,72 @@ class Association(threading.Thread):
         # Encode the `dataset` using the agreed transfer syntax
         #   Will return None if failed to encode
         if dataset:
-            bytestream = encode(
+            # If the encoded dataset is being cached then cache it deflated
+            #   rather than compressing it while it's being sent
+            deflate = (
+                transfer_syntax.is_deflated
+                and not _config.STORE_SEND_CACHE_SIZE
+            )
+            bytestream = _encode_dataset(
                 dataset,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
-                transfer_syntax.is_deflated
+                transfer_syntax.is_deflated and not deflate,
+                pool=self.ae._codec_pool
             )
 
-            if bytestream is not None:
-                req.DataSet = BytesIO(bytestream)
-            else:
+            if bytestream is None:
                 LOGGER.error("Failed to encode the supplied dataset")
                 raise ValueError('Failed to encode the supplied dataset')
 
+            if deflate:
+                # Compress the dataset as it's being sent
+                req._dataset_source = _deflate(bytestream)
+            else:
+                req.DataSet = BytesIO(bytestream)
+        elif tsyntax != transfer_syntax:
+            # Convert the encoded dataset as it's being sent
+            if req._dataset_path is not None:
+                source = _read_chunks(*req._dataset_path)
+                req._dataset_path = None
+            else:
+                source = req._dataset_source
+
+            # Convert the first element now so that a dataset that can't
+            #   be converted is detected before the request is sent
+            try:
+                req._dataset_source = _read_first(
+                    _convert(source, tsyntax, transfer_syntax)
+                )
+            except Exception as exc:
+                LOGGER.error(
+                    f"Unable to convert the encoded dataset from "
+                    f"'{tsyntax.name}' to '{transfer_syntax.name}'"
+                )
+                raise ValueError(
+                    f"Unable to convert the encoded dataset from "
+                    f"'{tsyntax.name}' to '{transfer_syntax.name}': {exc}"
+                ) from exc
+
         # Pause the reactor to prevent a race condition
         self._reactor_checkpoint.clear()
         while not self._is_paused:
             time.sleep(0.0001)
 
         # Send C-STORE request to the peer via DIMSE and wait for the response
-        self.dimse.send_msg(req, context.context_id)
+        try:
+            self.dimse.send_msg(req, context.context_id)
+        except Exception as exc:
+            # The request may have been partly sent, so it can't be completed
+            LOGGER.error(
+                "Failed to send the C-STORE request's dataset, aborting the "
+                "association"
+            )
+            LOGGER.exception(exc)
+            self._reactor_checkpoint.set()
+            self.abort()
+            return Dataset()
+
         cx_id, rsp = self.dimse.get_msg(block=True)
 
         # Unpause the reactor
@@ -1820,7 +2203,10 @@ class Association(threading.Thread):
 
         return status
 
-    def _wrap_find_responses(self, transfer_syntax):
+    def _wrap_find_responses(self, transfer_syntax, msg_id=1,
+                             context_id=None, decode_identifiers=True,
+                             specific_tags=None, max_results=None,
+                             stop=None):
         """Wrapper for the C-FIND response generator.
 
         Wrapping the response generators allows us to immediately send the
@@ -1829,16 +2215,42 @@ class Association(threading.Thread):
         because otherwise the C-CANCEL may end up being sent prior to the
         C-FIND request.
 
+        .. versionchanged:: 2.0
+
+            Added `msg_id`, `context_id`, `decode_identifiers`,
+            `specific_tags`, `max_results` and `stop` keyword parameters
+
         Parameters
         ----------
         transfer_syntax : pydicom.uid.UID
             The transfer syntax UID used to encode the responses.
+        msg_id : int, optional
+            The *Message ID* of the C-FIND request, used when sending a
+            C-CANCEL request.
+        context_id : int, optional
+            The presentation context ID of the C-FIND request, used when
+            sending a C-CANCEL request.
+        decode_identifiers : bool, optional
+            If ``False`` then yield the encoded response *Identifiers*
+            rather than decoding them (default ``True``).
+        specific_tags : list of pydicom.tag.BaseTag, optional
+            If used then only decode the top-level elements with the given
+            tags.
+        max_results : int, optional
+            If used then send a C-CANCEL request after `max_results` pending
+            responses have been received and discard any later pending
+            responses.
+        stop : threading.Event, optional
+            If used and set then send a C-CANCEL request on the next pending
+            response and discard any later pending responses.
 
         Yields
         ------
         See ``send_c_find()``.
         """
         operation_no = 1
+        nr_results = 0
+        cancelled = False
         while True:
             # Wait for DIMSE message
             cx_id, rsp = self.dimse.get_msg(block=True)
@@ -1902,26 +2314,34 @@ class Association(threading.Thread):
             if category in [STATUS_PENDING]:
                 operation_no += 1
 
-                with self.lock:
-                    try:
-                        identifier = decode(
-                            rsp.Identifier,
-                            transfer_syntax.is_implicit_VR,
-                            transfer_syntax.is_little_endian,
-                            transfer_syntax.is_deflated
-                        )
-                        if identifier and _config.LOG_RESPONSE_IDENTIFIERS:
-                            LOGGER.info('')
-                            LOGGER.info('# Response Identifier')
-                            for line in pretty_dataset(identifier):
-                                LOGGER.info(line)
-                            LOGGER.info('')
-                    except Exception as exc:
-                        LOGGER.error(
-                            "Failed to decode the received Identifier dataset"
-                        )
-                        LOGGER.exception(exc)
-                        yield status, None
+                if cancelled:
+                    # Already cancelled, waiting on the final response
+                    continue
+
+                if stop is not None and stop.is_set():
+                    LOGGER.info(
+                        "Responses are no longer required, cancelling the "
+                        "C-FIND request"
+                    )
+                    self.send_c_cancel(msg_id, context_id)
+                    cancelled = True
+                    continue
+
+                nr_results += 1
+                if nr_results == max_results:
+                    LOGGER.info(
+                        f"Maximum number of results ({max_results}) "
+                        "received, cancelling the C-FIND request"
+                    )
+                    self.send_c_cancel(msg_id, context_id)
+                    cancelled = True
+
+                if not decode_identifiers:
+                    identifier = rsp.Identifier
+                else:
+                    identifier = self._decode_response_identifier(
+                        rsp, transfer_syntax, specific_tags
+                    )
 
                 yield status, identifier
                 continue
@@ -2045,27 +2465,9 @@ class Association(threading.Thread):
                 #   statuses should contain an Identifier dataset
                 #   with a (0008,0058) Failed SOP Instance UID List
                 #    element however this can't be assumed
-                # pylint: disable=broad-except
-                with self.lock:
-                    try:
-                        identifier = decode(
-                            rsp.Identifier,
-                            transfer_syntax.is_implicit_VR,
-                            transfer_syntax.is_little_endian,
-                            transfer_syntax.is_deflated
-                        )
-                        if identifier and _config.LOG_RESPONSE_IDENTIFIERS:
-                            LOGGER.info('')
-                            LOGGER.info('# Response Identifier')
-                            for elem in identifier:
-                                LOGGER.info(elem)
-                            LOGGER.info('')
-                    except Exception as exc:
-                        LOGGER.error(
-                            "Failed to decode the received Identifier dataset"
-                        )
-                        LOGGER.exception(exc)
-                        identifier = None
+                identifier = self._decode_response_identifier(
+                    rsp, transfer_syntax
+                )
 
             # Only reach this point if status is Sucess, Warning, Failure
             #   or Cancel
@@ -3457,6 +3859,12 @@ class ServiceUser(object):
         # If Requestor this is the requested contexts, otherwise this is
         #   the supported contexts
         self._contexts = []
+        # If Acceptor, the server's negotiation cache, which is only valid
+        #   while the supported contexts are those of the server
+        self._negotiation_cache = None
+        # If Acceptor, True while the supported contexts are shared with
+        #   the server's other associations
+        self._shared_contexts = False
 
         # User Information items
         self._user_info = []
@@ -3604,6 +4012,27 @@ class ServiceUser(object):
 
         return items
 
+    def _share_contexts(self, contexts, negotiation_cache=None):
+        """Use the association server's supported presentation contexts
+        without copying them.
+
+        .. versionadded:: 2.0
+
+        The contexts are shared with the server's other associations until
+        they're accessed using :meth:`get_contexts` or
+        :attr:`supported_contexts`, when they're copied.
+
+        Parameters
+        ----------
+        contexts : list of presentation.PresentationContext
+            The server's supported presentation contexts.
+        negotiation_cache : presentation._NegotiationCache, optional
+            The server's cache of presentation context negotiation results.
+        """
+        self._contexts = contexts
+        self._negotiation_cache = negotiation_cache
+        self._shared_contexts = True
+
     def get_contexts(self, cx_type):
         """Return a :class:`list` of
         :class:`~pynetdicom.presentation.PresentationContext` items
@@ -3637,6 +4066,13 @@ class ServiceUser(object):
             presentation contexts from the A-ASSOCIATE (accept) primitive's
             Presentation Context Definition Results List parameter.
         """
+        if self._shared_contexts:
+            # Copy-on-write, the caller may modify the contexts and they
+            #   mustn't change the server's
+            self._contexts = deepcopy(self._contexts)
+            self._negotiation_cache = None
+            self._shared_contexts = False
+
         contexts = {'requested' : self._contexts, 'supported' : self._contexts}
         if not self.writeable:
             contexts.update({
@@ -4075,6 +4511,8 @@ class ServiceUser(object):
             )
 
         self._contexts = value
+        self._negotiation_cache = None
+        self._shared_contexts = False
 
     @property
     def user_identity(self):
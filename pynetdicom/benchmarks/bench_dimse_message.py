@@ -7,8 +7,8 @@ import time
 
 from pydicom import dcmread
 
-from pynetdicom.dimse_messages import DIMSEMessage, C_STORE_RQ
-from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dimse_messages import DIMSEMessage, C_STORE_RQ, C_ECHO_RSP
+from pynetdicom.dimse_primitives import C_STORE, C_ECHO
 from pynetdicom.dsutils import encode
 
 
@@ -56,3 +56,31 @@ class TestEncodeMessage(object):
         for ii in range(100):
             for fragment in self.msg.encode_msg(1, 16382):
                 pass
+
+
+class TestCommandSet(object):
+    def setup(self):
+        primitive = C_ECHO()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.1.1'
+        primitive.Status = 0x0000
+        self.primitive = primitive
+        msg = C_ECHO_RSP()
+        msg.primitive_to_message(primitive)
+        self.fragments = list(msg.encode_msg(1, 16382))
+
+    def time_encode(self):
+        """Benchmark for encoding a command set only message."""
+        for ii in range(1000):
+            msg = C_ECHO_RSP()
+            msg.primitive_to_message(self.primitive)
+            for fragment in msg.encode_msg(1, 16382):
+                pass
+
+    def time_decode(self):
+        """Benchmark for decoding a command set only message."""
+        for ii in range(1000):
+            msg = DIMSEMessage()
+            for fragment in self.fragments:
+                msg.decode_msg(fragment)
+            msg.message_to_primitive()
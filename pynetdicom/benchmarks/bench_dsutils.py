@@ -0,0 +1,71 @@
+"""Performance tests for the dataset utilities."""
+
+from io import BytesIO
+import os
+import threading
+
+from pydicom import dcmread
+
+from pynetdicom.dsutils import encode, decode, _transcode, _CodecPool
+
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), '../tests', 'dicom_files')
+DATASET = dcmread(os.path.join(TEST_DS_DIR, 'RTImageStorage.dcm'))
+
+
+class TimeTranscode(object):
+    """Time converting an encoded dataset from explicit to implicit VR."""
+    def setup(self):
+        """Run prior to each test"""
+        self.raw = encode(DATASET, False, True)
+
+    def time_decode_encode(self):
+        """Time converting 10 datasets by decoding and re-encoding them."""
+        for ii in range(10):
+            ds = decode(BytesIO(self.raw), False, True)
+            for elem in ds.iterall():
+                pass
+
+            encode(ds, True, True)
+
+    def time_transcode(self):
+        """Time converting 10 datasets by rewriting the element headers."""
+        for ii in range(10):
+            for chunk in _transcode(self.raw, True):
+                pass
+
+
+class TimeCodecPool(object):
+    """Time encoding datasets from several threads at once."""
+    def setup(self):
+        """Run prior to each test"""
+        self.ds = dcmread(os.path.join(TEST_DS_DIR, 'CTImageStorage.dcm'))
+        self.pool = _CodecPool(4)
+        # Start the worker processes
+        for ii in range(4):
+            self.pool.encode(self.ds, False, True)
+
+    def teardown(self):
+        """Stop the worker processes"""
+        self.pool.shutdown()
+
+    def _run(self, func):
+        """Encode 25 datasets in each of 4 threads using `func`."""
+        def encode_datasets():
+            for ii in range(25):
+                func(self.ds, False, True)
+
+        threads = [threading.Thread(target=encode_datasets) for ii in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    def time_encode(self):
+        """Time encoding in the calling threads."""
+        self._run(encode)
+
+    def time_encode_pool(self):
+        """Time encoding using the process pool."""
+        self._run(self.pool.encode)
@@ -0,0 +1,63 @@
+"""Performance tests for importing pynetdicom and starting the apps."""
+
+import subprocess
+import sys
+
+
+def import_time(statement):
+    """Return the time in microseconds taken to import *pynetdicom* by
+    `statement`, as reported by ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        # Nested imports are indented and already included in their parent
+        _, cumulative, name = line.split('|')
+        if name.startswith(' pynetdicom') or (total and name[1] != ' '):
+            total += int(cumulative)
+
+    return total
+
+
+class TrackImportTime(object):
+    """Track the import times reported by the interpreter."""
+    unit = 'microseconds'
+
+    def track_import_pynetdicom(self):
+        """Track the time taken by ``import pynetdicom``."""
+        return import_time('import pynetdicom')
+
+    def track_import_ae(self):
+        """Track the time taken by ``from pynetdicom import AE``."""
+        return import_time('from pynetdicom import AE')
+
+
+class TimeColdStart(object):
+    """Time starting a new interpreter."""
+    def run(self, *args):
+        """Run python with `args`."""
+        subprocess.run(
+            [sys.executable] + list(args),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def time_import_pynetdicom(self):
+        """Time ``python -c "import pynetdicom"``."""
+        self.run('-c', 'import pynetdicom')
+
+    def time_version(self):
+        """Time ``python -m pynetdicom --version``."""
+        self.run('-m', 'pynetdicom', '--version')
+
+    def time_echoscu(self):
+        """Time ``python -m pynetdicom echoscu --version``."""
+        self.run('-m', 'pynetdicom', 'echoscu', '--version')
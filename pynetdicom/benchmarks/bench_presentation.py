@@ -5,11 +5,16 @@ from copy import deepcopy
 from pydicom._uid_dict import UID_dictionary
 from pydicom.uid import UID
 
-from pynetdicom import StoragePresentationContexts, build_context
+from pynetdicom import (
+    AE, AllStoragePresentationContexts, ALL_TRANSFER_SYNTAXES,
+    StoragePresentationContexts, build_context
+)
+from pynetdicom.association import Association
 from pynetdicom.presentation import (
     PresentationContext,
     negotiate_as_acceptor,
-    negotiate_as_requestor
+    negotiate_as_requestor,
+    _NegotiationCache,
 )
 
 
@@ -64,6 +69,21 @@ class TimePresentationContext:
                                   '1.2.840.10008.1.2.2']
 
 
+class TimeCopyContexts(object):
+    """Time copying presentation contexts"""
+    def setup(self):
+        # All storage SOP Classes with all transfer syntaxes
+        self.contexts = [
+            build_context(cx.abstract_syntax, ALL_TRANSFER_SYNTAXES)
+            for cx in AllStoragePresentationContexts
+        ]
+
+    def time_deepcopy(self):
+        """Time deep copying the contexts 10 times"""
+        for ii in range(10):
+            deepcopy(self.contexts)
+
+
 class TimePresentationAcceptorRoleNegotiation(object):
     """Time presentation context negotiation as acceptor with SCP/SCU Role
     Selection
@@ -163,6 +183,58 @@ class TimePresentationAcceptor(object):
             )
 
 
+class TimeNegotiationCache(object):
+    """Time repeated presentation context negotiation as acceptor"""
+    def setup(self):
+        self.requestor_contexts = []
+        for ii, cx in enumerate(StoragePresentationContexts):
+            cx = build_context(cx.abstract_syntax)
+            cx.context_id = ii * 2 + 1
+            self.requestor_contexts.append(cx)
+
+        # All storage SOP Classes with all transfer syntaxes
+        self.acceptor_contexts = [
+            build_context(cx.abstract_syntax, ALL_TRANSFER_SYNTAXES)
+            for cx in AllStoragePresentationContexts
+        ]
+        self.cache = _NegotiationCache(self.acceptor_contexts)
+
+    def time_negotiate(self):
+        """Time negotiating the same proposal 100 times"""
+        for ii in range(100):
+            negotiate_as_acceptor(
+                self.requestor_contexts,
+                self.acceptor_contexts
+            )
+
+    def time_negotiate_cached(self):
+        """Time negotiating the same proposal 100 times using the cache"""
+        for ii in range(100):
+            self.cache.negotiate(self.requestor_contexts)
+
+
+class TimeValidContext(object):
+    """Time finding the accepted context to use when sending a message"""
+    def setup(self):
+        self.assoc = Association(AE(), 'requestor')
+        for ii, cx in enumerate(StoragePresentationContexts):
+            cx = build_context(cx.abstract_syntax, cx.transfer_syntax[1])
+            cx.context_id = ii * 2 + 1
+            cx.result = 0x00
+            cx._as_scu = True
+            self.assoc._accepted_cx[cx.context_id] = cx
+
+        self.uids = [cx.abstract_syntax for cx in StoragePresentationContexts]
+
+    def time_get_valid_context(self):
+        """Time finding a context for each storage SOP Class 10 times"""
+        for ii in range(10):
+            for uid in self.uids:
+                self.assoc._get_valid_context(
+                    uid, '1.2.840.10008.1.2', 'scu'
+                )
+
+
 class TimePresentationRequestor(object):
     """Time presentation context negotiation as requestor"""
     def setup(self):
@@ -0,0 +1,190 @@
+"""Performance tests for the qrscp app's database."""
+
+from datetime import date, timedelta
+import os
+
+from pydicom.dataset import Dataset
+from sqlalchemy.orm import sessionmaker
+
+from pynetdicom.apps.qrscp import db
+from pynetdicom.sop_class import (
+    PatientRootQueryRetrieveInformationModelFind,
+    StudyRootQueryRetrieveInformationModelFind
+)
+
+
+# The number of patients, studies per patient, series per study and
+#   instances per series: 10,000 x 4 x 5 x 5 = 1,000,000 instances
+PATIENTS, STUDIES, SERIES, INSTANCES = 10000, 4, 5, 5
+MODALITIES = ['CT', 'MR', 'PT', 'US', 'XA']
+UID_ROOT = '1.2.826.0.1.3680043.9.3811'
+
+
+def create_database(fpath):
+    """Create a qrscp database at `fpath` containing the test instances."""
+    engine = db.create(
+        f'sqlite:///{fpath}',
+        pragmas={'journal_mode': 'WAL', 'synchronous': 'OFF'}
+    )
+    start = date(2000, 1, 1)
+    # Insert 1000 patients at a time
+    for offset in range(0, PATIENTS, 1000):
+        patients, studies, series, instances = [], [], [], []
+        for pt in range(offset, offset + 1000):
+            patients.append({
+                'id': pt + 1,
+                'patient_id': f'PID{pt:06d}',
+                'patient_name': f'PATIENT^{pt:06d}',
+            })
+            for st in range(STUDIES):
+                study_key = pt * STUDIES + st + 1
+                study_uid = f'{UID_ROOT}.{pt}.{st}'
+                study_date = start + timedelta(days=study_key % 7300)
+                studies.append({
+                    'id': study_key,
+                    'patient_key': pt + 1,
+                    'study_instance_uid': study_uid,
+                    'study_date': study_date.strftime('%Y%m%d'),
+                    'study_time': '120000',
+                    'accession_number': f'ACC{study_key:08d}',
+                    'study_id': str(st + 1),
+                })
+                for se in range(SERIES):
+                    series_key = (study_key - 1) * SERIES + se + 1
+                    series_uid = f'{study_uid}.{se}'
+                    series.append({
+                        'id': series_key,
+                        'study_key': study_key,
+                        'series_instance_uid': series_uid,
+                        'modality': MODALITIES[se],
+                        'series_number': str(se + 1),
+                    })
+                    for ii in range(INSTANCES):
+                        instances.append({
+                            'series_key': series_key,
+                            'sop_instance_uid': f'{series_uid}.{ii}',
+                            'instance_number': str(ii + 1),
+                            'filename': f'{series_uid}.{ii}',
+                            'transfer_syntax_uid': '1.2.840.10008.1.2.1',
+                            'sop_class_uid': '1.2.840.10008.5.1.4.1.1.2',
+                        })
+
+        with engine.begin() as conn:
+            conn.execute(db.Patient.__table__.insert(), patients)
+            conn.execute(db.Study.__table__.insert(), studies)
+            conn.execute(db.Series.__table__.insert(), series)
+            conn.execute(db.Instance.__table__.insert(), instances)
+
+
+class TimeSearch(object):
+    """Time C-FIND queries at each level against 1,000,000 instances."""
+    timeout = 600
+
+    def setup_cache(self):
+        """Create the database, once for all the tests"""
+        fpath = os.path.abspath('qrscp_bench.sqlite')
+        create_database(fpath)
+        return fpath
+
+    def setup(self, fpath):
+        """Run prior to each test"""
+        engine = db.create(f'sqlite:///{fpath}')
+        self.session = sessionmaker(bind=engine)()
+
+    def teardown(self, fpath):
+        """Run after each test"""
+        self.session.close()
+
+    def search(self, model, level, **kwargs):
+        """Return the matches for a query at `level` using `kwargs`."""
+        identifier = Dataset()
+        identifier.QueryRetrieveLevel = level
+        for keyword, value in kwargs.items():
+            setattr(identifier, keyword, value)
+
+        return list(db.search(model, identifier, self.session))
+
+    def time_patient(self, fpath):
+        """Time a PATIENT level query for a Patient ID."""
+        self.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            'PATIENT',
+            PatientID='PID005000',
+            PatientName=None
+        )
+
+    def time_patient_wildcard(self, fpath):
+        """Time a PATIENT level query matching 10 Patient's Names."""
+        self.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            'PATIENT',
+            PatientID=None,
+            PatientName='PATIENT^00500?'
+        )
+
+    def time_study(self, fpath):
+        """Time a STUDY level query for a patient's studies in a date
+        range.
+        """
+        self.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            'STUDY',
+            PatientID='PID005000',
+            StudyInstanceUID=None,
+            StudyDate='20000101-20101231'
+        )
+
+    def time_study_accession(self, fpath):
+        """Time a STUDY level query for an Accession Number."""
+        self.search(
+            StudyRootQueryRetrieveInformationModelFind,
+            'STUDY',
+            StudyInstanceUID=None,
+            AccessionNumber='ACC00020001'
+        )
+
+    def time_study_date(self, fpath):
+        """Time a STUDY level query for a Study Date."""
+        self.search(
+            StudyRootQueryRetrieveInformationModelFind,
+            'STUDY',
+            StudyInstanceUID=None,
+            StudyDate='20050101'
+        )
+
+    def time_series(self, fpath):
+        """Time a SERIES level query for a study's series by Modality."""
+        self.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            'SERIES',
+            PatientID='PID005000',
+            StudyInstanceUID=f'{UID_ROOT}.5000.1',
+            SeriesInstanceUID=None,
+            Modality='CT'
+        )
+
+    def time_image(self, fpath):
+        """Time an IMAGE level query for a SOP Instance UID."""
+        self.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            'IMAGE',
+            PatientID='PID005000',
+            StudyInstanceUID=f'{UID_ROOT}.5000.1',
+            SeriesInstanceUID=f'{UID_ROOT}.5000.1.2',
+            SOPInstanceUID=f'{UID_ROOT}.5000.1.2.3'
+        )
+
+    def time_first_match(self, fpath):
+        """Time getting the first match for a query matching every
+        instance.
+        """
+        identifier = Dataset()
+        identifier.QueryRetrieveLevel = 'PATIENT'
+        identifier.PatientID = None
+        identifier.PatientName = '*'
+
+        next(iter(db.search(
+            PatientRootQueryRetrieveInformationModelFind,
+            identifier,
+            self.session
+        )))
@@ -0,0 +1,26 @@
+"""Performance tests for the sop_class module."""
+
+from pynetdicom.sop_class import (
+    uid_to_service_class, uid_to_sop_class, _STORAGE_CLASSES
+)
+
+
+class TimeUIDLookup(object):
+    """Time finding the service and SOP classes for a UID."""
+    def setup(self):
+        """Run prior to each test"""
+        self.uids = sorted(_STORAGE_CLASSES.values()) + [
+            '1.2.840.10008.1.1', '1.2.3.4'
+        ]
+
+    def time_uid_to_service_class(self):
+        """Time finding the service class for 100 x 138 UIDs."""
+        for ii in range(100):
+            for uid in self.uids:
+                uid_to_service_class(uid)
+
+    def time_uid_to_sop_class(self):
+        """Time finding the SOP class for 100 x 138 UIDs."""
+        for ii in range(100):
+            for uid in self.uids:
+                uid_to_sop_class(uid)
@@ -0,0 +1,122 @@
+"""Performance tests for forwarding C-STORE requests."""
+
+import os
+
+from pydicom import dcmread
+from pydicom.uid import ExplicitVRLittleEndian
+
+from pynetdicom import AE, evt, _config
+from pynetdicom.dsutils import _ENCODE_CACHE
+from pynetdicom.sop_class import CTImageStorage
+
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), '../tests', 'dicom_files')
+DATASET = dcmread(os.path.join(TEST_DS_DIR, 'CTImageStorage.dcm'))
+
+
+class TimeStoreForward(object):
+    """Time forwarding datasets from an SCU to an SCP via a router."""
+    def setup(self):
+        """Run prior to each test"""
+        # The final destination
+        self.scp_ae = AE()
+        self.scp_ae.maximum_pdu_size = 0
+        self.scp_ae.add_supported_context(
+            CTImageStorage, ExplicitVRLittleEndian
+        )
+        self.scp = self.scp_ae.start_server(
+            ('', 11113),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, lambda event: 0x0000)]
+        )
+
+        # The router
+        self.router_ae = AE()
+        self.router_ae.maximum_pdu_size = 0
+        self.router_ae.add_supported_context(
+            CTImageStorage, ExplicitVRLittleEndian
+        )
+        self.router_ae.add_requested_context(
+            CTImageStorage, ExplicitVRLittleEndian
+        )
+        self.forward = self.router_ae.associate('localhost', 11113)
+        self.router = self.router_ae.start_server(
+            ('', 11112),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, self.handle_store)]
+        )
+
+        self.decode = False
+
+        ae = AE()
+        ae.maximum_pdu_size = 0
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        self.assoc = ae.associate('localhost', 11112)
+
+    def teardown(self):
+        """Stop the servers"""
+        self.assoc.release()
+        self.forward.release()
+        self.router.shutdown()
+        self.scp.shutdown()
+
+    def handle_store(self, event):
+        """Forward the dataset to the destination"""
+        if self.decode:
+            ds = event.dataset
+            ds.file_meta = event.file_meta
+        else:
+            ds = event.encoded_dataset
+
+        return self.forward.send_c_store(ds).Status
+
+    def time_forward_decoded(self):
+        """Time forwarding 100 datasets after decoding them."""
+        self.decode = True
+        for ii in range(100):
+            self.assoc.send_c_store(DATASET)
+
+    def time_forward_encoded(self):
+        """Time forwarding 100 datasets without decoding them."""
+        for ii in range(100):
+            self.assoc.send_c_store(DATASET)
+
+
+class TimeStoreFanOut(object):
+    """Time sending the same dataset to several destinations."""
+    def setup(self):
+        """Run prior to each test"""
+        self.ae = AE()
+        self.ae.maximum_pdu_size = 0
+        self.ae.add_supported_context(CTImageStorage, ExplicitVRLittleEndian)
+        self.ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        self.scp = self.ae.start_server(
+            ('', 11112),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, lambda event: 0x0000)]
+        )
+        self.destinations = [
+            self.ae.associate('localhost', 11112) for ii in range(5)
+        ]
+
+    def teardown(self):
+        """Stop the server"""
+        for assoc in self.destinations:
+            assoc.release()
+
+        self.scp.shutdown()
+        _config.STORE_SEND_CACHE_SIZE = None
+        _ENCODE_CACHE.clear()
+
+    def time_fan_out(self):
+        """Time sending 20 datasets to 5 destinations."""
+        for ii in range(20):
+            for assoc in self.destinations:
+                assoc.send_c_store(DATASET)
+
+    def time_fan_out_cached(self):
+        """Time sending 20 datasets to 5 destinations using the cache."""
+        _config.STORE_SEND_CACHE_SIZE = 64 * 1024**2
+        for ii in range(20):
+            for assoc in self.destinations:
+                assoc.send_c_store(DATASET)
@@ -5,18 +5,24 @@ from io import BytesIO
 import logging
 from math import ceil
 from pathlib import Path
+from struct import pack, pack_into, unpack_from
 from tempfile import NamedTemporaryFile
+import threading
+import zlib
 
+from pydicom.charset import default_encoding
 from pydicom.dataset import Dataset
 from pydicom.filewriter import write_file_meta_info
+from pydicom.multival import MultiValue
 from pydicom.tag import Tag
+from pydicom.uid import UID, ExplicitVRLittleEndian
 
-from pynetdicom import _config
+from pynetdicom import _config, evt
 from pynetdicom.dimse_primitives import (
     C_STORE, C_FIND, C_GET, C_MOVE, C_ECHO, C_CANCEL,
     N_EVENT_REPORT, N_GET, N_SET, N_ACTION, N_CREATE, N_DELETE
 )
-from pynetdicom.dsutils import encode, decode, create_file_meta
+from pynetdicom.dsutils import encode, create_file_meta
 from pynetdicom.pdu_primitives import P_DATA
 
 
@@ -162,10 +168,350 @@ _MSG_TO_PRIMITVE = {
     'N_DELETE' : N_DELETE,
 }
 
-_MULTIVALUE_TAGS = [
-    Tag('OffendingElement'),
-    Tag('AttributeIdentifierList')
-]
+_MULTIVALUE_KEYWORDS = ('OffendingElement', 'AttributeIdentifierList')
+
+# Used with the Command Set encoder and decoder, PS3.7 Annex E
+#   {keyword: (tag, VR)}
+_COMMAND_SET_ELEMENTS = {
+    'CommandGroupLength': (0x00000000, 'UL'),
+    'AffectedSOPClassUID': (0x00000002, 'UI'),
+    'RequestedSOPClassUID': (0x00000003, 'UI'),
+    'CommandField': (0x00000100, 'US'),
+    'MessageID': (0x00000110, 'US'),
+    'MessageIDBeingRespondedTo': (0x00000120, 'US'),
+    'MoveDestination': (0x00000600, 'AE'),
+    'Priority': (0x00000700, 'US'),
+    'CommandDataSetType': (0x00000800, 'US'),
+    'Status': (0x00000900, 'US'),
+    'OffendingElement': (0x00000901, 'AT'),
+    'ErrorComment': (0x00000902, 'LO'),
+    'ErrorID': (0x00000903, 'US'),
+    'AffectedSOPInstanceUID': (0x00001000, 'UI'),
+    'RequestedSOPInstanceUID': (0x00001001, 'UI'),
+    'EventTypeID': (0x00001002, 'US'),
+    'AttributeIdentifierList': (0x00001005, 'AT'),
+    'ActionTypeID': (0x00001008, 'US'),
+    'NumberOfRemainingSuboperations': (0x00001020, 'US'),
+    'NumberOfCompletedSuboperations': (0x00001021, 'US'),
+    'NumberOfFailedSuboperations': (0x00001022, 'US'),
+    'NumberOfWarningSuboperations': (0x00001023, 'US'),
+    'MoveOriginatorApplicationEntityTitle': (0x00001030, 'AE'),
+    'MoveOriginatorMessageID': (0x00001031, 'US'),
+}
+# {tag: (keyword, VR)}
+_COMMAND_SET_TAGS = {
+    tag: (keyword, VR) for keyword, (tag, VR) in _COMMAND_SET_ELEMENTS.items()
+}
+
+
+def _encode_command_set(values):
+    """Return the encoded Command Set for `values`.
+
+    The Command Set is always encoded as *Implicit VR Little Endian* and
+    only contains elements from a small, fixed set of tags, so rather than
+    building a pydicom :class:`~pydicom.dataset.Dataset` the elements are
+    written directly using the tags and VRs in the command set element table.
+    The *Command Group Length* element is always (re)calculated.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    values : dict
+        The Command Set as ``{keyword: value}``, where a value of ``None``
+        results in an element with no value. The keywords must be in
+        ``_COMMAND_SET_ELEMENTS``.
+
+    Returns
+    -------
+    bytes
+        The encoded Command Set, including the *Command Group Length*.
+    """
+    elements = []
+    for keyword, value in values.items():
+        if keyword == 'CommandGroupLength':
+            continue
+
+        tag, VR = _COMMAND_SET_ELEMENTS[keyword]
+        if value is None or value == '':
+            value = b''
+        elif VR == 'US':
+            if isinstance(value, int):
+                value = pack('<H', value)
+            else:
+                value = pack(f'<{len(value)}H', *value)
+        elif VR == 'UI':
+            value = str(value).encode('ascii')
+            if len(value) % 2:
+                value += b'\x00'
+        elif VR in ('AE', 'LO'):
+            if isinstance(value, str):
+                value = value.encode(default_encoding)
+            if len(value) % 2:
+                value += b' '
+        elif VR == 'AT':
+            if isinstance(value, int):
+                value = [value]
+            value = b''.join(
+                [pack('<HH', Tag(tt).group, Tag(tt).element) for tt in value]
+            )
+        elif VR == 'UL':
+            value = pack('<L', value)
+
+        elements.append((tag, pack('<HHL', 0, tag, len(value)) + value))
+
+    elements.sort()
+    encoded = b''.join([elem for _, elem in elements])
+
+    return pack('<HHLL', 0, 0, 4, len(encoded)) + encoded
+
+
+class _CommandSetTemplate(object):
+    """A pre-encoded Command Set for a given set of elements.
+
+    Responses are sent far more often than any other message and only differ
+    in a handful of values, so the element headers and empty elements are
+    encoded once and only the values are added when encoding. *US* element
+    values are patched in place and *UI* elements, whose lengths vary, are
+    added between the pre-encoded segments.
+
+    .. versionadded:: 2.0
+    """
+    def __init__(self, keywords):
+        """Create a new template.
+
+        Parameters
+        ----------
+        keywords : list of (str, bool)
+            The Command Set elements as ``(keyword, has value)``, may only
+            include elements with a VR of **UI**, **US** or **UL**.
+        """
+        keywords = sorted(keywords, key=lambda x: _COMMAND_SET_ELEMENTS[x[0]])
+
+        # [(bytes, [(offset, US keyword)], UI keyword or None)]
+        self._parts = []
+        segment = bytearray(pack('<HHLL', 0, 0, 4, 0))
+        slots = []
+        for keyword, has_value in keywords:
+            if keyword == 'CommandGroupLength':
+                continue
+
+            tag, VR = _COMMAND_SET_ELEMENTS[keyword]
+            if not has_value:
+                segment += pack('<HHL', 0, tag, 0)
+            elif VR == 'US':
+                slots.append((len(segment) + 8, keyword))
+                segment += pack('<HHLH', 0, tag, 2, 0)
+            else:
+                self._parts.append((bytes(segment), slots, keyword))
+                segment = bytearray()
+                slots = []
+
+        self._parts.append((bytes(segment), slots, None))
+
+    def encode(self, values):
+        """Return the encoded Command Set for `values`.
+
+        Parameters
+        ----------
+        values : dict
+            The Command Set as ``{keyword: value}``, must contain the same
+            elements that were used to create the template.
+
+        Returns
+        -------
+        bytes
+            The encoded Command Set, including the *Command Group Length*.
+        """
+        encoded = bytearray()
+        for segment, slots, uid_keyword in self._parts:
+            offset = len(encoded)
+            encoded += segment
+            for slot, keyword in slots:
+                pack_into('<H', encoded, offset + slot, values[keyword])
+
+            if uid_keyword:
+                value = str(values[uid_keyword]).encode('ascii')
+                if len(value) % 2:
+                    value += b'\x00'
+
+                tag = _COMMAND_SET_ELEMENTS[uid_keyword][0]
+                encoded += pack('<HHL', 0, tag, len(value))
+                encoded += value
+
+        pack_into('<L', encoded, 8, len(encoded) - 12)
+
+        return bytes(encoded)
+
+
+# The pre-encoded response Command Set templates
+#   {(message type, ((keyword, has value), ...)): _CommandSetTemplate or None}
+#   A value of None indicates no template can be used
+_RESPONSE_TEMPLATES = {}
+
+
+def _encode_response_command_set(msg_type, values):
+    """Return the encoded response Command Set for `values`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    msg_type : str
+        The DIMSE message type, such as ``'C-STORE-RSP'``.
+    values : dict
+        The Command Set as ``{keyword: value}``.
+
+    Returns
+    -------
+    bytes
+        The encoded Command Set, including the *Command Group Length*.
+    """
+    key = (
+        msg_type,
+        tuple([(kw, value is not None) for kw, value in values.items()])
+    )
+    try:
+        template = _RESPONSE_TEMPLATES[key]
+    except KeyError:
+        template = None
+        if all(
+            _COMMAND_SET_ELEMENTS[kw][1] in ('UI', 'US', 'UL')
+            for kw, has_value in key[1] if has_value
+        ):
+            template = _CommandSetTemplate(key[1])
+
+        _RESPONSE_TEMPLATES[key] = template
+
+    if template is None:
+        return _encode_command_set(values)
+
+    return template.encode(values)
+
+
+def _decode_command_set(encoded):
+    """Return the Command Set `encoded` as ``{keyword: value}``.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    encoded : bytes
+        The Command Set encoded as *Implicit VR Little Endian*.
+
+    Returns
+    -------
+    dict
+        The decoded Command Set as ``{keyword: value}``, with the values
+        decoded the same way as pydicom would. Elements that aren't part of
+        any DIMSE message are skipped and logged at the debug level.
+    """
+    values = {}
+    offset = 0
+    end = len(encoded)
+    while offset < end:
+        group, elem, length = unpack_from('<HHL', encoded, offset)
+        offset += 8
+        value = bytes(encoded[offset:offset + length])
+        offset += length
+
+        if group != 0 or elem not in _COMMAND_SET_TAGS:
+            LOGGER.debug(
+                f"Skipping non-DIMSE element ({group:04X},{elem:04X}) in "
+                "the received Command Set"
+            )
+            continue
+
+        keyword, VR = _COMMAND_SET_TAGS[elem]
+        if not value:
+            value = '' if VR in ('UI', 'AE', 'LO') else None
+        elif VR in ('US', 'UL'):
+            fmt = 'H' if VR == 'US' else 'L'
+            nr_values = length // (2 if VR == 'US' else 4)
+            value = list(unpack_from(f'<{nr_values}{fmt}', value))
+        elif VR == 'AT':
+            value = [
+                Tag(*unpack_from('<HH', value, ii))
+                for ii in range(0, length - length % 4, 4)
+            ]
+        else:
+            value = value.decode(default_encoding).split('\\')
+            if VR == 'UI':
+                value = [UID(vv.rstrip('\0 ')) for vv in value]
+            elif VR == 'AE':
+                value = [vv.strip() for vv in value]
+            else:
+                value = [vv.rstrip('\0 ') for vv in value]
+
+        if isinstance(value, list) and len(value) == 1:
+            value = value[0]
+
+        values[keyword] = value
+
+    return values
+
+
+class _MemoryBudget(object):
+    """Track the memory used to receive datasets across all associations.
+
+    .. versionadded:: 2.0
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.used = 0
+
+    def reserve(self, nr_bytes, budget):
+        """Return ``True`` if `nr_bytes` fit within `budget` and reserve
+        them, ``False`` otherwise.
+
+        Parameters
+        ----------
+        nr_bytes : int
+            The number of bytes to reserve.
+        budget : int or None
+            The maximum total number of bytes that may be reserved, or
+            ``None`` for no limit.
+        """
+        with self._lock:
+            if budget is not None and self.used + nr_bytes > budget:
+                return False
+
+            self.used += nr_bytes
+            return True
+
+    def release(self, nr_bytes):
+        """Release `nr_bytes` of previously reserved memory."""
+        with self._lock:
+            self.used -= nr_bytes
+
+
+# The memory used by C-STORE datasets being received in memory when
+#   ApplicationEntity.store_recv_spill_threshold or
+#   _config.STORE_RECV_MEMORY_BUDGET is in use
+_STORE_RECV_MEMORY = _MemoryBudget()
+
+
+class _Reservation(object):
+    """Memory reserved from the budget for a received C-STORE request's
+    *Data Set*.
+
+    .. versionadded:: 2.0
+
+    The memory is released by :meth:`release` once the request has been
+    handled, or when the reservation is garbage collected.
+    """
+    def __init__(self, nr_bytes):
+        self.nr_bytes = nr_bytes
+
+    def __del__(self):
+        """Release the reserved memory if it hasn't been already."""
+        self.release()
+
+    def release(self):
+        """Release the reserved memory."""
+        nr_bytes, self.nr_bytes = self.nr_bytes, 0
+        if nr_bytes:
+            _STORE_RECV_MEMORY.release(nr_bytes)
 
 
 class DIMSEMessage(object):
@@ -206,23 +552,40 @@ class DIMSEMessage(object):
     Attributes
     ----------
     command_set : pydicom.dataset.Dataset
-        The message Command Set information (see PS3.7 6.3).
+        The message Command Set information (see PS3.7 6.3). The dataset is
+        only created when first accessed and if it's then modified the
+        changes will be used when encoding the message.
     context_id : int
         The presentation context ID.
     data_set : io.BytesIO
-        The encoded message Data Set (see PS3.7 6.3).
+        The encoded message Data Set (see PS3.7 6.3). When decoding an
+        incoming P-DATA primitive this is only set once the final Data Set
+        fragment has been received.
     encoded_command_set : BytesIO
         During decoding of an incoming P-DATA primitive this stores the
-        encoded Command Set data from the fragments.
+        encoded Command Set data once the final Command Set fragment has been
+        received.
     """
     def __init__(self):
         """Create a new DIMSE Message."""
         self.context_id = None
 
-        # Required to save command set data from multiple fragments
         self.encoded_command_set = BytesIO()
         self.data_set = BytesIO()
-        self.command_set = Dataset()
+
+        # Required to save the command set and data set data from multiple
+        #   fragments, these are only joined once the final fragment is
+        #   received so the data is copied only once
+        self._command_fragments = []
+        self._data_set_fragments = []
+
+        # The Command Set as {keyword: value}, used to go directly between
+        #   the DIMSE primitive and the encoded command set, the
+        #   `command_set` Dataset is only created if required
+        self._command_values = {}
+        self._command_set = None
+        # The encoded Command Set for the current `_command_values`
+        self._encoded_command_values = None
 
         # If reading the dataset in chunks this will be a tuple:
         #   (its file path, a byte offset to the start of the dataset)
@@ -232,14 +595,67 @@ class DIMSEMessage(object):
         # If writing the dataset in chunks this will be a NamedTemporaryFile:
         #   the file object backing its file path
         self._data_set_file = None
+        # If reading the dataset in chunks from a file-like, bytes-like or
+        #   iterable this will be the source of the encoded dataset
+        self._data_set_source = None
+        # If writing the dataset to the object returned by the
+        #   evt.EVT_C_STORE_SINK handler this will be that object
+        self._data_set_sink = None
+        # If the sink raised an exception then this will be the exception
+        #   and the rest of the dataset is discarded
+        self._data_set_sink_error = None
+        # If receiving the dataset in memory until it's too large this will
+        #   be (the spill threshold, the transfer syntax of the dataset)
+        self._data_set_spill = None
+        # The number of bytes reserved from _STORE_RECV_MEMORY
+        self._data_set_reserved = 0
+        # If receiving a deflated dataset this will be the decompressor
+        #   used to inflate it as it arrives
+        self._data_set_inflater = None
+        # The transfer syntax of the received dataset if it's been changed
+        #   from that of the presentation context by inflating it
+        self._data_set_transfer_syntax = None
+        # If the received dataset couldn't be inflated then the rest of the
+        #   dataset is discarded and the message is invalid
+        self._data_set_invalid = False
 
         cls_name = self.__class__.__name__
         if cls_name == 'DIMSEMessage':
             return
 
         # Set the command set attributes for the subclasses
-        for keyword in _COMMAND_SET_KEYWORDS[cls_name.replace('_', '-')]:
-            setattr(self.command_set, keyword, None)
+        self._command_values = dict.fromkeys(
+            _COMMAND_SET_KEYWORDS[cls_name.replace('_', '-')]
+        )
+
+    @property
+    def command_set(self):
+        """Return the Command Set as a :class:`~pydicom.dataset.Dataset`.
+
+        The dataset is created when first accessed.
+        """
+        if self._command_set is None:
+            ds = Dataset()
+            for keyword, value in self._command_values.items():
+                setattr(ds, keyword, value)
+
+            self._command_set = ds
+
+        return self._command_set
+
+    @command_set.setter
+    def command_set(self, ds):
+        """Set the Command Set :class:`~pydicom.dataset.Dataset`."""
+        self._command_set = ds
+
+    def _get_command_values(self):
+        """Return the current Command Set as ``{keyword: value}``."""
+        if self._command_set is None:
+            return self._command_values
+
+        # The `command_set` dataset has been accessed and may have been
+        #   changed, so use it instead
+        return {elem.keyword: elem.value for elem in self.command_set}
 
     def decode_msg(self, primitive, assoc=None):
         """Converts P-DATA primitives into a ``DIMSEMessage`` sub-class.
@@ -259,12 +675,12 @@ class DIMSEMessage(object):
             The association processing the message. This is required when:
 
             * :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` is
-              ``True``
+              ``True`` or a handler is bound to ``evt.EVT_C_STORE_SINK``
             * The P-DATA primitive contains part of a C-STORE-RQ message
 
             In this case the association is consulted for its accepted
             transfer syntax, which is included in the File Meta Information
-            of the stored dataset.
+            of the stored dataset, and for the sink to write the dataset to.
 
         Returns
         -------
@@ -292,6 +708,8 @@ class DIMSEMessage(object):
             # xxxxxx10 - Message Dataset information, the last fragment
             # xxxxxx11 - Command information, the last fragment
             control_header_byte = data[0]
+            # Avoid copying the fragment data
+            fragment = memoryview(data)[1:]
 
             # LOGGER.debug('Control header byte %s', control_header_byte)
             #print(f'Control header byte {control_header_byte}')
@@ -303,9 +721,9 @@ class DIMSEMessage(object):
                 # The command set may be spread out over a number
                 #   of fragments and P-DATA primitives and we need to remember
                 #   the elements from previous fragments, hence the
-                #   encoded_command_set class attribute
+                #   _command_fragments class attribute
                 # This adds all the command set data to the class object
-                self.encoded_command_set.write(data[1:])
+                self._command_fragments.append(fragment)
 
                 # The final command set fragment (xxxxxx11) has been added
                 #   so decode the command set
@@ -315,55 +733,35 @@ class DIMSEMessage(object):
                     #   fragment and command set must always be present
                     self.context_id = context_id
 
+                    # BytesIO doesn't copy bytes when initialised
+                    self.encoded_command_set = BytesIO(
+                        b''.join(self._command_fragments)
+                    )
+                    self._command_fragments = []
+
                     # Command Set is always encoded Implicit VR Little Endian
-                    #   decode(dataset, is_implicit_VR, is_little_endian)
-                    # pylint: disable=attribute-defined-outside-init
-                    self.command_set = decode(
-                        self.encoded_command_set, True, True
+                    cs = _decode_command_set(
+                        self.encoded_command_set.getbuffer()
                     )
+                    self._command_values = cs
+                    self._command_set = None
 
                     # Determine which DIMSE Message class to use
-                    self.__class__ = (
-                        _MESSAGE_TYPES[self.command_set.CommandField][1]
-                    )
+                    self.__class__ = _MESSAGE_TYPES[cs['CommandField']][1]
 
                     # Determine if a Data Set is present by checking for
                     #   (0000, 0800) CommandDataSetType US 1. If the value is
                     #   0x0101 no dataset present, otherwise one is.
-                    if self.command_set.CommandDataSetType == 0x0101:
+                    if cs.get('CommandDataSetType') == 0x0101:
                         # By returning True we're indicating that the message
                         #   has been completely decoded
                         return True
 
                     # Data Set is present
-                    if (
-                        _config.STORE_RECV_CHUNKED_DATASET
-                        and isinstance(self, C_STORE_RQ)
-                    ):
-                        # delete=False is a workaround for Windows
-                        # Setting delete=True prevents us from re-opening
-                        # the file after it is opened by NamedTemporaryFile
-                        # below.
-                        self._data_set_file = NamedTemporaryFile(
-                            delete=False,
-                            mode="wb",
-                            suffix=".dcm"
-                        )
-                        self._data_set_path = Path(self._data_set_file.name)
-                        # Write the File Meta
-                        self._data_set_file.write(b'\x00' * 128)
-                        self._data_set_file.write(b'DICM')
-
-                        cs = self.command_set
-                        cx = assoc._accepted_cx[context_id]
-                        write_file_meta_info(
-                            self._data_set_file,
-                            create_file_meta(
-                                sop_class_uid=cs.AffectedSOPClassUID,
-                                sop_instance_uid=cs.AffectedSOPInstanceUID,
-                                transfer_syntax=cx.transfer_syntax[0]
-                            )
-                        )
+                    if assoc and isinstance(self, C_STORE_RQ):
+                        self._data_set_sink = self._get_data_set_sink(assoc)
+                        if self._data_set_sink is None:
+                            self._prepare_data_set(assoc)
 
             # DATA SET
             # P-DATA fragment contains Data Set information
@@ -372,13 +770,32 @@ class DIMSEMessage(object):
                 # As with the command set, the data set may be spread over
                 #   a number of fragments in each P-DATA primitive and a
                 #   number of P-DATA primitives.
-                if self._data_set_file:
-                    self._data_set_file.write(data[1:])
+                if self._data_set_inflater is not None:
+                    fragment = self._inflate_fragment(
+                        fragment, control_header_byte & 2
+                    )
+
+                if self._data_set_invalid:
+                    # Discard the rest of the dataset
+                    pass
+                elif self._data_set_sink is not None:
+                    self._write_to_sink(fragment)
+                elif self._data_set_file:
+                    self._data_set_file.write(fragment)
                 else:
-                    self.data_set.write(data[1:])
+                    self._data_set_fragments.append(fragment)
+                    if self._data_set_spill:
+                        self._reserve_or_spill(len(fragment))
 
                 # The final data set fragment (xxxxxx10) has been added
                 if control_header_byte & 2 != 0:
+                    if (
+                        self._data_set_sink is None
+                        and not self._data_set_file
+                        and not self._data_set_invalid
+                    ):
+                        self._join_data_set()
+
                     # By returning True we're indicating that the message
                     #   has been completely decoded
                     return True
@@ -386,6 +803,252 @@ class DIMSEMessage(object):
         # We return False to indicate that the message isn't yet fully decoded
         return False
 
+    def __del__(self):
+        """Release any memory reserved by a partially received dataset."""
+        if self.__dict__.get('_data_set_reserved'):
+            self._release_reserved()
+
+    def _create_data_set_file(self, transfer_syntax):
+        """Create a temporary file for a C-STORE request's *Data Set* and
+        write the File Meta Information to it.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        transfer_syntax : pydicom.uid.UID
+            The transfer syntax of the *Data Set*.
+        """
+        # delete=False is a workaround for Windows
+        # Setting delete=True prevents us from re-opening
+        # the file after it is opened by NamedTemporaryFile
+        # below.
+        self._data_set_file = NamedTemporaryFile(
+            delete=False,
+            mode="wb",
+            suffix=".dcm"
+        )
+        self._data_set_path = Path(self._data_set_file.name)
+        # Write the File Meta
+        self._data_set_file.write(b'\x00' * 128)
+        self._data_set_file.write(b'DICM')
+
+        cs = self._command_values
+        write_file_meta_info(
+            self._data_set_file,
+            create_file_meta(
+                sop_class_uid=cs['AffectedSOPClassUID'],
+                sop_instance_uid=cs['AffectedSOPInstanceUID'],
+                transfer_syntax=transfer_syntax
+            )
+        )
+
+    def _prepare_data_set(self, assoc):
+        """Prepare to receive a C-STORE request's *Data Set*.
+
+        .. versionadded:: 2.0
+
+        Deflated datasets are inflated as they're received, and the *Data Set*
+        may be written to a temporary file rather than kept in memory.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association processing the message.
+        """
+        cx = assoc._accepted_cx.get(self.context_id)
+        if cx is None:
+            # Invalid context ID, the message will be rejected once received
+            return
+
+        transfer_syntax = cx.transfer_syntax[0]
+        if transfer_syntax.is_deflated:
+            self._data_set_inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+            transfer_syntax = ExplicitVRLittleEndian
+            self._data_set_transfer_syntax = transfer_syntax
+
+        if _config.STORE_RECV_CHUNKED_DATASET:
+            self._create_data_set_file(transfer_syntax)
+        elif (
+            assoc.ae.store_recv_spill_threshold is not None
+            or _config.STORE_RECV_MEMORY_BUDGET is not None
+        ):
+            self._data_set_spill = (
+                assoc.ae.store_recv_spill_threshold, transfer_syntax
+            )
+
+    def _inflate_fragment(self, fragment, is_last):
+        """Return the inflated data for a deflated *Data Set* `fragment`.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        fragment : memoryview
+            The received *Data Set* fragment.
+        is_last : bool
+            ``True`` if `fragment` is the last fragment of the *Data Set*.
+
+        Returns
+        -------
+        bytes
+            The inflated data, which may be empty.
+        """
+        try:
+            data = self._data_set_inflater.decompress(fragment)
+            if is_last:
+                data += self._data_set_inflater.flush()
+        except zlib.error as exc:
+            LOGGER.error(
+                "Unable to inflate the received C-STORE request's dataset, "
+                "the rest of the dataset will be discarded"
+            )
+            LOGGER.exception(exc)
+            self._data_set_inflater = None
+            self._data_set_invalid = True
+            self._data_set_fragments = []
+            self._release_reserved()
+            return b''
+
+        return data
+
+    def _join_data_set(self):
+        """Join the received *Data Set* fragments.
+
+        .. versionadded:: 2.0
+
+        Joining the fragments briefly needs a second copy of the *Data Set*,
+        so if the memory used is being limited then the copy is reserved as
+        well, and if it won't fit within the budget the *Data Set* is written
+        to a temporary file instead. The memory reserved for the joined
+        *Data Set* is kept until the request has been handled.
+        """
+        nr_bytes = self._data_set_reserved
+        if nr_bytes:
+            budget = _config.STORE_RECV_MEMORY_BUDGET
+            if not _STORE_RECV_MEMORY.reserve(nr_bytes, budget):
+                self._spill()
+                return
+
+        try:
+            self.data_set = BytesIO(b''.join(self._data_set_fragments))
+            self._data_set_fragments = []
+        finally:
+            if nr_bytes:
+                _STORE_RECV_MEMORY.release(nr_bytes)
+
+    def _release_reserved(self):
+        """Release the memory reserved for the *Data Set*."""
+        if self._data_set_reserved:
+            _STORE_RECV_MEMORY.release(self._data_set_reserved)
+            self._data_set_reserved = 0
+
+    def _reserve_or_spill(self, nr_bytes):
+        """Reserve memory for a received *Data Set* fragment or move the
+        *Data Set* to a temporary file if it's too large.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        nr_bytes : int
+            The length of the fragment that was just received.
+        """
+        threshold, transfer_syntax = self._data_set_spill
+        size = self._data_set_reserved + nr_bytes
+        if threshold is None or size <= threshold:
+            budget = _config.STORE_RECV_MEMORY_BUDGET
+            if _STORE_RECV_MEMORY.reserve(nr_bytes, budget):
+                self._data_set_reserved += nr_bytes
+                return
+
+        self._spill()
+
+    def _spill(self):
+        """Move the *Data Set* received so far to a temporary file and write
+        the rest of the *Data Set* to the file as it arrives.
+
+        .. versionadded:: 2.0
+        """
+        transfer_syntax = self._data_set_spill[1]
+        LOGGER.debug(
+            "Received dataset exceeds the memory threshold or budget, "
+            "writing it to a temporary file"
+        )
+        self._release_reserved()
+        self._data_set_spill = None
+        self._create_data_set_file(transfer_syntax)
+        for fragment in self._data_set_fragments:
+            self._data_set_file.write(fragment)
+
+        self._data_set_fragments = []
+
+    def _get_data_set_sink(self, assoc):
+        """Return the object to write a C-STORE request's *Data Set* to.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association processing the message.
+
+        Returns
+        -------
+        object or None
+            The object returned by the handler bound to
+            ``evt.EVT_C_STORE_SINK``, or ``None`` if the default handler is
+            bound or the handler raised an exception.
+        """
+        handler = assoc.get_handlers(evt.EVT_C_STORE_SINK)
+        if not handler or handler[0] in (None, evt._c_store_sink_handler):
+            return None
+
+        try:
+            return evt.trigger(
+                assoc,
+                evt.EVT_C_STORE_SINK,
+                {
+                    'request': self.message_to_primitive(),
+                    'context': assoc._accepted_cx[self.context_id].as_tuple,
+                }
+            )
+        except Exception as exc:
+            LOGGER.error(
+                "Exception in the handler bound to 'evt.EVT_C_STORE_SINK', "
+                "the C-STORE request's dataset will be received normally"
+            )
+            LOGGER.exception(exc)
+
+        return None
+
+    def _write_to_sink(self, fragment):
+        """Write a *Data Set* `fragment` to the C-STORE request's sink.
+
+        .. versionadded:: 2.0
+
+        If the sink raises an exception then it's logged, the rest of the
+        *Data Set* is discarded and the exception is made available to the
+        ``evt.EVT_C_STORE`` handler.
+
+        Parameters
+        ----------
+        fragment : memoryview
+            The encoded *Data Set* fragment.
+        """
+        if self._data_set_sink_error is not None:
+            return
+
+        try:
+            self._data_set_sink.write(fragment)
+        except Exception as exc:
+            LOGGER.error(
+                "Exception raised writing to the C-STORE request's dataset "
+                "sink, the rest of the dataset will be discarded"
+            )
+            LOGGER.exception(exc)
+            self._data_set_sink_error = exc
+
     def encode_msg(self, context_id, max_pdu_length):
         """Yield P-DATA primitives for the current DIMSE Message.
 
@@ -428,8 +1091,7 @@ class DIMSEMessage(object):
         self.context_id = context_id
 
         # The Command Set is always Little Endian Implicit VR (PS3.7 6.3.1)
-        #   encode(dataset, is_implicit_VR, is_little_endian)
-        encoded_command_set = encode(self.command_set, True, True)
+        encoded_command_set = self._encode_command_set()
 
         # COMMAND SET (always)
         # Split the command set into fragments with maximum size max_pdu_length
@@ -462,8 +1124,11 @@ class DIMSEMessage(object):
         # DATASET (if available)
         #   Check that the Data Set is not empty
         if self.data_set is not None:
-            encoded_data_set = self.data_set.getvalue()
-            if encoded_data_set:
+            # Use a view of the buffer to avoid copying the dataset
+            with self.data_set.getbuffer() as encoded_data_set:
+                if not encoded_data_set:
+                    return
+
                 # Split the data set into fragments with maximum
                 #   size max_pdu_length
                 if max_pdu_length == 0:
@@ -495,29 +1160,99 @@ class DIMSEMessage(object):
             # Read and send encoded dataset from file
             # Buffer size determined by io.DEFAULT_BUFFER_SIZE
             with open(self._data_set_path[0], 'rb') as f:
-                end = f.seek(0, 2)
-                length = end - f.seek(self._data_set_path[1])
+                f.seek(self._data_set_path[1])
+                yield from self._encode_source(f, context_id, max_pdu_length)
+        elif self._data_set_source is not None:
+            # Read and send encoded dataset from a streaming source
+            yield from self._encode_source(
+                self._data_set_source, context_id, max_pdu_length
+            )
 
-                if max_pdu_length == 0:
-                    nr_fragments = 1
-                    max_pdu_length = length + 6
-                else:
-                    nr_fragments = ceil(length / (max_pdu_length - 6))
+    def _encode_source(self, source, context_id, max_pdu_length):
+        """Yield P-DATA primitives for the encoded dataset in `source`.
 
-                # First to (n - 1)th dataset fragment - bits xxxxxx00
-                for ii in range(int(nr_fragments - 1)):
-                    pdata = P_DATA()
-                    pdata.presentation_data_value_list.append(
-                        [context_id, b'\x00' + f.read(max_pdu_length - 6)]
-                    )
-                    yield pdata
+        .. versionadded:: 2.0
 
-                # Last dataset fragment - bits xxxxxx10
-                pdata = P_DATA()
-                pdata.presentation_data_value_list.append(
-                    [context_id, b'\x02' + f.read(max_pdu_length - 6)]
+        Parameters
+        ----------
+        source : file-like, bytes-like or iterable of bytes
+            The encoded dataset, see
+            :class:`~pynetdicom.dsutils.EncodedDataset` for the allowed
+            types.
+        context_id : int
+            The *ID* of the agreed presentation context.
+        max_pdu_length : int
+            The maximum PDV length (in bytes).
+
+        Yields
+        ------
+        pdu_primitives.P_DATA
+            The dataset fragments as P-DATA service primitives.
+        """
+        fragments = self._generate_source_fragments(source, max_pdu_length)
+        for fragment, is_last in fragments:
+            # First to (n - 1)th dataset fragment - bits xxxxxx00
+            # Last dataset fragment - bits xxxxxx10
+            pdata = P_DATA()
+            pdata.presentation_data_value_list.append(
+                [context_id, (b'\x02' if is_last else b'\x00') + fragment]
+            )
+            yield pdata
+
+    @staticmethod
+    def _generate_source_fragments(source, fragment_length):
+        """Yield fragments of the encoded dataset read from `source`.
+
+        .. versionadded:: 2.0
+
+        Data is only read from `source` as each fragment is required and
+        one fragment is read ahead so the final fragment can be identified.
+
+        Parameters
+        ----------
+        source : file-like, bytes-like or iterable of bytes
+            The encoded dataset, see
+            :class:`~pynetdicom.dsutils.EncodedDataset` for the allowed
+            types.
+        fragment_length : int
+            The maximum size of each fragment, a value of 0 is taken to mean
+            the fragment is infinite. Cannot be between 1 and 7.
+
+        Yields
+        ------
+        bytes or memoryview, bool
+            A fragment with maximum length `fragment_length` (less the 6 bytes
+            required for the PDV item header) and ``True`` if it's the final
+            fragment, ``False`` otherwise. At least one fragment will always
+            be yielded.
+        """
+        if 0 < fragment_length < 7:
+            raise ValueError("'fragment_length' cannot be between 1 and 7.")
+
+        # Because the PDV item includes an extra 6 bytes of data at the start
+        #   we need to decrease `fragment_length` by 6 bytes.
+        size = max(fragment_length - 6, -1)
+
+        if hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(size), b'')
+        else:
+            try:
+                view = memoryview(source).cast('B')
+                if size == -1:
+                    size = max(len(view), 1)
+
+                chunks = (
+                    view[ii:ii + size] for ii in range(0, len(view), size)
                 )
-                yield pdata
+            except TypeError:
+                chunks = _rechunk(source, size)
+
+        previous = next(chunks, b'')
+        for chunk in chunks:
+            yield previous, False
+            previous = chunk
+
+        yield previous, True
 
     @staticmethod
     def _generate_pdv_fragments(bytestream, fragment_length):
@@ -536,7 +1271,7 @@ class DIMSEMessage(object):
 
         Parameters
         ----------
-        bytestream : bytes
+        bytestream : bytes or memoryview
             The data to be fragmented.
         fragment_length : int
             The maximum size of each fragment, a value of 0 is taken to mean
@@ -548,7 +1283,7 @@ class DIMSEMessage(object):
 
         Yields
         ------
-        fragment : bytes
+        fragment : bytes or memoryview
             A `bytestream` fragment, with maximum length `fragment_length`, but
             may be smaller depending on the size of `bytestream`.
 
@@ -582,6 +1317,15 @@ class DIMSEMessage(object):
             :ref:`pynetdicom.dimse_primitives<api_dimse_primitives>` generated
             from the current ``DIMSEMessage`` sub-class object.
         """
+        if self._data_set_invalid:
+            if self._data_set_file:
+                self._data_set_file.close()
+                self._data_set_path.unlink()
+
+            raise ValueError(
+                "The received C-STORE request's dataset couldn't be inflated"
+            )
+
         cls_type_name = self.__class__.__name__
         final_underscore = cls_type_name.rfind('_R')
         primitive = _MSG_TO_PRIMITVE[cls_type_name[:final_underscore]]()
@@ -589,13 +1333,18 @@ class DIMSEMessage(object):
         # Command Set
         # For each parameter in the primitive, set the appropriate value
         #   from the Message's Command Set elements
-        for elem in self.command_set:
-            if hasattr(primitive, elem.keyword):
-                value = elem.value
-                if elem.VM > 1 and elem.tag not in _MULTIVALUE_TAGS:
-                    LOGGER.warning(f"Non-conformant VM {elem.VM} for '{elem.keyword}', taking the first value")
+        for keyword, value in self._get_command_values().items():
+            if hasattr(primitive, keyword):
+                if (
+                    isinstance(value, (list, MultiValue))
+                    and keyword not in _MULTIVALUE_KEYWORDS
+                ):
+                    LOGGER.warning(
+                        f"Non-conformant VM {len(value)} for '{keyword}', "
+                        "taking the first value"
+                    )
                     value = value[0]
-                setattr(primitive, elem.keyword, value)
+                setattr(primitive, keyword, value)
 
         # Datasets
         # Set the primitive's DataSet/Identifier/etc attribute
@@ -610,6 +1359,17 @@ class DIMSEMessage(object):
 
         primitive._dataset_path = self._data_set_path
         primitive._dataset_file = self._data_set_file
+        primitive._dataset_sink = self._data_set_sink
+        primitive._dataset_sink_error = self._data_set_sink_error
+        primitive._dataset_transfer_syntax = self._data_set_transfer_syntax
+
+        # The memory reserved for the dataset is released once the request
+        #   has been handled
+        if self._data_set_reserved:
+            primitive._dataset_reservation = _Reservation(
+                self._data_set_reserved
+            )
+            self._data_set_reserved = 0
 
         return primitive
 
@@ -632,35 +1392,28 @@ class DIMSEMessage(object):
             )
 
         # Command Set
-        # Convert the message command set to the primitive attributes
-        for elem in self.command_set:
-            # Use the element keyword as these should match the parameter
-            #   names in the primitive
-            if hasattr(primitive, elem.keyword):
-                # If value hasn't been set for a parameter then delete
-                #   the corresponding element
-                attr = getattr(primitive, elem.keyword)
-                if attr is not None:
-                    elem.value = attr
-                else:
-                    del self.command_set[elem.tag]
+        # Convert the primitive attributes to the message command set, the
+        #   primitive parameter names match the element keywords and
+        #   parameters without a value are left out
+        cs = {}
+        for keyword in _COMMAND_SET_KEYWORDS[cls_type_name]:
+            value = getattr(primitive, keyword, None)
+            if value is not None:
+                cs[keyword] = value
 
-        # Theres a one-to-one relationship in the _MESSAGE_TYPES dict, so
-        #   invert it for convenience
-        rev_type = {vv[0]: kk for kk, vv in _MESSAGE_TYPES.items()}
-        self.command_set.CommandField = rev_type[cls_type_name]
+        cs['CommandField'] = _COMMAND_FIELDS[cls_type_name]
 
         # Data Set
         # Default to no Data Set
         self.data_set = BytesIO()
-        self.command_set.CommandDataSetType = 0x0101
+        cs['CommandDataSetType'] = 0x0101
 
         try:
             # These message types *may* have a dataset
             dataset_keyword = _DATASET_KEYWORDS[self.__class__.__name__]
             self.data_set = getattr(primitive, dataset_keyword)
             if self.data_set:
-                self.command_set.CommandDataSetType = 0x0001
+                cs['CommandDataSetType'] = 0x0001
         except KeyError:
             # The following message types never have a dataset
             # 'C_ECHO_RQ', 'C_ECHO_RSP', 'N_DELETE_RQ', 'C_STORE_RSP',
@@ -668,26 +1421,76 @@ class DIMSEMessage(object):
             pass
 
         self._data_set_path = getattr(primitive, "_dataset_path", None)
-        if self._data_set_path:
-            self.command_set.CommandDataSetType = 0x0001
+        self._data_set_source = getattr(primitive, "_dataset_source", None)
+        if self._data_set_path or self._data_set_source is not None:
+            cs['CommandDataSetType'] = 0x0001
 
-        # Set the Command Set length
-        self._set_command_group_length()
+        # Encode the Command Set now so the Command Group Length is available
+        if cls_type_name.endswith('RSP'):
+            encoded = _encode_response_command_set(cls_type_name, cs)
+        else:
+            encoded = _encode_command_set(cs)
+        cs['CommandGroupLength'] = len(encoded) - 12
+        self._command_values = cs
+        self._encoded_command_values = encoded
+        self._command_set = None
+
+    def _encode_command_set(self):
+        """Return the encoded Command Set as :class:`bytes`.
+
+        The Command Set is encoded directly from its values unless the
+        :attr:`~DIMSEMessage.command_set` dataset has been accessed, in which
+        case the dataset is encoded instead as it may have been modified.
+        """
+        if self._command_set is None:
+            if self._encoded_command_values is None:
+                self._encoded_command_values = _encode_command_set(
+                    self._command_values
+                )
 
-    def _set_command_group_length(self):
-        """Reset the Command Group Length element value.
+            return self._encoded_command_values
 
-        Once the `command_set` Dataset has been built and filled with
-        values, this should be called to set the (Command Group Length* element
-        value correctly.
-        """
-        # Remove CommandGroupLength to stop it messing up the length calc
-        del self.command_set.CommandGroupLength
+        cs = self.command_set
+        if all(elem.keyword in _COMMAND_SET_ELEMENTS for elem in cs):
+            return _encode_command_set(self._get_command_values())
+
+        # Non-standard command set elements, so use pydicom instead
+        if 'CommandGroupLength' in cs:
+            del cs.CommandGroupLength
+
+        encoded = encode(cs, True, True)
+        cs.CommandGroupLength = len(encoded)
+
+        return encode(cs, True, True)
 
-        # The Command Set is always Implicit VR Little Endian
-        self.command_set.CommandGroupLength = len(
-            encode(self.command_set, True, True)
-        )
+
+def _rechunk(iterable, size):
+    """Yield the bytes-like items from `iterable` as `size` long chunks.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    iterable : iterable of bytes
+        The data to re-chunk, each item may be any length.
+    size : int
+        The length of each chunk, the final chunk may be shorter. If ``-1``
+        then yield all the data as a single chunk.
+
+    Yields
+    ------
+    bytes
+        A chunk of data.
+    """
+    buffer = bytearray()
+    for data in iterable:
+        buffer += data
+        while size != -1 and len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+
+    if buffer:
+        yield bytes(buffer)
 
 
 # Create DIMSEMessage subclasses and add them to the module
@@ -722,6 +1525,10 @@ _MESSAGE_TYPES = {
     0x8150: ('N-DELETE-RSP', N_DELETE_RSP),
 }
 
+# Theres a one-to-one relationship in the _MESSAGE_TYPES dict, so
+#   invert it for convenience
+_COMMAND_FIELDS = {vv[0]: kk for kk, vv in _MESSAGE_TYPES.items()}
+
 _DATASET_KEYWORDS = {
     'C_STORE_RQ' : 'DataSet',
     'C_FIND_RQ' : 'Identifier',
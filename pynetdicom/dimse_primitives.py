@@ -31,6 +31,10 @@ class DIMSEPrimitive(object):
     REQUEST_KEYWORDS = ()
     RESPONSE_KEYWORDS = ('MessageIDBeingRespondedTo', 'Status')
 
+    # A dataset-like parameter that has already been decoded, as
+    #   (parameter name, hash of the encoded parameter, decoded dataset)
+    _decoded = None
+
     @property
     def AffectedSOPClassUID(self):
         """Return the *Affected SOP Class UID* as :class:`~pydicom.uid.UID`."""
@@ -538,6 +542,36 @@ class C_STORE(DIMSEPrimitive):
         #   If not None then _dataset_file backs the dataset stored
         #   at _dataset_path
         self._dataset_file = None
+        # If we are sending a C-STORE service primitive:
+        #   If not None then the dataset will be read from the file-like,
+        #   bytes-like or iterable _dataset_source
+        # If we are receiving a C-STORE service primitive:
+        #   Always None
+        self._dataset_source = None
+        # If we are sending a C-STORE service primitive:
+        #   Always None
+        # If we are receiving a C-STORE service primitive:
+        #   If not None then the dataset has been written to the object
+        #   returned by the evt.EVT_C_STORE_SINK handler
+        self._dataset_sink = None
+        # If we are sending a C-STORE service primitive:
+        #   Always None
+        # If we are receiving a C-STORE service primitive:
+        #   If not None then the exception raised when writing to
+        #   _dataset_sink, which doesn't contain the complete dataset
+        self._dataset_sink_error = None
+        # If we are sending a C-STORE service primitive:
+        #   Always None
+        # If we are receiving a C-STORE service primitive:
+        #   If not None then the received deflated dataset has been inflated
+        #   and is now encoded using _dataset_transfer_syntax
+        self._dataset_transfer_syntax = None
+        # If we are sending a C-STORE service primitive:
+        #   Always None
+        # If we are receiving a C-STORE service primitive:
+        #   If not None then the memory reserved for the dataset, which is
+        #   released once the request has been handled
+        self._dataset_reservation = None
 
     @property
     def AffectedSOPInstanceUID(self):
@@ -1,16 +1,25 @@
 """DICOM dataset utility functions."""
 
+from collections import OrderedDict, namedtuple
+from itertools import chain
 import logging
+from struct import pack, unpack
+import threading
+import weakref
 import zlib
 
 from pydicom import Dataset
+from pydicom.datadict import dictionary_VR
+from pydicom.dataelem import DataElement, RawDataElement
 from pydicom.dataset import FileMetaDataset
 from pydicom.filebase import DicomBytesIO
 from pydicom.filereader import read_dataset, read_preamble
 from pydicom.filewriter import write_dataset
+from pydicom.sequence import Sequence
+from pydicom.uid import UID
 
 from pynetdicom import (
-    PYNETDICOM_IMPLEMENTATION_UID, PYNETDICOM_IMPLEMENTATION_VERSION
+    _config, PYNETDICOM_IMPLEMENTATION_UID, PYNETDICOM_IMPLEMENTATION_VERSION
 )
 from pynetdicom.utils import pretty_bytes
 
@@ -18,6 +27,77 @@ from pynetdicom.utils import pretty_bytes
 LOGGER = logging.getLogger('pynetdicom.dsutils')
 
 
+class EncodedDataset(object):
+    """An encoded dataset that can be sent without being decoded.
+
+    .. versionadded:: 2.0
+
+    Used with :meth:`Association.send_c_store()
+    <pynetdicom.association.Association.send_c_store>` to send a dataset
+    that's already been encoded, such as one held in object storage or a
+    database, without needing to read it all into memory or write it to a
+    local file first. The dataset will be read in chunks no larger than the
+    maximum PDU size allowed by the peer as the P-DATA primitives are being
+    sent.
+
+    As the dataset isn't decoded its encoding can only be changed between
+    *Implicit VR Little Endian*, *Explicit VR Little Endian* and *Deflated
+    Explicit VR Little Endian*, which is done while the dataset is being
+    sent. Otherwise an accepted presentation context with a matching transfer
+    syntax will be required.
+
+    Examples
+    --------
+
+    Send a dataset (without the File Meta Information) from an open file
+
+    >>> from pynetdicom.dsutils import EncodedDataset
+    >>> with open('dataset.raw', 'rb') as f:
+    ...     ds = EncodedDataset(
+    ...         f, '1.2.840.10008.5.1.4.1.1.2', '1.2.3.4', '1.2.840.10008.1.2'
+    ...     )
+    ...     status = assoc.send_c_store(ds)
+
+    Attributes
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The encoded dataset, without any File Meta Information, as one of:
+
+        * A readable binary file-like, which is read from its current position
+          until the end of the file
+        * A bytes-like object supporting the buffer protocol, such as
+          :class:`bytes`, :class:`memoryview` or :class:`mmap.mmap`
+        * An iterable that yields the encoded dataset as bytes-like chunks of
+          any size
+
+        File-likes and iterators can only be sent once.
+    sop_class_uid : pydicom.uid.UID
+        The dataset's *SOP Class UID*.
+    sop_instance_uid : pydicom.uid.UID
+        The dataset's *SOP Instance UID*.
+    transfer_syntax : pydicom.uid.UID
+        The transfer syntax the dataset has been encoded with.
+    """
+    def __init__(
+        self, source, sop_class_uid, sop_instance_uid, transfer_syntax
+    ):
+        """Create a new ``EncodedDataset``.
+
+        Parameters
+        ----------
+        source : file-like, bytes-like or iterable of bytes
+            The encoded dataset.
+        sop_class_uid : pydicom.uid.UID or str
+            The dataset's *SOP Class UID*.
+        sop_instance_uid : pydicom.uid.UID or str
+            The dataset's *SOP Instance UID*.
+        transfer_syntax : pydicom.uid.UID or str
+            The transfer syntax the dataset has been encoded with.
+        """
+        self.source = source
+        self.sop_class_uid = UID(sop_class_uid)
+        self.sop_instance_uid = UID(sop_instance_uid)
+        self.transfer_syntax = UID(transfer_syntax)
 
 
 def create_file_meta(
@@ -67,13 +147,18 @@ def create_file_meta(
     return file_meta
 
 
-def decode(bytestring, is_implicit_vr, is_little_endian, deflated=False):
+def decode(bytestring, is_implicit_vr, is_little_endian, deflated=False,
+           specific_tags=None):
     """Decode `bytestring` to a *pydicom* :class:`~pydicom.dataset.Dataset`.
 
     .. versionchanged:: 1.5
 
         Added `deflated` keyword parameter
 
+    .. versionchanged:: 2.0
+
+        Added `specific_tags` keyword parameter
+
     Parameters
     ----------
     byestring : io.BytesIO
@@ -87,6 +172,10 @@ def decode(bytestring, is_implicit_vr, is_little_endian, deflated=False):
     deflated : bool, optional
         ``True`` if the dataset has been encoded using *Deflated Explicit VR
         Little Endian* transfer syntax (default ``False``).
+    specific_tags : list of (int or str), optional
+        If used then only decode the top-level elements with the given tags
+        or keywords, the remaining elements are skipped over. The (0008,0005)
+        *Specific Character Set* element is always decoded if present.
 
     Returns
     -------
@@ -118,7 +207,12 @@ def decode(bytestring, is_implicit_vr, is_little_endian, deflated=False):
         bytestring.is_little_endian = is_little_endian
 
     # Decode the dataset
-    return read_dataset(bytestring, is_implicit_vr, is_little_endian)
+    return read_dataset(
+        bytestring,
+        is_implicit_vr,
+        is_little_endian,
+        specific_tags=specific_tags
+    )
 
 
 def encode(ds, is_implicit_vr, is_little_endian, deflated=False):
@@ -296,3 +390,1224 @@ def split_dataset(fpath):
             stop_when=_not_group_0002
         )
         return file_meta, fp.tell()
+
+
+def _read_chunks(fpath, offset=0, chunk_size=1048576):
+    """Yield the contents of the file at `fpath` in chunks.
+
+    .. versionadded:: 2.0
+
+    The file is only opened once iteration starts and is closed when the
+    generator is exhausted or garbage collected.
+
+    Parameters
+    ----------
+    fpath : pathlib.Path
+        The path to the file to read.
+    offset : int, optional
+        The byte offset to start reading from, default ``0``.
+    chunk_size : int, optional
+        The maximum number of bytes to read at a time, default 1 MiB.
+
+    Yields
+    ------
+    bytes
+        The next chunk of the file.
+    """
+    with open(fpath, 'rb') as f:
+        f.seek(offset)
+        yield from iter(lambda: f.read(chunk_size), b'')
+
+
+def _iter_source(source, chunk_size=1048576):
+    """Yield the encoded data from `source` in chunks.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The encoded data, see :class:`EncodedDataset` for the allowed types.
+    chunk_size : int, optional
+        The maximum number of bytes to yield at a time when `source` is
+        file-like or bytes-like, default 1 MiB.
+
+    Yields
+    ------
+    bytes or memoryview
+        The next chunk of data.
+    """
+    if hasattr(source, 'read'):
+        yield from iter(lambda: source.read(chunk_size), b'')
+        return
+
+    try:
+        view = memoryview(source).cast('B')
+    except TypeError:
+        yield from source
+        return
+
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset:offset + chunk_size]
+
+
+def _deflate(source, chunk_size=1048576):
+    """Yield the data from `source` compressed as required by the *Deflated
+    Explicit VR Little Endian* transfer syntax.
+
+    .. versionadded:: 2.0
+
+    The data is compressed as it's read from `source` so the compressed data
+    is never held in memory all at once.
+
+    Parameters
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The data to compress, see :class:`EncodedDataset` for the allowed
+        types.
+    chunk_size : int, optional
+        The maximum number of bytes to compress at a time when `source` is
+        file-like or bytes-like, default 1 MiB.
+
+    Yields
+    ------
+    bytes
+        The next chunk of compressed data, the total length of all the chunks
+        will be even.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+    )
+    length = 0
+    for chunk in _iter_source(source, chunk_size):
+        data = compressor.compress(chunk)
+        if data:
+            length += len(data)
+            yield data
+
+    data = compressor.flush()
+    data += b'\x00' if (length + len(data)) % 2 else b''
+    if data:
+        yield data
+
+
+def _inflate(source, chunk_size=1048576):
+    """Yield the data from `source` decompressed as required by the
+    *Deflated Explicit VR Little Endian* transfer syntax.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The data to decompress, see :class:`EncodedDataset` for the allowed
+        types.
+    chunk_size : int, optional
+        The maximum number of bytes to decompress at a time when `source` is
+        file-like or bytes-like, default 1 MiB.
+
+    Yields
+    ------
+    bytes
+        The next chunk of decompressed data.
+
+    Raises
+    ------
+    zlib.error
+        If the data in `source` isn't valid deflated data.
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    for chunk in _iter_source(source, chunk_size):
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+# VRs that use a 4 byte value length with explicit VR
+_EXPLICIT_LONG_VR = {
+    b'OB', b'OD', b'OF', b'OL', b'OV', b'OW', b'SQ', b'SV', b'UC', b'UN',
+    b'UR', b'UT', b'UV',
+}
+# Item, Item Delimitation Item and Sequence Delimitation Item tag groups
+_ITEM_GROUP = 0xFFFE
+_UNDEFINED_LENGTH = 0xFFFFFFFF
+_ITEM_DELIMITER = b'\xfe\xff\x0d\xe0\x00\x00\x00\x00'
+_SEQUENCE_DELIMITER = b'\xfe\xff\xdd\xe0\x00\x00\x00\x00'
+# Ambiguous VR elements that are always US
+_US_DESCRIPTORS = {0x00283002, 0x00281101, 0x00281102, 0x00281103}
+# Bits Allocated and Pixel Representation, used to resolve ambiguous VRs
+_PIXEL_TAGS = {0x00280100, 0x00280103}
+# Cache of {tag: VR} used when converting from implicit VR, cleared once it
+#   reaches _IMPLICIT_VR_SIZE tags
+_IMPLICIT_VR = {}
+_IMPLICIT_VR_SIZE = 4096
+
+
+class _StreamReader(object):
+    """Read from an encoded dataset source as though it were a file.
+
+    .. versionadded:: 2.0
+    """
+    def __init__(self, source, chunk_size=1048576):
+        self._chunks = _iter_source(source, chunk_size)
+        self._buffer = b''
+        # The offset in the source of the start of the buffer
+        self._offset = 0
+        # The position of the next unread byte in the buffer
+        self._pos = 0
+
+    def read(self, length):
+        """Return `length` bytes, or ``b''`` if there's no more data.
+
+        Raises
+        ------
+        EOFError
+            If there's some but less than `length` bytes of data remaining.
+        """
+        end = self._pos + length
+        while len(self._buffer) < end:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                if self._pos == len(self._buffer):
+                    return b''
+
+                raise EOFError("The encoded dataset ended unexpectedly")
+
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos:] + bytes(chunk)
+            self._pos = 0
+            end = length
+
+        data = self._buffer[self._pos:end]
+        self._pos = end
+        return data
+
+    def stream(self, length):
+        """Yield the next `length` bytes of data without buffering them."""
+        available = len(self._buffer) - self._pos
+        if available >= length:
+            yield self.read(length)
+            return
+
+        if available:
+            yield self._buffer[self._pos:]
+            length -= available
+
+        self._offset += len(self._buffer)
+        self._buffer = b''
+        self._pos = 0
+        while length:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                raise EOFError("The encoded dataset ended unexpectedly")
+
+            if len(chunk) > length:
+                self._buffer = bytes(chunk)
+                self._pos = length
+                yield chunk[:length]
+                return
+
+            self._offset += len(chunk)
+            length -= len(chunk)
+            yield chunk
+
+    def tell(self):
+        """Return the offset of the next unread byte."""
+        return self._offset + self._pos
+
+
+def _implicit_vr(tag, length, pixel_values):
+    """Return the explicit VR to use for an implicit VR element.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    tag : int
+        The element's tag.
+    length : int
+        The length of the element's value.
+    pixel_values : dict
+        The most recent (0028,0100) *Bits Allocated* and (0028,0103) *Pixel
+        Representation* values as ``{tag: value}``, used to resolve the
+        ambiguous ``'US or SS'`` VR and the VR of *Pixel Data*.
+
+    Returns
+    -------
+    bytes
+        The VR.
+    """
+    try:
+        vr = _IMPLICIT_VR[tag]
+    except KeyError:
+        group, elem = tag >> 16, tag & 0xFFFF
+        try:
+            vr = dictionary_VR(tag)
+        except KeyError:
+            if elem == 0x0000:
+                vr = 'UL'
+            elif group % 2 and 0x0010 <= elem <= 0x00FF:
+                vr = 'LO'
+            else:
+                vr = 'UN'
+
+        if tag == 0x7FE00010:
+            vr = 'OB or OW'
+        elif 'OW' in vr:
+            # 'OB or OW', 'US or OW' and 'US or SS or OW'
+            vr = 'OW'
+        elif tag in _US_DESCRIPTORS:
+            vr = 'US'
+
+        if len(_IMPLICIT_VR) >= _IMPLICIT_VR_SIZE:
+            _IMPLICIT_VR.clear()
+
+        _IMPLICIT_VR[tag] = vr
+
+    if vr == 'US or SS':
+        vr = 'SS' if pixel_values.get(0x00280103) else 'US'
+    elif vr == 'OB or OW':
+        # Pixel Data
+        vr = 'OW' if pixel_values.get(0x00280100, 16) > 8 else 'OB'
+
+    vr = vr.encode('ascii')
+    if length == _UNDEFINED_LENGTH:
+        # Only sequences may have an undefined length with implicit VR
+        return b'SQ'
+
+    if vr not in _EXPLICIT_LONG_VR and length > 0xFFFF:
+        # The value is too long to use the VR
+        return b'UN'
+
+    return vr
+
+
+def _transcode(source, to_implicit, chunk_size=1048576):
+    """Yield the data from `source` converted between *Implicit VR Little
+    Endian* and *Explicit VR Little Endian*.
+
+    .. versionadded:: 2.0
+
+    Only the element headers are rewritten, using the data dictionary to
+    look up the VR when converting from implicit VR, and the element values
+    are copied without being decoded. Sequences and items with a defined
+    length are converted to use an undefined length so the converted
+    data can be produced without having to hold a whole sequence in memory.
+
+    Parameters
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The encoded dataset to convert, see :class:`EncodedDataset` for the
+        allowed types.
+    to_implicit : bool
+        ``True`` to convert from explicit VR to implicit VR, ``False`` to
+        convert from implicit VR to explicit VR.
+    chunk_size : int, optional
+        The maximum number of bytes to read at a time when `source` is
+        file-like or bytes-like, default 1 MiB.
+
+    Yields
+    ------
+    bytes or memoryview
+        The next chunk of converted data.
+
+    Raises
+    ------
+    ValueError
+        If the dataset contains encapsulated data that can't be converted or
+        an element with an invalid VR.
+    EOFError
+        If the dataset ends unexpectedly.
+    """
+    reader = _StreamReader(source, chunk_size)
+    # Stack of (end offset, delimiter, parent uses implicit VR) for each
+    #   sequence and item being converted, the end offset and delimiter are
+    #   None if the sequence or item has an undefined length
+    nesting = []
+    implicit = not to_implicit
+    pixel_values = {}
+    while True:
+        # Close any sequences and items with a defined length that have ended
+        while nesting and nesting[-1][0] == reader.tell():
+            _, delimiter, implicit = nesting.pop()
+            yield delimiter
+
+        header = reader.read(4)
+        if not header:
+            break
+
+        group, elem = unpack('<HH', header)
+        if group == _ITEM_GROUP:
+            header += reader.read(4)
+            length = unpack('<L', header[4:])[0]
+            if elem != 0xE000:
+                # Item or Sequence Delimitation Item
+                if nesting:
+                    implicit = nesting.pop()[2]
+            elif length == _UNDEFINED_LENGTH:
+                nesting.append((None, None, implicit))
+            elif length:
+                nesting.append(
+                    (reader.tell() + length, _ITEM_DELIMITER, implicit)
+                )
+                header = header[:4] + b'\xff\xff\xff\xff'
+
+            yield header
+            continue
+
+        tag = group << 16 | elem
+        if implicit:
+            length = unpack('<L', reader.read(4))[0]
+            vr = b'SQ' if length == _UNDEFINED_LENGTH else None
+            if not to_implicit:
+                vr = _implicit_vr(tag, length, pixel_values)
+        else:
+            vr = reader.read(2)
+            if not (vr.isalpha() and vr.isupper()):
+                raise ValueError(
+                    f"Unable to convert the dataset as the element at offset "
+                    f"{reader.tell() - 6} has an invalid VR"
+                )
+
+            if vr in _EXPLICIT_LONG_VR:
+                length = unpack('<L', reader.read(6)[2:])[0]
+            else:
+                length = unpack('<H', reader.read(2))[0]
+
+            if length == _UNDEFINED_LENGTH and vr not in (b'SQ', b'UN'):
+                raise ValueError(
+                    "Unable to convert the dataset as it contains "
+                    "encapsulated data"
+                )
+
+        if vr == b'SQ' or length == _UNDEFINED_LENGTH:
+            if length == 0:
+                header += b'\x00\x00\x00\x00' if to_implicit else (
+                    b'SQ\x00\x00\x00\x00\x00\x00'
+                )
+                yield header
+                continue
+
+            if length == _UNDEFINED_LENGTH:
+                nesting.append((None, None, implicit))
+            else:
+                nesting.append(
+                    (reader.tell() + length, _SEQUENCE_DELIMITER, implicit)
+                )
+
+            # The items in an undefined length UN sequence use implicit VR
+            implicit = implicit or vr == b'UN'
+            header += b'\xff\xff\xff\xff' if to_implicit else (
+                b'SQ\x00\x00\xff\xff\xff\xff'
+            )
+            yield header
+            continue
+
+        if to_implicit:
+            header += pack('<L', length)
+        elif vr in _EXPLICIT_LONG_VR:
+            header += vr + b'\x00\x00' + pack('<L', length)
+        else:
+            header += vr + pack('<H', length)
+
+        yield header
+        if tag in _PIXEL_TAGS and length == 2:
+            value = reader.read(2)
+            pixel_values[tag] = unpack('<H', value)[0]
+            yield value
+        elif length:
+            yield from reader.stream(length)
+
+    if nesting:
+        raise EOFError("The encoded dataset ended unexpectedly")
+
+
+def _convert(source, original, transfer_syntax, chunk_size=1048576):
+    """Yield the encoded dataset from `source` converted to use
+    `transfer_syntax`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    source : file-like, bytes-like or iterable of bytes
+        The encoded dataset, see :class:`EncodedDataset` for the allowed
+        types.
+    original : pydicom.uid.UID
+        The transfer syntax used to encode the dataset, one of *Implicit VR
+        Little Endian*, *Explicit VR Little Endian* or *Deflated Explicit VR
+        Little Endian*.
+    transfer_syntax : pydicom.uid.UID
+        The transfer syntax to convert to, one of the same transfer syntaxes
+        as `original`.
+    chunk_size : int, optional
+        The maximum number of bytes to read at a time when `source` is
+        file-like or bytes-like, default 1 MiB.
+
+    Yields
+    ------
+    bytes or memoryview
+        The next chunk of converted data.
+    """
+    if original.is_deflated:
+        source = _inflate(source, chunk_size)
+
+    if original.is_implicit_VR != transfer_syntax.is_implicit_VR:
+        source = _transcode(
+            source, transfer_syntax.is_implicit_VR, chunk_size
+        )
+
+    if transfer_syntax.is_deflated:
+        source = _deflate(source, chunk_size)
+
+    yield from _iter_source(source, chunk_size)
+
+
+def _read_first(chunks):
+    """Return an iterator over `chunks` after reading its first chunk.
+
+    .. versionadded:: 2.0
+
+    Used to start converting an encoded dataset before sending it, so that
+    one that can't be converted is detected before the request is sent.
+
+    Parameters
+    ----------
+    chunks : iterator of bytes
+        The chunks to read, such as those yielded by :func:`_convert`.
+
+    Returns
+    -------
+    iterator of bytes
+        An iterator that yields the same chunks as `chunks`.
+    """
+    first = next(chunks, None)
+    if first is None:
+        return iter([])
+
+    return chain([first], chunks)
+
+
+def _fingerprint(ds, objects=None):
+    """Return a list of the element and value objects in `ds`.
+
+    .. versionadded:: 2.0
+
+    Changing an element's value replaces the value object, so if the objects
+    in two fingerprints of the same dataset are identical then its elements
+    haven't been added, removed or given new values.
+
+    Sequence elements reference their parent dataset, so they're represented
+    by their :func:`id` and number of items rather than the objects
+    themselves to avoid the fingerprint keeping the dataset alive. The
+    elements in the sequence items are still included.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset to fingerprint, including any sequence items.
+    objects : list, optional
+        The list to add the objects to.
+
+    Returns
+    -------
+    list
+        The fingerprint.
+    """
+    objects = [] if objects is None else objects
+    for elem in ds._dict.values():
+        value = elem.value
+        if elem.VR == 'SQ' and not isinstance(value, bytes):
+            items = value or []
+            objects.extend((id(elem), id(value), len(items)))
+            for item in items:
+                _fingerprint(item, objects)
+        else:
+            objects.append(elem)
+            objects.append(value)
+
+    return objects
+
+
+class _EncodeCache(object):
+    """A size-bounded LRU cache of encoded datasets.
+
+    .. versionadded:: 2.0
+
+    Datasets are identified by their identity and the encoding used, with a
+    fingerprint of the dataset's elements used to check it hasn't been
+    modified since it was encoded. An entry is removed as soon as its dataset
+    is garbage collected, so the fingerprint's references only keep alive
+    values that have been replaced since the dataset was encoded.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {(id(ds), is_implicit_vr, is_little_endian, deflated):
+        #     (weakref to ds, fingerprint, encoded dataset)}
+        self._cache = OrderedDict()
+        # Keys of the entries whose datasets were collected while the
+        #   lock was held
+        self._dead = []
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _collected(self, key, ref):
+        """Remove the entry for `key` after its dataset has been garbage
+        collected.
+
+        Parameters
+        ----------
+        key : tuple
+            The key for the entry.
+        ref : weakref.ref
+            The entry's (now dead) reference to the dataset.
+        """
+        # This may be called by the garbage collector at any time, including
+        #   while the lock is held by this thread
+        if not self._lock.acquire(blocking=False):
+            self._dead.append((key, ref))
+            return
+
+        try:
+            self._remove(key, ref)
+        finally:
+            self._lock.release()
+
+    def _remove(self, key, ref):
+        """Remove the entry for `key` if its reference is `ref`, the lock
+        must be held.
+        """
+        entry = self._cache.get(key)
+        if entry and entry[0] is ref:
+            del self._cache[key]
+            self.size -= len(entry[2])
+
+    def _purge(self):
+        """Remove the entries whose datasets were collected while the lock
+        was held, the lock must be held.
+        """
+        while self._dead:
+            self._remove(*self._dead.pop())
+
+    def clear(self):
+        """Remove all the encoded datasets from the cache and reset the
+        statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._dead.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def encode(self, ds, is_implicit_vr, is_little_endian, deflated, max_size,
+               encoder=None):
+        """Return the encoded `ds`, using the cache where possible.
+
+        Parameters
+        ----------
+        ds : pydicom.dataset.Dataset
+            The dataset to encode.
+        is_implicit_vr : bool
+            ``True`` for implicit VR, ``False`` for explicit VR.
+        is_little_endian : bool
+            ``True`` for little endian, ``False`` for big endian.
+        deflated : bool
+            ``True`` if the encoded dataset should be deflated.
+        max_size : int
+            The maximum total size of the cached datasets, in bytes.
+        encoder : callable, optional
+            The function to use to encode `ds` if it's not in the cache,
+            with the same signature as :func:`encode` (default
+            :func:`encode`).
+
+        Returns
+        -------
+        bytes or None
+            The encoded dataset, or ``None`` if the encoding failed.
+        """
+        encoder = encoder or encode
+        key = (id(ds), is_implicit_vr, is_little_endian, deflated)
+        fingerprint = _fingerprint(ds)
+        with self._lock:
+            self._purge()
+            entry = self._cache.get(key)
+            if entry and entry[0]() is ds and _is_identical(
+                entry[1], fingerprint
+            ):
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+            self.misses += 1
+
+        bytestream = encoder(ds, is_implicit_vr, is_little_endian, deflated)
+        if bytestream is None or len(bytestream) > max_size:
+            return bytestream
+
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry:
+                self.size -= len(entry[2])
+
+            ref = weakref.ref(ds, lambda ref: self._collected(key, ref))
+            self._cache[key] = (ref, fingerprint, bytestream)
+            self.size += len(bytestream)
+            while self.size > max_size:
+                _, entry = self._cache.popitem(last=False)
+                self.size -= len(entry[2])
+
+        return bytestream
+
+
+def _is_identical(a, b):
+    """Return ``True`` if the objects in fingerprints `a` and `b` are
+    identical, or are equal :class:`int`.
+    """
+    return len(a) == len(b) and all(
+        x is y or (type(x) is int and type(y) is int and x == y)
+        for x, y in zip(a, b)
+    )
+
+
+# Encoded C-STORE datasets when _config.STORE_SEND_CACHE_SIZE is in use
+_ENCODE_CACHE = _EncodeCache()
+
+
+def _encode_dataset(ds, is_implicit_vr, is_little_endian, deflated=False,
+                    pool=None):
+    """Return the encoded `ds`, using the encoded dataset cache if
+    :attr:`~pynetdicom._config.STORE_SEND_CACHE_SIZE` is set.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset to encode.
+    is_implicit_vr : bool
+        ``True`` for implicit VR, ``False`` for explicit VR.
+    is_little_endian : bool
+        ``True`` for little endian, ``False`` for big endian.
+    deflated : bool, optional
+        ``True`` if the encoded dataset should be deflated (default
+        ``False``).
+    pool : dsutils._CodecPool, optional
+        If used then the pool of processes to encode `ds` with.
+
+    Returns
+    -------
+    bytes or None
+        The encoded dataset, or ``None`` if the encoding failed.
+    """
+    encoder = pool.encode if pool else encode
+    max_size = _config.STORE_SEND_CACHE_SIZE
+    if not max_size:
+        if _ENCODE_CACHE.size:
+            _ENCODE_CACHE.clear()
+
+        return encoder(ds, is_implicit_vr, is_little_endian, deflated)
+
+    return _ENCODE_CACHE.encode(
+        ds, is_implicit_vr, is_little_endian, deflated, max_size, encoder
+    )
+
+
+def _estimate_length(ds):
+    """Return the approximate encoded length of `ds` in bytes.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset to estimate the length of, including any sequence items.
+
+    Returns
+    -------
+    int
+        The approximate encoded length, without having to encode `ds`.
+    """
+    length = 0
+    for elem in ds._dict.values():
+        value = elem.value
+        length += 12
+        if elem.VR == 'SQ' and not isinstance(value, (bytes, type(None))):
+            length += sum(_estimate_length(item) + 8 for item in value)
+        elif isinstance(value, (bytes, str)):
+            length += len(value)
+        else:
+            length += 8
+
+    return length
+
+
+# A large element value passed to or from a pool process as its position
+#   in a buffer both processes have, rather than being pickled
+_SharedValue = namedtuple('_SharedValue', ['offset', 'length'])
+
+# The minimum length of the element values passed as a _SharedValue
+_SHARED_VALUE_LENGTH = 1024
+
+
+def _share_value(value, shared):
+    """Return `value` or, if it's large, a :class:`_SharedValue` for it.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    value : object
+        The element value.
+    shared : list of (int, bytes) or None
+        If not ``None`` then the large values being passed in shared memory
+        as (offset, value), which `value` is added to if it's large.
+    """
+    if (
+        shared is None
+        or not isinstance(value, bytes)
+        or len(value) < _SHARED_VALUE_LENGTH
+    ):
+        return value
+
+    offset = shared[-1][0] + len(shared[-1][1]) if shared else 0
+    shared.append((offset, value))
+
+    return _SharedValue(offset, len(value))
+
+
+def _pack_dataset(ds, shared=None):
+    """Return `ds` in a form that can be pickled.
+
+    .. versionadded:: 2.0
+
+    Datasets containing sequences can't be pickled directly as the sequences
+    keep weak references to their parent datasets.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset to pack.
+    shared : list, optional
+        If used then element values of at least ``_SHARED_VALUE_LENGTH``
+        bytes are added to `shared` as (offset, value) and packed as a
+        :class:`_SharedValue`, so they can be copied to shared memory rather
+        than pickled.
+
+    Returns
+    -------
+    tuple
+        The packed dataset, which can be restored with
+        :func:`_unpack_dataset`.
+    """
+    elements = []
+    for elem in ds._dict.values():
+        if isinstance(elem, RawDataElement):
+            value = _share_value(elem.value, shared)
+            if value is not elem.value:
+                elem = elem._replace(value=value)
+
+            elements.append(elem)
+            continue
+
+        value = elem.value
+        if elem.VR == 'SQ' and not isinstance(value, (bytes, type(None))):
+            value = [_pack_dataset(item, shared) for item in value]
+        else:
+            value = _share_value(value, shared)
+
+        elements.append((elem.tag, elem.VR, value, elem.is_undefined_length))
+
+    attrs = {
+        name: getattr(ds, name) for name in _PACKED_ATTRIBUTES
+        if name in ds.__dict__
+    }
+
+    return attrs, elements
+
+
+def _unpack_dataset(packed, buffer=None):
+    """Return the dataset packed by :func:`_pack_dataset`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    packed : tuple
+        The packed dataset.
+    buffer : bytes or memoryview, optional
+        The buffer containing the values packed as a :class:`_SharedValue`.
+        Each value is a slice of `buffer`, so if `buffer` is a
+        :class:`memoryview` then the values aren't copied.
+    """
+    attrs, elements = packed
+    ds = Dataset()
+    for elem in elements:
+        if isinstance(elem, RawDataElement):
+            if isinstance(elem.value, _SharedValue):
+                offset, length = elem.value
+                elem = elem._replace(value=buffer[offset:offset + length])
+
+            # Skip the checks in Dataset.__setitem__(), they're the
+            #   slowest part of unpacking
+            ds._dict[elem.tag] = elem
+            continue
+
+        tag, vr, value, is_undefined_length = elem
+        elem = DataElement(
+            tag, vr, None, is_undefined_length=is_undefined_length
+        )
+        if vr == 'SQ' and isinstance(value, list):
+            # Use __setitem__() so the items have their parent set
+            elem.value = Sequence(
+                [_unpack_dataset(item, buffer) for item in value]
+            )
+            ds[tag] = elem
+        else:
+            if isinstance(value, _SharedValue):
+                value = buffer[value.offset:value.offset + value.length]
+
+            # Set the already converted value directly
+            elem._value = value
+            ds._dict[tag] = elem
+
+    for name, value in attrs.items():
+        setattr(ds, name, value)
+
+    return ds
+
+
+# The Dataset attributes kept by _pack_dataset()
+_PACKED_ATTRIBUTES = (
+    'is_little_endian', 'is_implicit_VR', 'read_encoding',
+    'read_little_endian', 'read_implicit_vr'
+)
+
+
+def _pool_encode(packed, is_implicit_vr, is_little_endian, deflated,
+                 values=None):
+    """Encode a packed dataset in a pool process.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    values : str, optional
+        The name of the shared memory block containing the values packed as
+        a :class:`_SharedValue`. The values are encoded directly from the
+        block without being copied.
+
+    Returns
+    -------
+    bytes or (str, int) or None
+        The encoded dataset, the name of the shared memory block containing
+        the encoded dataset and its length, or ``None`` if the encoding
+        failed.
+    """
+    shared_memory = _shared_memory()
+    if values is None:
+        bytestream = encode(
+            _unpack_dataset(packed), is_implicit_vr, is_little_endian, deflated
+        )
+    else:
+        shm = shared_memory.SharedMemory(name=values)
+        try:
+            bytestream = encode(
+                _unpack_dataset(packed, shm.buf),
+                is_implicit_vr,
+                is_little_endian,
+                deflated
+            )
+        finally:
+            # The unpacked dataset has been released so there are no views
+            #   of the block left
+            shm.close()
+
+    if bytestream is None or shared_memory is None:
+        return bytestream
+
+    # The parent process is responsible for unlinking the block
+    shm = shared_memory.SharedMemory(create=True, size=max(len(bytestream), 1))
+    shm.buf[:len(bytestream)] = bytestream
+    shm.close()
+
+    return shm.name, len(bytestream)
+
+
+def _shared_memory():
+    """Return the :mod:`multiprocessing.shared_memory` module or ``None``
+    if it's not available (Python 3.7 and earlier).
+
+    .. versionadded:: 2.0
+
+    The module is imported when first needed rather than with *pynetdicom*
+    as the codec pool is optional.
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        return None
+
+    return shared_memory
+
+
+def _pool_decode(source, is_implicit_vr, is_little_endian, deflated):
+    """Decode and convert the elements of an encoded dataset in a pool
+    process.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    source : bytes or (str, int)
+        The encoded dataset, or the name of the shared memory block
+        containing the encoded dataset and its length.
+
+    Returns
+    -------
+    tuple
+        The decoded dataset with all its element values converted, as
+        packed by :func:`_pack_dataset`. Large values that are unchanged by
+        the conversion are packed as a :class:`_SharedValue` giving their
+        position in the encoded dataset, which the parent process already
+        has, so they aren't pickled.
+    """
+    if not isinstance(source, bytes):
+        shm = _shared_memory().SharedMemory(name=source[0])
+        try:
+            source = bytes(shm.buf[:source[1]])
+        finally:
+            shm.close()
+
+    ds = decode(DicomBytesIO(source), is_implicit_vr, is_little_endian, deflated)
+    # The positions of the large values in `source`, which are unknown once
+    #   a deflated dataset has been inflated
+    raw_values = {}
+    if not deflated:
+        raw_values = {
+            tag: _SharedValue(elem.value_tell, len(elem.value))
+            for tag, elem in ds._dict.items()
+            if isinstance(elem, RawDataElement)
+            and elem.value is not None
+            and len(elem.value) >= _SHARED_VALUE_LENGTH
+        }
+
+    # Convert the raw elements so the parent process doesn't have to
+    _convert_elements(ds)
+
+    for tag, value in raw_values.items():
+        elem = ds._dict[tag]
+        if isinstance(elem, RawDataElement):
+            ds._dict[tag] = elem._replace(value=value)
+        elif (
+            isinstance(elem.value, bytes) and len(elem.value) == value.length
+        ):
+            elem._value = value
+
+    return _pack_dataset(ds)
+
+
+def _convert_elements(ds):
+    """Convert the raw elements in `ds`, including any sequence items.
+
+    .. versionadded:: 2.0
+
+    Elements that fail to convert are left as raw elements, so any
+    exception is raised when they're accessed, the same as for a dataset
+    decoded with :func:`decode`.
+    """
+    # pylint: disable=broad-except
+    for tag in list(ds._dict):
+        try:
+            elem = ds[tag]
+        except Exception:
+            continue
+
+        if elem.VR == 'SQ' and not isinstance(elem.value, (bytes, type(None))):
+            for item in elem.value:
+                _convert_elements(item)
+
+
+class _CodecPool(object):
+    """A pool of processes used to encode and decode large datasets.
+
+    .. versionadded:: 2.0
+
+    Encoding and decoding are CPU-bound and hold the GIL, so with many
+    concurrent associations they're limited to a single core. Datasets with
+    an encoded length of at least
+    :attr:`~pynetdicom._config.CODEC_POOL_THRESHOLD` are instead encoded or
+    decoded by a pool of worker processes, with the encoded bytes passed
+    between processes using shared memory where available. Smaller datasets
+    are encoded and decoded in the calling thread.
+
+    Large element values, such as *Pixel Data*, aren't pickled. When
+    encoding they're copied to shared memory once and encoded by the worker
+    directly from there, and when decoding they're sliced from the encoded
+    dataset the calling process already has. The encoded dataset is copied
+    once out of shared memory, as it must outlive the block.
+    """
+    def __init__(self, processes):
+        """Create a new pool.
+
+        Parameters
+        ----------
+        processes : int
+            The number of worker processes, which are started when first
+            needed.
+        """
+        self.processes = processes
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _submit(self, func, *args):
+        """Run `func` in a worker process and return the result."""
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                import multiprocessing
+
+                # The AE is multi-threaded so forking isn't safe
+                self._executor = ProcessPoolExecutor(
+                    self.processes,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+
+            future = self._executor.submit(func, *args)
+
+        return future.result()
+
+    def decode(self, bytestring, is_implicit_vr, is_little_endian,
+               deflated=False):
+        """Return the decoded `bytestring`.
+
+        Parameters
+        ----------
+        bytestring : io.BytesIO
+            The encoded dataset.
+        is_implicit_vr : bool
+            ``True`` for implicit VR, ``False`` for explicit VR.
+        is_little_endian : bool
+            ``True`` for little endian, ``False`` for big endian.
+        deflated : bool, optional
+            ``True`` if the encoded dataset is deflated (default ``False``).
+
+        Returns
+        -------
+        pydicom.dataset.Dataset
+            The decoded dataset. If it was decoded by the pool then all its
+            element values have already been converted.
+        """
+        data = bytestring.getvalue()
+        if len(data) < _config.CODEC_POOL_THRESHOLD:
+            return decode(
+                bytestring, is_implicit_vr, is_little_endian, deflated
+            )
+
+        shared_memory = _shared_memory()
+        if shared_memory is None:
+            return _unpack_dataset(
+                self._submit(
+                    _pool_decode,
+                    data,
+                    is_implicit_vr,
+                    is_little_endian,
+                    deflated
+                ),
+                data
+            )
+
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[:len(data)] = data
+            packed = self._submit(
+                _pool_decode,
+                (shm.name, len(data)),
+                is_implicit_vr,
+                is_little_endian,
+                deflated
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return _unpack_dataset(packed, data)
+
+    def encode(self, ds, is_implicit_vr, is_little_endian, deflated=False):
+        """Return the encoded `ds`.
+
+        Parameters
+        ----------
+        ds : pydicom.dataset.Dataset
+            The dataset to encode.
+        is_implicit_vr : bool
+            ``True`` for implicit VR, ``False`` for explicit VR.
+        is_little_endian : bool
+            ``True`` for little endian, ``False`` for big endian.
+        deflated : bool, optional
+            ``True`` if the encoded dataset should be deflated (default
+            ``False``).
+
+        Returns
+        -------
+        bytes or None
+            The encoded dataset, or ``None`` if the encoding failed.
+        """
+        if _estimate_length(ds) < _config.CODEC_POOL_THRESHOLD:
+            return encode(ds, is_implicit_vr, is_little_endian, deflated)
+
+        # Large values are passed to the worker in shared memory
+        shared_memory = _shared_memory()
+        shared = [] if shared_memory else None
+        packed = _pack_dataset(ds, shared)
+        shm = None
+        if shared:
+            offset, value = shared[-1]
+            shm = shared_memory.SharedMemory(
+                create=True, size=offset + len(value)
+            )
+
+        # pylint: disable=broad-except
+        try:
+            if shm:
+                for offset, value in shared:
+                    shm.buf[offset:offset + len(value)] = value
+
+            result = self._submit(
+                _pool_encode,
+                packed,
+                is_implicit_vr,
+                is_little_endian,
+                deflated,
+                shm.name if shm else None
+            )
+        except Exception as exc:
+            LOGGER.error("Failed to encode the dataset using the pool")
+            LOGGER.exception(exc)
+            return None
+        finally:
+            if shm:
+                shm.close()
+                shm.unlink()
+
+        if result is None or isinstance(result, bytes):
+            return result
+
+        shm = _shared_memory().SharedMemory(name=result[0])
+        try:
+            return bytes(shm.buf[:result[1]])
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
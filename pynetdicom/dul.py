@@ -7,10 +7,10 @@ import queue
 import socket
 from struct import unpack
 import struct
-from threading import Thread
+from threading import Condition, Thread, current_thread
 import time
 
-from pynetdicom import evt
+from pynetdicom import evt, _config
 from pynetdicom.fsm import StateMachine
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ, A_ASSOCIATE_AC, A_ASSOCIATE_RJ,
@@ -71,6 +71,11 @@ class DULServiceProvider(Thread):
         # An event occurs when the DUL service user adds to
         #   the to_provider_queue
         self.to_provider_queue = queue.Queue()
+        # Limits the number of P-DATA primitives in the to_provider_queue so
+        #   DIMSE messages are only encoded as fast as they can be sent
+        self._pdata_limit = _config.PDATA_QUEUE_SIZE
+        self._pdata_pending = 0
+        self._pdata_sent = Condition()
         # A primitive is sent to the service user when the DUL service provider
         # adds to the to_user_queue.
         self.to_user_queue = queue.Queue()
@@ -102,6 +107,11 @@ class DULServiceProvider(Thread):
             # Check the queue and see if there are any primitives
             # If so then put the corresponding event on the event queue
             self.primitive = self.to_provider_queue.get(False)
+            if isinstance(self.primitive, P_DATA):
+                with self._pdata_sent:
+                    self._pdata_pending -= 1
+                    self._pdata_sent.notify()
+
             self.event_queue.put(self._primitive_to_event(self.primitive))
             return True
         except queue.Empty:
@@ -112,7 +122,7 @@ class DULServiceProvider(Thread):
 
         Parameters
         ----------
-        bytestream : bytearray
+        bytestream : bytes or bytearray
             The received PDU.
 
         Returns
@@ -121,9 +131,12 @@ class DULServiceProvider(Thread):
             The PDU subclass corresponding to the PDU and the event string
             corresponding to receiving that PDU type.
         """
+        if not isinstance(bytestream, bytes):
+            bytestream = bytes(bytestream)
+
         # Trigger before data is decoded in case of exception in decoding
-        bytestream = bytes(bytestream)
-        evt.trigger(self.assoc, evt.EVT_DATA_RECV, {'data' : bytestream})
+        if evt.EVT_DATA_RECV in self.assoc._bound_events:
+            evt.trigger(self.assoc, evt.EVT_DATA_RECV, {'data' : bytestream})
 
         pdu, event = _PDU_TYPES[bytestream[0:1]]
         pdu = pdu()
@@ -279,9 +292,10 @@ class DULServiceProvider(Thread):
             self.event_queue.put('Evt19')
             return
 
-        # Try and read the rest of the PDU
+        # Try and read the rest of the PDU, the result is `bytes` so it
+        #   can be decoded without making another copy
         try:
-            bytestream += self.socket.recv(pdu_length)
+            bytestream = bytes(bytestream) + self.socket.recv(pdu_length)
         except (socket.error, socket.timeout):
             # Evt17: Transport connection closed
             self.event_queue.put('Evt17')
@@ -416,7 +430,9 @@ class DULServiceProvider(Thread):
         """Place a primitive in the provider queue to be sent to the peer.
 
         Primitives are converted to the corresponding PDU and encoded before
-        sending.
+        sending. If :attr:`~pynetdicom._config.PDATA_QUEUE_SIZE` P-DATA
+        primitives are already waiting to be sent then waits until one of
+        them has been sent before adding another.
 
         Parameters
         ----------
@@ -437,6 +453,20 @@ class DULServiceProvider(Thread):
             evt.trigger(
                 self.assoc, evt.EVT_ACSE_SENT, {'primitive' : primitive}
             )
+        elif isinstance(primitive, P_DATA):
+            with self._pdata_sent:
+                # Wait until there's space in the queue, unless the reactor
+                #   isn't running (or we are the reactor)
+                while (
+                    self._pdata_limit is not None
+                    and self._pdata_pending >= self._pdata_limit
+                    and self.is_alive()
+                    and not self._kill_thread
+                    and current_thread() is not self
+                ):
+                    self._pdata_sent.wait(0.1)
+
+                self._pdata_pending += 1
 
         self.to_provider_queue.put(primitive)
 
@@ -7,13 +7,17 @@ from datetime import datetime
 import inspect
 from io import BytesIO
 import logging
+import queue
 import sys
+import threading
 
 from pydicom.dataset import Dataset
 from pydicom.filereader import dcmread
 
 from pynetdicom import _config
-from pynetdicom.dsutils import decode, create_file_meta
+from pynetdicom.dsutils import (
+    decode, create_file_meta, split_dataset, EncodedDataset, _read_chunks
+)
 
 
 LOGGER = logging.getLogger('pynetdicom.events')
@@ -86,6 +90,7 @@ Possible intervention events are:
 * :class:`EVT_C_GET`
 * :class:`EVT_C_MOVE`
 * :class:`EVT_C_STORE`
+* :class:`EVT_C_STORE_SINK`
 * :class:`EVT_N_ACTION`
 * :class:`EVT_N_CREATE`
 * :class:`EVT_N_DELETE`
@@ -105,6 +110,7 @@ EVT_C_FIND = InterventionEvent("EVT_C_FIND", "C-FIND request received")
 EVT_C_GET = InterventionEvent("EVT_C_GET", "C-GET request received")
 EVT_C_MOVE = InterventionEvent("EVT_C_MOVE", "C-MOVE request received")
 EVT_C_STORE = InterventionEvent("EVT_C_STORE", "C-STORE request received")
+EVT_C_STORE_SINK = InterventionEvent("EVT_C_STORE_SINK", "C-STORE request command set received and a data set sink required")
 EVT_N_ACTION = InterventionEvent("EVT_N_ACTION", "N-ACTION request received")
 EVT_N_CREATE = InterventionEvent("EVT_N_CREATE", "N-CREATE request received")
 EVT_N_DELETE = InterventionEvent("EVT_N_DELETE", "N-DELETE request received")
@@ -140,6 +146,7 @@ def get_default_handler(event):
         EVT_C_GET : _c_get_handler,
         EVT_C_MOVE : _c_move_handler,
         EVT_C_STORE : _c_store_handler,
+        EVT_C_STORE_SINK : _c_store_sink_handler,
         EVT_N_ACTION : _n_action_handler,
         EVT_N_CREATE : _n_create_handler,
         EVT_N_DELETE : _n_delete_handler,
@@ -150,6 +157,18 @@ def get_default_handler(event):
     return handlers[event]
 
 
+def _is_enabled(handler):
+    """Return ``True`` if `handler` should be called, ``False`` otherwise.
+
+    .. versionadded:: 2.0
+
+    Handlers with an ``_is_enabled`` attribute, such as the standard logging
+    handlers, are only called if it returns ``True``.
+    """
+    is_enabled = getattr(handler, '_is_enabled', None)
+    return is_enabled is None or is_enabled()
+
+
 def trigger(assoc, event, attrs=None):
     """Trigger an `event` and call any bound handler(s).
 
@@ -194,6 +213,12 @@ def trigger(assoc, event, attrs=None):
         If an exception occurs in an intervention event handler then the
         exception will be raised. If an exception occurs in a notification
         handler then the exception will be caught and logged instead.
+
+    Notes
+    -----
+    If :attr:`~pynetdicom._config.ASYNC_NOTIFICATION_HANDLERS` is ``True``
+    then the handlers for notification events are called from a separate
+    thread after :func:`trigger` has returned.
     """
     # Get the handler(s) bound to the event
     #   notification events: returns a list of 2-tuple (callable, args)
@@ -204,35 +229,223 @@ def trigger(assoc, event, attrs=None):
     if not handlers or handlers[0] is None:
         return
 
+    # Skip the standard logging handlers if nothing would be logged
+    if event.is_notification:
+        handlers = [hh for hh in handlers if _is_enabled(hh[0])]
+        if not handlers:
+            return
+
     evt = Event(assoc, event, attrs or {})
 
-    try:
-        # Intervention event - only single handler allowed
-        if event.is_intervention:
-            if handlers[1] is not None:
-                return handlers[0](evt, *handlers[1])
+    # Notification event - multiple handlers are allowed
+    if event.is_notification:
+        if _config.ASYNC_NOTIFICATION_HANDLERS:
+            _get_dispatcher().put(evt, handlers)
+        else:
+            _notify(evt, handlers)
+
+        return
 
-            return handlers[0](evt)
+    # Intervention event - only single handler allowed, any exceptions
+    #   get raised
+    if handlers[1] is not None:
+        return handlers[0](evt, *handlers[1])
 
-        # Notification event - multiple handlers are allowed
+    return handlers[0](evt)
+
+
+def _notify(event, handlers):
+    """Call the `handlers` bound to a notification `event`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    event : events.Event
+        The notification event to pass to the handlers.
+    handlers : list of 2-tuple
+        The (callable, args) handlers bound to the event.
+    """
+    try:
         for func, args in handlers:
             if args:
-                func(evt, *args)
+                func(event, *args)
             else:
-                func(evt)
+                func(event)
     except Exception as exc:
-        # Intervention exceptions get raised
-        if event.is_intervention:
-            raise
-
         # Capture exceptions for notification events
         LOGGER.error(
-            f"Exception raised in user's 'evt.{event.name}' "
+            f"Exception raised in user's 'evt.{event.event.name}' "
             f"event handler '{func.__name__}'"
         )
         LOGGER.exception(exc)
 
 
+class _NotificationDispatcher(threading.Thread):
+    """A thread for calling the handlers bound to notification events.
+
+    .. versionadded:: 2.0
+
+    Used when :attr:`~pynetdicom._config.ASYNC_NOTIFICATION_HANDLERS` is
+    ``True``.
+
+    Attributes
+    ----------
+    dispatched : int
+        The number of events that have been handled.
+    dropped : int
+        The number of events dropped because the queue was full.
+    peak : int
+        The largest number of events that have been waiting in the queue.
+    """
+    def __init__(self, maxsize):
+        """Create a new dispatcher.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of events that can be waiting in the queue.
+        """
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self.dispatched = 0
+        self.dropped = 0
+        self.peak = 0
+
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.name = "NotificationDispatcher"
+
+    def put(self, event, handlers):
+        """Add a notification `event` to the queue.
+
+        Parameters
+        ----------
+        event : events.Event
+            The notification event to pass to the handlers.
+        handlers : list of 2-tuple
+            The (callable, args) handlers bound to the event.
+
+        Returns
+        -------
+        bool
+            ``True`` if the event was added, ``False`` if it was dropped.
+        """
+        try:
+            self._queue.put_nowait((event, handlers))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                if self.dropped == 1:
+                    LOGGER.warning(
+                        "The notification event queue is full, events will "
+                        "be dropped until there's space available"
+                    )
+
+            return False
+
+        with self._lock:
+            self.peak = max(self.peak, self._queue.qsize())
+
+        return True
+
+    @property
+    def queued(self):
+        """Return the number of events waiting in the queue."""
+        return self._queue.qsize()
+
+    def run(self):
+        """Call the handlers for each queued event."""
+        while True:
+            event, handlers = self._queue.get()
+            try:
+                _notify(event, handlers)
+            finally:
+                with self._lock:
+                    self.dispatched += 1
+
+                self._queue.task_done()
+
+    def wait(self):
+        """Block until all the queued events have been handled."""
+        self._queue.join()
+
+
+_DISPATCHER = None
+_DISPATCHER_LOCK = threading.Lock()
+
+
+def _get_dispatcher():
+    """Return the running notification dispatcher, starting it if required.
+
+    .. versionadded:: 2.0
+    """
+    global _DISPATCHER
+
+    if _DISPATCHER is None:
+        with _DISPATCHER_LOCK:
+            if _DISPATCHER is None:
+                dispatcher = _NotificationDispatcher(
+                    _config.NOTIFICATION_QUEUE_SIZE
+                )
+                dispatcher.start()
+                _DISPATCHER = dispatcher
+
+    return _DISPATCHER
+
+
+def dispatch_statistics():
+    """Return statistics for the notification event dispatcher.
+
+    .. versionadded:: 2.0
+
+    Returns
+    -------
+    dict
+        A :class:`dict` with keys:
+
+        * ``'queued'``: the number of events waiting to be handled
+        * ``'dispatched'``: the number of events that have been handled
+        * ``'dropped'``: the number of events dropped because the queue was
+          full
+        * ``'peak'``: the largest number of events that have been waiting to
+          be handled
+
+        All the values are ``0`` if the dispatcher hasn't been started.
+
+    See Also
+    --------
+    pynetdicom._config.ASYNC_NOTIFICATION_HANDLERS
+    """
+    dispatcher = _DISPATCHER
+    if dispatcher is None:
+        return {'queued': 0, 'dispatched': 0, 'dropped': 0, 'peak': 0}
+
+    with dispatcher._lock:
+        return {
+            'queued': dispatcher.queued,
+            'dispatched': dispatcher.dispatched,
+            'dropped': dispatcher.dropped,
+            'peak': dispatcher.peak,
+        }
+
+
+def wait_for_dispatch():
+    """Block until all queued notification events have been handled.
+
+    .. versionadded:: 2.0
+
+    Returns immediately if the dispatcher hasn't been started.
+
+    See Also
+    --------
+    pynetdicom._config.ASYNC_NOTIFICATION_HANDLERS
+    """
+    dispatcher = _DISPATCHER
+    if dispatcher is not None:
+        dispatcher.wait()
+
+
 class Event(object):
     """Representation of an event.
 
@@ -449,6 +662,136 @@ class Event(object):
 
         return dataset_path
 
+    @property
+    def dataset_sink(self):
+        """Return the object the C-STORE request's *Data Set* was written to
+        by the handler bound to ``evt.EVT_C_STORE_SINK``.
+
+        .. versionadded:: 2.0
+
+        Returns
+        -------
+        object or None
+            The object returned by the ``evt.EVT_C_STORE_SINK`` handler, or
+            ``None`` if no sink was used and the *Data Set* is available via
+            :attr:`dataset` instead.
+
+        Raises
+        ------
+        AttributeError
+            If the corresponding event is not a C-STORE request.
+        """
+        try:
+            return self.request._dataset_sink
+        except AttributeError:
+            raise AttributeError(
+                "The corresponding event is not a C-STORE request and has no "
+                "'Data Set' parameter"
+            )
+
+    @property
+    def dataset_sink_error(self):
+        """Return the exception raised when writing the C-STORE request's
+        *Data Set* to the :attr:`dataset_sink`.
+
+        .. versionadded:: 2.0
+
+        If writing to the sink raised an exception then the rest of the
+        *Data Set* was discarded, so the sink doesn't contain the complete
+        *Data Set*. If the ``evt.EVT_C_STORE`` handler returns a success or
+        warning status anyway, then a failure response with status
+        ``0xA700`` is sent instead.
+
+        Returns
+        -------
+        Exception or None
+            The exception raised by the sink, or ``None`` if the whole
+            *Data Set* was written to the sink or no sink was used.
+
+        Raises
+        ------
+        AttributeError
+            If the corresponding event is not a C-STORE request.
+        """
+        try:
+            return self.request._dataset_sink_error
+        except AttributeError:
+            raise AttributeError(
+                "The corresponding event is not a C-STORE request and has no "
+                "'Data Set' parameter"
+            )
+
+    @property
+    def encoded_dataset(self):
+        """Return a C-STORE request's `Data Set` as an
+        :class:`~pynetdicom.dsutils.EncodedDataset`.
+
+        .. versionadded:: 2.0
+
+        This allows a received dataset to be forwarded to another
+        association using :meth:`Association.send_c_store()
+        <pynetdicom.association.Association.send_c_store>` without having to
+        decode and re-encode it, provided the other association has an
+        accepted presentation context with a matching transfer syntax (or,
+        if the *Data Set* uses *Implicit VR Little Endian*, *Explicit VR
+        Little Endian* or *Deflated Explicit VR Little Endian*, with any of
+        those three, as it's converted while being sent). The
+        received data isn't copied and will only be available until the
+        ``evt.EVT_C_STORE`` handler returns, so any forwarding should be
+        done from within the handler.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            def handle_store(event, forward_assoc):
+                rsp = forward_assoc.send_c_store(event.encoded_dataset)
+                return rsp.Status if rsp else 0xA700
+
+        Returns
+        -------
+        dsutils.EncodedDataset
+            The encoded *Data Set*, using the transfer syntax of the
+            presentation context the request was sent under (or *Explicit
+            VR Little Endian* if the *Data Set* was deflated).
+
+        Raises
+        ------
+        AttributeError
+            If the corresponding event is not a C-STORE request or if the
+            *Data Set* was written to the sink returned by the handler bound
+            to ``evt.EVT_C_STORE_SINK``.
+        """
+        try:
+            req = self.request
+            bytestream = req.DataSet
+        except AttributeError:
+            raise AttributeError(
+                "The corresponding event is not a C-STORE request and has no "
+                "'Data Set' parameter"
+            )
+
+        if getattr(req, '_dataset_sink', None) is not None:
+            raise AttributeError(
+                "The C-STORE request's 'Data Set' has been written to the "
+                "sink returned by the handler bound to 'evt.EVT_C_STORE_SINK'"
+            )
+
+        if getattr(req, '_dataset_path', None) is not None:
+            # Skip the preamble, prefix and File Meta Information
+            _, offset = split_dataset(req._dataset_path)
+            source = _read_chunks(req._dataset_path, offset)
+        else:
+            source = bytestream.getbuffer()
+
+        return EncodedDataset(
+            source,
+            req.AffectedSOPClassUID,
+            req.AffectedSOPInstanceUID,
+            self._transfer_syntax
+        )
+
     @property
     def event(self):
         """Return the corresponding event.
@@ -531,7 +874,8 @@ class Event(object):
         * (0002,0003) *Media Storage SOP Instance UID* - set from the request's
           *Affected SOP Instance UID*
         * (0002,0010) *Transfer Syntax UID* - set from the presentation context
-          used to transfer the *Data Set*
+          used to transfer the *Data Set*, or as *Explicit VR Little Endian*
+          if a deflated *Data Set* was inflated on receipt
         * (0002,0012) *Implementation Class UID* - set using
           :attr:`~pynetdicom.PYNETDICOM_IMPLEMENTATION_UID`
         * (0002,0013) *Implementation Version Name* - set using
@@ -583,7 +927,7 @@ class Event(object):
         return create_file_meta(
             sop_class_uid=self.request.AffectedSOPClassUID,
             sop_instance_uid=self.request.AffectedSOPInstanceUID,
-            transfer_syntax=self.context.transfer_syntax,
+            transfer_syntax=self._transfer_syntax,
         )
 
     def _get_dataset(self, attr, exc_msg):
@@ -617,11 +961,23 @@ class Event(object):
             if self._hash == hash(bytestream):
                 return self._decoded
 
+            # Use the dataset decoded while logging the request (if any)
+            decoded = getattr(self.request, '_decoded', None)
+            if decoded and decoded[:2] == (attr, hash(bytestream)):
+                self.request._decoded = None
+                self._hash, self._decoded = decoded[1:]
+                return self._decoded
+
             # Some dataset-like parameters are optional
             if bytestream and bytestream.getvalue() != b'':
                 # Dataset-like parameter has been used
-                t_syntax = self.context.transfer_syntax
-                ds = decode(
+                t_syntax = self._transfer_syntax
+                # Large datasets may be decoded using the AE's process pool
+                pool = getattr(
+                    getattr(self.assoc, 'ae', None), '_codec_pool', None
+                )
+                decoder = pool.decode if pool else decode
+                ds = decoder(
                     bytestream,
                     t_syntax.is_implicit_VR,
                     t_syntax.is_little_endian,
@@ -645,6 +1001,23 @@ class Event(object):
 
         raise AttributeError(exc_msg)
 
+    @property
+    def _transfer_syntax(self):
+        """Return the transfer syntax of the request's encoded dataset.
+
+        .. versionadded:: 2.0
+
+        Received deflated C-STORE datasets are inflated as they arrive, so
+        may use a different transfer syntax to the presentation context.
+
+        Returns
+        -------
+        pydicom.uid.UID
+            The transfer syntax UID.
+        """
+        tsyntax = getattr(self.request, '_dataset_transfer_syntax', None)
+        return tsyntax or self.context.transfer_syntax
+
     @property
     def identifier(self):
         """Return a C-FIND, C-GET or C-MOVE request's `Identifier` as a
@@ -850,6 +1223,14 @@ def _c_store_handler(event):
     """
     raise NotImplementedError("No handler has been bound to 'evt.EVT_C_STORE'")
 
+def _c_store_sink_handler(event):
+    """Default handler for when a C-STORE request's *Data Set* is about to be
+    received.
+
+    See _handlers.doc_handle_store_sink for detailed documentation.
+    """
+    return None
+
 def _n_action_handler(event):
     """Default handler for when an N-ACTION request is received.
 
@@ -76,16 +76,17 @@ class StateMachine(object):
             next_state = action[1](self.dul)
 
             # Event handler - FSM transition
-            evt.trigger(
-                self.dul.assoc,
-                evt.EVT_FSM_TRANSITION,
-                {
-                    'action' : action_name,
-                    'current_state' : self.current_state,
-                    'fsm_event' : event,
-                    'next_state' : next_state
-                }
-            )
+            if evt.EVT_FSM_TRANSITION in self.dul.assoc._bound_events:
+                evt.trigger(
+                    self.dul.assoc,
+                    evt.EVT_FSM_TRANSITION,
+                    {
+                        'action' : action_name,
+                        'current_state' : self.current_state,
+                        'fsm_event' : event,
+                        'next_state' : next_state
+                    }
+                )
             #print(
             #    "{}: {} + {} -> {} -> {}".format(
             #        self.dul.assoc.mode[0].upper(), self.current_state,
@@ -1,10 +1,13 @@
 """Implementation of the Presentation service."""
 
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from copy import deepcopy
 import logging
+import threading
 
 from pydicom.uid import UID
 
+from pynetdicom import _config
 from pynetdicom._globals import DEFAULT_TRANSFER_SYNTAXES
 from pynetdicom.sop_class import (
     _APPLICATION_EVENT_CLASSES,
@@ -35,6 +38,9 @@ from pynetdicom.utils import validate_uid
 
 LOGGER = logging.getLogger('pynetdicom.presentation')
 
+# Values that can be shared by copied presentation contexts
+_IMMUTABLE_TYPES = (str, int, type(None))
+
 
 # Used with the event handlers to give the users access to the context
 PresentationContextTuple = namedtuple(
@@ -358,6 +364,26 @@ class PresentationContext(object):
 
         self._context_id = value
 
+    def __deepcopy__(self, memo):
+        """Return a deep copy of the context.
+
+        .. versionadded:: 2.0
+
+        The UIDs and other immutable values are shared with the copy rather
+        than being copied, which makes copying many contexts much faster.
+        """
+        context = self.__class__.__new__(self.__class__)
+        memo[id(self)] = context
+        for name, value in self.__dict__.items():
+            if name == '_transfer_syntax':
+                value = list(value)
+            elif not isinstance(value, _IMMUTABLE_TYPES):
+                value = deepcopy(value, memo)
+
+            context.__dict__[name] = value
+
+        return context
+
     def __eq__(self, other):
         """Return ``True`` if `self` is equal to `other`."""
         if self is other:
@@ -548,6 +574,34 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
         If `roles` is not ``None`` then this is a :class:`list` of SCP/SCU Role
         Selection Negotiation items that can be sent back to the *Requestor*.
     """
+    # Acceptor supported SOP Classes must be unique so we can use UID as
+    #   the key
+    acceptor_contexts = {cx.abstract_syntax:cx for cx in ac_contexts}
+
+    return _negotiate_as_acceptor(rq_contexts, acceptor_contexts, roles)
+
+
+def _negotiate_as_acceptor(rq_contexts, acceptor_contexts, roles=None):
+    """Process the Presentation Contexts as an Association *Acceptor*.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ----------
+    rq_contexts : list of PresentationContext
+        The Presentation Contexts proposed by the peer.
+    acceptor_contexts : dict
+        The Presentation Contexts supported by the local AE as
+        ``{abstract syntax : PresentationContext}``.
+    roles : dict or None
+        The proposed SCP/SCU Role Selection Negotiation items as
+        ``{'SOP Class UID' : (SCU role, SCP role)}``, or ``None``.
+
+    Returns
+    -------
+    list of PresentationContext, list of SCP_SCU_RoleSelectionNegotiation
+        The results of the negotiation, as for :func:`negotiate_as_acceptor`.
+    """
     from pynetdicom.pdu_primitives import SCP_SCU_RoleSelectionNegotiation
 
     roles = roles or {}
@@ -559,7 +613,7 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
         return result_contexts, []
 
     # Acceptor doesn't support any presentation contexts
-    if not ac_contexts:
+    if not acceptor_contexts:
         for rq_context in rq_contexts:
             context = PresentationContext()
             context.context_id = rq_context.context_id
@@ -580,9 +634,6 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
     requestor_contexts = {
         (cx.context_id, cx.abstract_syntax):cx for cx in rq_contexts
     }
-    # Acceptor supported SOP Classes must be unique so we can use UID as
-    #   the key
-    acceptor_contexts = {cx.abstract_syntax:cx for cx in ac_contexts}
 
     for (cntx_id, ab_syntax) in requestor_contexts:
         # Convenience variable
@@ -678,6 +729,128 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
     return result_contexts, reply_roles
 
 
+class _NegotiationCache(object):
+    """A cache of the results of negotiating as the association *Acceptor*.
+
+    .. versionadded:: 2.0
+
+    The supported presentation contexts are indexed by abstract syntax once,
+    rather than for every association, and the results of each negotiation
+    are kept using a fingerprint of the proposed presentation contexts and
+    SCP/SCU roles so a repeated proposal doesn't need to be negotiated again.
+    """
+    def __init__(self, contexts):
+        """Create a new cache.
+
+        Parameters
+        ----------
+        contexts : list of PresentationContext
+            The presentation contexts supported by the local AE when acting
+            as the association *Acceptor*.
+        """
+        # {abstract syntax : PresentationContext}
+        self._index = {cx.abstract_syntax:cx for cx in contexts}
+        self._lock = threading.Lock()
+        # {fingerprint : (context results, role results)}
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def negotiate(self, rq_contexts, roles=None):
+        """Return the results of negotiating `rq_contexts`, using the cache
+        where possible.
+
+        Parameters
+        ----------
+        rq_contexts : list of PresentationContext
+            The Presentation Contexts proposed by the peer.
+        roles : dict or None
+            The proposed SCP/SCU Role Selection Negotiation items as
+            ``{'SOP Class UID' : (SCU role, SCP role)}``, or ``None``.
+
+        Returns
+        -------
+        list of PresentationContext, list of SCP_SCU_RoleSelectionNegotiation
+            The results of the negotiation, as for
+            :func:`negotiate_as_acceptor`. New objects are returned for
+            each negotiation.
+        """
+        roles = roles or {}
+        key = (
+            tuple(
+                (cx.context_id, cx.abstract_syntax, tuple(cx.transfer_syntax))
+                for cx in rq_contexts
+            ),
+            tuple(sorted(roles.items())),
+        )
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+
+        if entry is not None:
+            return self._build(*entry)
+
+        result_contexts, reply_roles = _negotiate_as_acceptor(
+            rq_contexts, self._index, roles
+        )
+        # pylint: disable=protected-access
+        entry = (
+            [
+                (
+                    cx.context_id, cx.abstract_syntax, tuple(cx.transfer_syntax),
+                    cx.result, cx._as_scu, cx._as_scp
+                ) for cx in result_contexts
+            ],
+            [
+                (role.sop_class_uid, role.scu_role, role.scp_role)
+                for role in reply_roles
+            ]
+        )
+        # pylint: enable=protected-access
+        with self._lock:
+            self.misses += 1
+            if _config.NEGOTIATION_CACHE_SIZE:
+                self._cache[key] = entry
+                while len(self._cache) > _config.NEGOTIATION_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return result_contexts, reply_roles
+
+    @staticmethod
+    def _build(context_results, role_results):
+        """Return new presentation contexts and role selection items from
+        the cached results.
+        """
+        from pynetdicom.pdu_primitives import SCP_SCU_RoleSelectionNegotiation
+
+        # The values have already been validated so skip the setters
+        # pylint: disable=protected-access
+        contexts = []
+        for (cx_id, ab_syntax, tr_syntaxes, result, as_scu, as_scp) in (
+            context_results
+        ):
+            context = PresentationContext()
+            context._context_id = cx_id
+            context._abstract_syntax = ab_syntax
+            context._transfer_syntax = list(tr_syntaxes)
+            context.result = result
+            context._as_scu = as_scu
+            context._as_scp = as_scp
+            contexts.append(context)
+
+        roles = []
+        for (uid, scu_role, scp_role) in role_results:
+            role = SCP_SCU_RoleSelectionNegotiation()
+            role.sop_class_uid = uid
+            role.scu_role = scu_role
+            role.scp_role = scp_role
+            roles.append(role)
+
+        return contexts, roles
+
+
 def negotiate_as_requestor(rq_contexts, ac_contexts, roles=None):
     """Process the Presentation Contexts as an Association *Requestor*.
 
@@ -3,7 +3,9 @@
 from io import BytesIO
 import logging
 import os
+import queue
 import sys
+import threading
 import traceback
 
 from pydicom.dataset import Dataset
@@ -28,6 +30,7 @@ from pynetdicom.status import (
     SUBSTANCE_ADMINISTRATION_SERVICE_CLASS_STATUS,
     STORAGE_SERVICE_CLASS_STATUS,
     VERIFICATION_SERVICE_CLASS_STATUS,
+    code_to_category,
 )
 
 
@@ -77,6 +80,98 @@ class attempt():
         return self._success
 
 
+class _FindPipeline(object):
+    """Get and encode the results from a C-FIND handler in a separate thread.
+
+    .. versionadded:: 2.0
+
+    Up to `depth` results are fetched from the handler and have their
+    *Identifiers* encoded while the responses for earlier results are being
+    sent.
+    """
+    def __init__(self, results, transfer_syntax, depth, encoder=None):
+        """Create a new pipeline.
+
+        Parameters
+        ----------
+        results : iterable of (object, tuple)
+            The wrapped results from the handler, as yielded by
+            :meth:`ServiceClass._wrap_handler`.
+        transfer_syntax : pydicom.uid.UID
+            The transfer syntax to use to encode the *Identifiers*.
+        depth : int
+            The maximum number of results to fetch in advance.
+        encoder : callable, optional
+            The function to use to encode the *Identifiers*, with the same
+            signature as :func:`~pynetdicom.dsutils.encode` (default
+            :func:`~pynetdicom.dsutils.encode`).
+        """
+        self._results = results
+        self._transfer_syntax = transfer_syntax
+        self._encoder = encoder or encode
+        self._queue = queue.Queue(maxsize=depth)
+        self._halt = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="FindPipeline", daemon=True
+        )
+
+    def __iter__(self):
+        """Yield the results as ``(result, exc_info, identifier)``, where
+        `identifier` is the encoded *Identifier* as :class:`io.BytesIO` or
+        ``None`` if the result doesn't contain a dataset.
+        """
+        self._thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+
+                yield item
+        finally:
+            self._halt.set()
+
+    def _put(self, item):
+        """Add `item` to the queue, return ``False`` if the pipeline has been
+        stopped instead.
+        """
+        while not self._halt.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _run(self):
+        """Fetch and encode the results."""
+        tsyntax = self._transfer_syntax
+        try:
+            for result, exc in self._results:
+                identifier = None
+                if (
+                    isinstance(result, tuple)
+                    and len(result) == 2
+                    and isinstance(result[1], Dataset)
+                ):
+                    identifier = BytesIO(
+                        self._encoder(
+                            result[1],
+                            tsyntax.is_implicit_VR,
+                            tsyntax.is_little_endian,
+                            tsyntax.is_deflated
+                        )
+                    )
+
+                if not self._put((result, exc, identifier)):
+                    # Stopped early
+                    self._results.close()
+                    return
+        finally:
+            self._put(None)
+
+
 class ServiceClass(object):
     """The base class for all the service classes.
 
@@ -96,6 +191,35 @@ class ServiceClass(object):
         """Return the AE."""
         return self.assoc.ae
 
+    def _encode(self, ds, is_implicit_vr, is_little_endian, deflated=False):
+        """Return the encoded response `ds`.
+
+        .. versionadded:: 2.0
+
+        Large datasets are encoded using the AE's process pool, if it has
+        one.
+
+        Parameters
+        ----------
+        ds : pydicom.dataset.Dataset
+            The dataset to encode.
+        is_implicit_vr : bool
+            ``True`` for implicit VR, ``False`` for explicit VR.
+        is_little_endian : bool
+            ``True`` for little endian, ``False`` for big endian.
+        deflated : bool, optional
+            ``True`` if the encoded dataset should be deflated (default
+            ``False``).
+
+        Returns
+        -------
+        bytes or None
+            The encoded dataset, or ``None`` if the encoding failed.
+        """
+        pool = getattr(getattr(self.assoc, 'ae', None), '_codec_pool', None)
+        encoder = pool.encode if pool else encode
+        return encoder(ds, is_implicit_vr, is_little_endian, deflated)
+
     def _c_find_scp(self, req, context):
         """Implementation of the DIMSE C-FIND service.
 
@@ -177,23 +301,19 @@ class ServiceClass(object):
         rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
 
         # Decode and log Identifier
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            try:
-                identifier = decode(
-                    req.Identifier,
-                    transfer_syntax.is_implicit_VR,
-                    transfer_syntax.is_little_endian,
-                    transfer_syntax.is_deflated
-                )
-                LOGGER.info('Find SCP Request Identifier:')
-                LOGGER.info('')
-                LOGGER.info('# DICOM Dataset')
-                for line in pretty_dataset(identifier):
-                    LOGGER.info(line)
-                LOGGER.info('')
-            except Exception:
-                # The user should deal with decoding failures
-                pass
+        self._log_request_identifier(req, transfer_syntax, 'Find')
+
+        # If pipelining, the handler runs in a separate thread so any
+        #   C-CANCEL it sees needs to be passed back
+        depth = _config.FIND_SCP_PIPELINE_DEPTH
+        cancelled = threading.Event()
+
+        def is_cancelled(msg_id):
+            if cancelled.is_set() or self.is_cancelled(msg_id):
+                cancelled.set()
+                return True
+
+            return False
 
         # Try and trigger EVT_C_FIND
         with attempt(rsp, self.dimse, cx_id) as ctx:
@@ -205,7 +325,9 @@ class ServiceClass(object):
                 {
                     'request' : req,
                     'context' : context.as_tuple,
-                    '_is_cancelled' : self.is_cancelled
+                    '_is_cancelled' : is_cancelled if depth else (
+                        self.is_cancelled
+                    )
                 }
             )
 
@@ -217,12 +339,29 @@ class ServiceClass(object):
         if generator is None:
             generator = iter([(0x0000, None)])
 
+        if depth:
+            results = _FindPipeline(
+                self._wrap_handler(generator),
+                transfer_syntax,
+                depth,
+                self._encode
+            )
+        else:
+            results = (
+                (result, exc, None)
+                for result, exc in self._wrap_handler(generator)
+            )
+
         ii = -1  # So if there are no results, log below doesn't break
         # Iterate through the results
-        for ii, (result, exc) in enumerate(self._wrap_handler(generator)):
+        for ii, (result, exc, identifier) in enumerate(results):
             # Reset the response Identifier
             rsp.Identifier = None
 
+            # A C-CANCEL means any results fetched in advance aren't sent
+            if depth and is_cancelled(req.MessageID):
+                result, exc = (0xFE00, None), None
+
             # Exception raised by user's generator
             if exc:
                 LOGGER.error("Exception in handler bound to 'evt.EVT_C_FIND'")
@@ -276,13 +415,16 @@ class ServiceClass(object):
                 return
             elif status[0] == STATUS_PENDING:
                 # If pending, `dataset` is the Identifier
-                bytestream = encode(
-                    dataset,
-                    transfer_syntax.is_implicit_VR,
-                    transfer_syntax.is_little_endian,
-                    transfer_syntax.is_deflated
-                )
-                bytestream = BytesIO(bytestream)
+                bytestream = identifier
+                if bytestream is None:
+                    bytestream = BytesIO(
+                        self._encode(
+                            dataset,
+                            transfer_syntax.is_implicit_VR,
+                            transfer_syntax.is_little_endian,
+                            transfer_syntax.is_deflated
+                        )
+                    )
 
                 if bytestream.getvalue() == b'':
                     LOGGER.error(
@@ -299,7 +441,10 @@ class ServiceClass(object):
                 LOGGER.info(
                     f'Find SCP Response {ii + 1}: 0x{rsp.Status:04X} (Pending)'
                 )
-                if _config.LOG_RESPONSE_IDENTIFIERS:
+                if (
+                    _config.LOG_RESPONSE_IDENTIFIERS
+                    and LOGGER.isEnabledFor(logging.DEBUG)
+                ):
                     LOGGER.debug('Find SCP Response Identifier:')
                     LOGGER.debug('')
                     LOGGER.debug('# DICOM Dataset')
@@ -341,11 +486,9 @@ class ServiceClass(object):
             ``True`` if a C-CANCEL message has been received with a *Message ID
             Being Responded To* corresponding to `msg_id`, ``False`` otherwise.
         """
-        if msg_id in self.dimse.cancel_req.keys():
-            del self.dimse.cancel_req[msg_id]
-            return True
-
-        return False
+        # May be called from more than one thread (such as when the C-FIND
+        #   SCP pipeline is in use) so remove the request atomically
+        return self.dimse.cancel_req.pop(msg_id, None) is not None
 
     def is_valid_status(self, status):
         """Return ``True`` if `status` is valid for the service class.
@@ -365,6 +508,63 @@ class ServiceClass(object):
 
         return False
 
+    def _log_request_identifier(self, req, transfer_syntax, name):
+        """Decode and log the *Identifier* of a C-FIND, C-GET or C-MOVE request.
+
+        The *Identifier* is only decoded if
+        :attr:`~pynetdicom._config.LOG_REQUEST_IDENTIFIERS` is ``True`` and
+        the logger is enabled for ``INFO`` messages. The decoded dataset is
+        then kept on the request primitive so that the event handler's
+        :attr:`Event.identifier<pynetdicom.events.Event.identifier>` can use
+        it rather than decoding the same bytes again.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        ----------
+        req : dimse_primitives.C_FIND or C_GET or C_MOVE
+            The request primitive received from the peer.
+        transfer_syntax : pydicom.uid.UID
+            The transfer syntax of the accepted presentation context.
+        name : str
+            The name of the service to use in the log, one of ``'Find'``,
+            ``'Get'`` or ``'Move'``.
+        """
+        if not _config.LOG_REQUEST_IDENTIFIERS:
+            return
+
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
+
+        try:
+            identifier = decode(
+                req.Identifier,
+                transfer_syntax.is_implicit_VR,
+                transfer_syntax.is_little_endian,
+                transfer_syntax.is_deflated
+            )
+        except Exception:
+            # The user should deal with decoding failures
+            return
+
+        identifier.is_little_endian = transfer_syntax.is_little_endian
+        identifier.is_implicit_VR = transfer_syntax.is_implicit_VR
+        req._decoded = ('Identifier', hash(req.Identifier), identifier)
+
+        try:
+            # Elements are only converted when formatted
+            lines = pretty_dataset(identifier)
+        except Exception:
+            # The user should deal with decoding failures
+            return
+
+        LOGGER.info(f'{name} SCP Request Identifier:')
+        LOGGER.info('')
+        LOGGER.info('# DICOM Dataset')
+        for line in lines:
+            LOGGER.info(line)
+        LOGGER.info('')
+
     def _n_action_scp(self, req, context):
         """Implementation of the DIMSE N-ACTION service.
 
@@ -541,7 +741,7 @@ class ServiceClass(object):
             # If Success or Warning then there **may** be a dataset
             transfer_syntax = context.transfer_syntax[0]
             # If encode() fails then returns `None`
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -695,7 +895,7 @@ class ServiceClass(object):
             # If Success or Warning then there **may** be a dataset
             transfer_syntax = context.transfer_syntax[0]
             # If encode() fails then returns `None`
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -919,7 +1119,7 @@ class ServiceClass(object):
             # If Success or Warning then there **may** be a dataset
             transfer_syntax = context.transfer_syntax[0]
             # If encode() fails then returns `None`
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -1069,7 +1269,7 @@ class ServiceClass(object):
             # If Success or Warning then there **may** be a dataset
             transfer_syntax = context.transfer_syntax[0]
             # If encode() fails then returns `None`
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -1228,7 +1428,7 @@ class ServiceClass(object):
             # If Success or Warning then there **may** be a dataset
             transfer_syntax = context.transfer_syntax[0]
             # If encode() fails then returns `None`
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -1461,12 +1661,30 @@ class StorageServiceClass(ServiceClass):
                     # not be deleted while in use.
                     pass
 
+        # The dataset has been handled, release the memory reserved for it
+        if req._dataset_reservation:
+            req._dataset_reservation.release()
+
         # Exception in context or handler aborted/released
         if not ctx.success or not self.assoc.is_established:
             return
 
         # Validate rsp_status and set rsp.Status accordingly
         rsp = self.validate_status(rsp_status, rsp)
+
+        # The dataset sink doesn't contain the complete dataset
+        category = code_to_category(rsp.Status)
+        if (
+            req._dataset_sink_error is not None
+            and category in (STATUS_SUCCESS, STATUS_WARNING)
+        ):
+            LOGGER.error(
+                "The C-STORE request's dataset wasn't completely written to "
+                "the dataset sink, sending a response with status 0xA700 "
+                "instead"
+            )
+            rsp.Status = 0xA700
+
         self.dimse.send_msg(rsp, context.context_id)
 
 
@@ -1564,23 +1782,8 @@ class QueryRetrieveServiceClass(ServiceClass):
         rsp.MessageIDBeingRespondedTo = req.MessageID
         rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
 
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            try:
-                identifier = decode(
-                    req.Identifier,
-                    transfer_syntax.is_implicit_VR,
-                    transfer_syntax.is_little_endian,
-                    transfer_syntax.is_deflated
-                )
-                LOGGER.info('Get SCP Request Identifier:')
-                LOGGER.info('')
-                LOGGER.info('# DICOM Dataset')
-                for line in pretty_dataset(identifier):
-                    LOGGER.info(line)
-                LOGGER.info('')
-            except Exception:
-                # The user should deal with decoding failures
-                pass
+        # Decode and log Identifier
+        self._log_request_identifier(req, transfer_syntax, 'Get')
 
         # Try and trigger EVT_C_GET
         with attempt(rsp, self.dimse, cx_id) as ctx:
@@ -1691,7 +1894,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     dataset = Dataset()
                     dataset.FailedSOPInstanceUIDList = failed_instances
 
-                bytestream = encode(
+                bytestream = self._encode(
                     dataset,
                     transfer_syntax.is_implicit_VR,
                     transfer_syntax.is_little_endian,
@@ -1720,7 +1923,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     dataset = Dataset()
                     dataset.FailedSOPInstanceUIDList = failed_instances
 
-                bytestream = encode(
+                bytestream = self._encode(
                     dataset,
                     transfer_syntax.is_implicit_VR,
                     transfer_syntax.is_little_endian,
@@ -1739,7 +1942,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     rsp.Status = 0xB000
                     ds = Dataset()
                     ds.FailedSOPInstanceUIDList = failed_instances
-                    bytestream = encode(
+                    bytestream = self._encode(
                         ds,
                         transfer_syntax.is_implicit_VR,
                         transfer_syntax.is_little_endian,
@@ -1878,7 +2081,7 @@ class QueryRetrieveServiceClass(ServiceClass):
             #   (0008,0058) Failed SOP Instance UID List element
             ds = Dataset()
             ds.FailedSOPInstanceUIDList = failed_instances
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -1912,23 +2115,8 @@ class QueryRetrieveServiceClass(ServiceClass):
         rsp.MessageIDBeingRespondedTo = req.MessageID
         rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
 
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            try:
-                identifier = decode(
-                    req.Identifier,
-                    transfer_syntax.is_implicit_VR,
-                    transfer_syntax.is_little_endian,
-                    transfer_syntax.is_deflated
-                )
-                LOGGER.info('Move SCP Request Identifier:')
-                LOGGER.info('')
-                LOGGER.info('# DICOM Dataset')
-                for line in pretty_dataset(identifier):
-                    LOGGER.info(line)
-                LOGGER.info('')
-            except Exception:
-                # The user should deal with decoding failures
-                pass
+        # Decode and log Identifier
+        self._log_request_identifier(req, transfer_syntax, 'Move')
 
         # Try and trigger EVT_C_MOVE
         with attempt(rsp, self.dimse, cx_id) as ctx:
@@ -2101,7 +2289,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     dataset = Dataset()
                     dataset.FailedSOPInstanceUIDList = failed_instances
 
-                bytestream = encode(
+                bytestream = self._encode(
                     dataset,
                     transfer_syntax.is_implicit_VR,
                     transfer_syntax.is_little_endian,
@@ -2131,7 +2319,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     dataset = Dataset()
                     dataset.FailedSOPInstanceUIDList = failed_instances
 
-                bytestream = encode(
+                bytestream = self._encode(
                     dataset,
                     transfer_syntax.is_implicit_VR,
                     transfer_syntax.is_little_endian,
@@ -2161,7 +2349,7 @@ class QueryRetrieveServiceClass(ServiceClass):
 
                     ds = Dataset()
                     ds.FailedSOPInstanceUIDList = failed_instances
-                    bytestream = encode(
+                    bytestream = self._encode(
                         ds,
                         transfer_syntax.is_implicit_VR,
                         transfer_syntax.is_little_endian,
@@ -2287,7 +2475,7 @@ class QueryRetrieveServiceClass(ServiceClass):
             #   (0008, 0058) Failed SOP Instance UID List element
             ds = Dataset()
             ds.FailedSOPInstanceUIDList = failed_instances
-            bytestream = encode(
+            bytestream = self._encode(
                 ds,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -2381,23 +2569,7 @@ class RelevantPatientInformationQueryServiceClass(ServiceClass):
         rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
 
         # Decode and log Identifier
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            try:
-                identifier = decode(
-                    req.Identifier,
-                    transfer_syntax.is_implicit_VR,
-                    transfer_syntax.is_little_endian,
-                    transfer_syntax.is_deflated
-                )
-                LOGGER.info('Find SCP Request Identifier:')
-                LOGGER.info('')
-                LOGGER.debug('# DICOM Dataset')
-                for line in pretty_dataset(identifier):
-                    LOGGER.info(line)
-                LOGGER.info('')
-            except Exception:
-                # The user should deal with decoding failures
-                pass
+        self._log_request_identifier(req, transfer_syntax, 'Find')
 
         try:
             responses = evt.trigger(
@@ -2460,7 +2632,7 @@ class RelevantPatientInformationQueryServiceClass(ServiceClass):
             return
         elif status[0] == STATUS_PENDING:
             # If pending, the rsp_identifier is the Identifier dataset
-            bytestream = encode(
+            bytestream = self._encode(
                 rsp_identifier,
                 transfer_syntax.is_implicit_VR,
                 transfer_syntax.is_little_endian,
@@ -2481,7 +2653,10 @@ class RelevantPatientInformationQueryServiceClass(ServiceClass):
             rsp.Identifier = bytestream
 
             LOGGER.info(f'Find SCP Response:  0x{rsp.Status:04X} (Pending)')
-            if _config.LOG_RESPONSE_IDENTIFIERS:
+            if (
+                _config.LOG_RESPONSE_IDENTIFIERS
+                and LOGGER.isEnabledFor(logging.DEBUG)
+            ):
                 LOGGER.debug('Find SCP Response Identifier:')
                 LOGGER.debug('')
                 LOGGER.debug('# DICOM Dataset')
@@ -1,6 +1,5 @@
 """Generates the supported SOP Classes and well-known SOP Instances."""
 
-import inspect
 import logging
 import sys
 
@@ -53,55 +52,8 @@ def uid_to_service_class(uid):
         The Service Class corresponding to the SOP Class UID or the base class
         if support for the SOP Class isn't implemented.
     """
-    if uid in _SERVICE_CLASSES:
-        return _SERVICE_CLASSES[uid]
-    elif uid in _APPLICATION_EVENT_CLASSES.values():
-        return ApplicationEventLoggingServiceClass
-    elif uid in _BASIC_WORKLIST_CLASSES.values():
-        return BasicWorklistManagementServiceClass
-    elif uid in _COLOR_PALETTE_CLASSES.values():
-        return ColorPaletteQueryRetrieveServiceClass
-    elif uid in _DEFINED_PROCEDURE_CLASSES.values():
-        return DefinedProcedureProtocolQueryRetrieveServiceClass
-    elif uid in _DISPLAY_SYSTEM_CLASSES.values():
-        return DisplaySystemManagementServiceClass
-    elif uid in _HANGING_PROTOCOL_CLASSES.values():
-        return HangingProtocolQueryRetrieveServiceClass
-    elif uid in _IMPLANT_TEMPLATE_CLASSES.values():
-        return ImplantTemplateQueryRetrieveServiceClass
-    elif uid in _INSTANCE_AVAILABILITY_CLASSES.values():
-        return InstanceAvailabilityNotificationServiceClass
-    elif uid in _MEDIA_CREATION_CLASSES.values():
-        return MediaCreationManagementServiceClass
-    elif uid in _MEDIA_STORAGE_CLASSES.values():
-        return ServiceClass  # Not yet implemented
-    elif uid in _NON_PATIENT_OBJECT_CLASSES.values():
-        return NonPatientObjectStorageServiceClass
-    elif uid in _PRINT_MANAGEMENT_CLASSES.values():
-        return PrintManagementServiceClass
-    elif uid in _PROCEDURE_STEP_CLASSES.values():
-        return ProcedureStepServiceClass
-    elif uid in _PROTOCOL_APPROVAL_CLASSES.values():
-        return ProtocolApprovalQueryRetrieveServiceClass
-    elif uid in _QR_CLASSES.values():
-        return QueryRetrieveServiceClass
-    elif uid in _RELEVANT_PATIENT_QUERY_CLASSES.values():
-        return RelevantPatientInformationQueryServiceClass
-    elif uid in _RT_MACHINE_VERIFICATION_CLASSES.values():
-        return RTMachineVerificationServiceClass
-    elif uid in _STORAGE_CLASSES.values():
-        return StorageServiceClass
-    elif uid in _STORAGE_COMMITMENT_CLASSES.values():
-        return StorageCommitmentServiceClass
-    elif uid in _SUBSTANCE_ADMINISTRATION_CLASSES.values():
-        return SubstanceAdministrationQueryServiceClass
-    elif uid in _UNIFIED_PROCEDURE_STEP_CLASSES.values():
-        return UnifiedProcedureStepServiceClass
-    elif uid in _VERIFICATION_CLASSES.values():
-        return VerificationServiceClass
-
-    # No SCP implemented
-    return ServiceClass
+    # No SCP implemented if not in the index
+    return _UID_TO_SERVICE_CLASS.get(uid, ServiceClass)
 
 
 class SOPClass(UID):
@@ -126,9 +78,11 @@ class SOPClass(UID):
         return self._service_class
 
 
-def _generate_sop_classes(sop_class_dict):
-    """Generate the SOP Classes."""
+def _create_sop_class(uid):
+    """Return a new :class:`SOPClass` for `uid`.
 
+    .. versionadded:: 2.0
+    """
     _2019e = (
         '1.2.840.10008.5.1.4.1.1.88.74',
         '1.2.840.10008.5.1.4.1.1.88.75',
@@ -138,18 +92,44 @@ def _generate_sop_classes(sop_class_dict):
         '1.2.840.10008.5.1.4.1.1.481.13',
     )
 
-    for name in sop_class_dict:
-        uid = sop_class_dict[name]
-        sop_class = SOPClass(uid)
-        sop_class._service_class = uid_to_service_class(uid)
-        docstring = f"``{uid}``"
-        if uid in ('1.2.840.10008.5.1.1.9', '1.2.840.10008.5.1.1.18'):
-            docstring += "\n\n.. versionadded:: 1.4"
-        elif uid in _2019e:
-            docstring += "\n\n.. versionadded:: 1.5"
+    sop_class = SOPClass(uid)
+    sop_class._service_class = uid_to_service_class(uid)
+    docstring = f"``{uid}``"
+    if uid in ('1.2.840.10008.5.1.1.9', '1.2.840.10008.5.1.1.18'):
+        docstring += "\n\n.. versionadded:: 1.4"
+    elif uid in _2019e:
+        docstring += "\n\n.. versionadded:: 1.5"
+
+    sop_class.__doc__ = docstring
+
+    return sop_class
+
 
-        sop_class.__doc__ = docstring
-        globals()[name] = sop_class
+def __getattr__(name):
+    """Return the SOP Class `name`, creating it on first access.
+
+    .. versionadded:: 2.0
+
+    Creating the SOP Classes only when they're used keeps importing the
+    module fast.
+    """
+    uid = _SOP_CLASS_UIDS.get(name)
+    if uid is None:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+
+    # Another thread may have created it first
+    return globals().setdefault(name, _create_sop_class(uid))
+
+
+def __dir__():
+    """Return the module's attributes, including the SOP Classes that haven't
+    been created yet.
+
+    .. versionadded:: 2.0
+    """
+    return sorted(set(globals()) | set(_SOP_CLASS_UIDS))
 
 
 # Table of service classes with assigned UIDs
@@ -421,28 +401,73 @@ _VERIFICATION_CLASSES = {
 }
 
 # pylint: enable=line-too-long
-_generate_sop_classes(_APPLICATION_EVENT_CLASSES)
-_generate_sop_classes(_BASIC_WORKLIST_CLASSES)
-_generate_sop_classes(_COLOR_PALETTE_CLASSES)
-_generate_sop_classes(_DEFINED_PROCEDURE_CLASSES)
-_generate_sop_classes(_DISPLAY_SYSTEM_CLASSES)
-_generate_sop_classes(_HANGING_PROTOCOL_CLASSES)
-_generate_sop_classes(_IMPLANT_TEMPLATE_CLASSES)
-_generate_sop_classes(_INSTANCE_AVAILABILITY_CLASSES)
-_generate_sop_classes(_MEDIA_CREATION_CLASSES)
-_generate_sop_classes(_MEDIA_STORAGE_CLASSES)
-_generate_sop_classes(_NON_PATIENT_OBJECT_CLASSES)
-_generate_sop_classes(_PRINT_MANAGEMENT_CLASSES)
-_generate_sop_classes(_PROCEDURE_STEP_CLASSES)
-_generate_sop_classes(_PROTOCOL_APPROVAL_CLASSES)
-_generate_sop_classes(_QR_CLASSES)
-_generate_sop_classes(_RELEVANT_PATIENT_QUERY_CLASSES)
-_generate_sop_classes(_RT_MACHINE_VERIFICATION_CLASSES)
-_generate_sop_classes(_STORAGE_CLASSES)
-_generate_sop_classes(_STORAGE_COMMITMENT_CLASSES)
-_generate_sop_classes(_SUBSTANCE_ADMINISTRATION_CLASSES)
-_generate_sop_classes(_UNIFIED_PROCEDURE_STEP_CLASSES)
-_generate_sop_classes(_VERIFICATION_CLASSES)
+
+
+def _build_indexes():
+    """Return the {name: UID} and {UID: service class} indexes for the SOP
+    Classes.
+
+    .. versionadded:: 2.0
+    """
+    sop_classes = [
+        (_APPLICATION_EVENT_CLASSES, ApplicationEventLoggingServiceClass),
+        (_BASIC_WORKLIST_CLASSES, BasicWorklistManagementServiceClass),
+        (_COLOR_PALETTE_CLASSES, ColorPaletteQueryRetrieveServiceClass),
+        (
+            _DEFINED_PROCEDURE_CLASSES,
+            DefinedProcedureProtocolQueryRetrieveServiceClass
+        ),
+        (_DISPLAY_SYSTEM_CLASSES, DisplaySystemManagementServiceClass),
+        (_HANGING_PROTOCOL_CLASSES, HangingProtocolQueryRetrieveServiceClass),
+        (_IMPLANT_TEMPLATE_CLASSES, ImplantTemplateQueryRetrieveServiceClass),
+        (
+            _INSTANCE_AVAILABILITY_CLASSES,
+            InstanceAvailabilityNotificationServiceClass
+        ),
+        (_MEDIA_CREATION_CLASSES, MediaCreationManagementServiceClass),
+        (_MEDIA_STORAGE_CLASSES, ServiceClass),  # Not yet implemented
+        (_NON_PATIENT_OBJECT_CLASSES, NonPatientObjectStorageServiceClass),
+        (_PRINT_MANAGEMENT_CLASSES, PrintManagementServiceClass),
+        (_PROCEDURE_STEP_CLASSES, ProcedureStepServiceClass),
+        (
+            _PROTOCOL_APPROVAL_CLASSES,
+            ProtocolApprovalQueryRetrieveServiceClass
+        ),
+        (_QR_CLASSES, QueryRetrieveServiceClass),
+        (
+            _RELEVANT_PATIENT_QUERY_CLASSES,
+            RelevantPatientInformationQueryServiceClass
+        ),
+        (_RT_MACHINE_VERIFICATION_CLASSES, RTMachineVerificationServiceClass),
+        (_STORAGE_CLASSES, StorageServiceClass),
+        (_STORAGE_COMMITMENT_CLASSES, StorageCommitmentServiceClass),
+        (
+            _SUBSTANCE_ADMINISTRATION_CLASSES,
+            SubstanceAdministrationQueryServiceClass
+        ),
+        (_UNIFIED_PROCEDURE_STEP_CLASSES, UnifiedProcedureStepServiceClass),
+        (_VERIFICATION_CLASSES, VerificationServiceClass),
+    ]
+
+    names = {}
+    service_classes = dict(_SERVICE_CLASSES)
+    for sop_class_dict, service_class in sop_classes:
+        names.update(sop_class_dict)
+        for uid in sop_class_dict.values():
+            service_classes.setdefault(uid, service_class)
+
+    return names, service_classes
+
+
+# {SOP Class name: UID} and {UID: service class}
+_SOP_CLASS_UIDS, _UID_TO_SERVICE_CLASS = _build_indexes()
+# {UID: SOP Class name}
+_UID_TO_NAME = {uid: name for name, uid in _SOP_CLASS_UIDS.items()}
+
+# Module __getattr__() requires Python 3.7+
+if sys.version_info < (3, 7):
+    for _name, _uid in _SOP_CLASS_UIDS.items():
+        globals()[_name] = _create_sop_class(_uid)
 
 
 def uid_to_sop_class(uid):
@@ -464,15 +489,9 @@ def uid_to_sop_class(uid):
         If the SOP Class corresponding to the given UID has not been
         implemented.
     """
-    # Get a list of all the class members of the current module
-    members = inspect.getmembers(
-        sys.modules[__name__],
-        lambda mbr: isinstance(mbr, str)
-    )
-
-    for obj in members:
-        if hasattr(obj[1], 'service_class') and obj[1] == uid:
-            return obj[1]
+    name = _UID_TO_NAME.get(uid)
+    if name:
+        return getattr(sys.modules[__name__], name)
 
     sop_class = SOPClass(uid)
     sop_class._service_class = ServiceClass
@@ -521,3 +540,13 @@ UPSGlobalSubscriptionSOPInstance = UID('1.2.840.10008.5.1.4.34.5')
 
 .. versionadded:: 1.5
 """
+
+
+# The SOP Classes aren't module globals until first accessed so they have to
+#   be listed for `from pynetdicom.sop_class import *`
+__all__ = sorted(
+    set(_SOP_CLASS_UIDS) | {
+        _name for _name, _obj in globals().items()
+        if not _name.startswith('_') and not isinstance(_obj, type(sys))
+    }
+)
@@ -56,14 +56,23 @@ STORAGE_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xA700, 0xA7FF + 1):
-    STORAGE_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE,
-                                           'Refused: Out of Resources')
-for _code in range(0xA900, 0xA9FF + 1):
-    STORAGE_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE,
-                                           'Data Set Does Not Match SOP Class')
-for _code in range(0xC000, 0xCFFF + 1):
-    STORAGE_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE, 'Cannot Understand')
+STORAGE_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xA700, 0xA7FF + 1),
+        (STATUS_FAILURE, 'Refused: Out of Resources')
+    )
+)
+STORAGE_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xA900, 0xA9FF + 1),
+        (STATUS_FAILURE, 'Data Set Does Not Match SOP Class')
+    )
+)
+STORAGE_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Cannot Understand')
+    )
+)
 
 # Add the General status code values - PS3.7 9.1.1.1.9 and Annex C
 STORAGE_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
@@ -88,8 +97,11 @@ QR_FIND_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    QR_FIND_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE, 'Unable to Process')
+QR_FIND_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
+    )
+)
 
 # Add the General status code values - PS3.7 Annex C
 QR_FIND_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
@@ -127,8 +139,11 @@ QR_MOVE_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    QR_MOVE_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE, 'Unable to Process')
+QR_MOVE_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
+    )
+)
 
 # Add the General status code values - PS3.7 Annex C
 QR_MOVE_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
@@ -166,8 +181,11 @@ QR_GET_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    QR_GET_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE, 'Unable to Process')
+QR_GET_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
+    )
+)
 
 # Add the General status code values - PS3.7 Annex C
 QR_GET_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
@@ -188,9 +206,11 @@ MODALITY_WORKLIST_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    MODALITY_WORKLIST_SERVICE_CLASS_STATUS[_code] = (STATUS_FAILURE,
-                                                     'Unable to Process')
+MODALITY_WORKLIST_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
+    )
+)
 
 # Add the General status code values - PS3.7 Annex C
 MODALITY_WORKLIST_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
@@ -224,10 +244,11 @@ SUBSTANCE_ADMINISTRATION_SERVICE_CLASS_STATUS = {
 }
 
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    SUBSTANCE_ADMINISTRATION_SERVICE_CLASS_STATUS[_code] = (
-        STATUS_FAILURE, 'Unable to Process'
+SUBSTANCE_ADMINISTRATION_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
     )
+)
 
 SUBSTANCE_ADMINISTRATION_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
 
@@ -351,10 +372,11 @@ MEDIA_CREATION_MANAGEMENT_SERVICE_CLASS_STATUS.update(GENERAL_STATUS)
 # Unified Procedure Step Service specific status code values
 UNIFIED_PROCEDURE_STEP_SERVICE_CLASS_STATUS = {}
 # Ranged values
-for _code in range(0xC000, 0xCFFF + 1):
-    UNIFIED_PROCEDURE_STEP_SERVICE_CLASS_STATUS[_code] = (
-        STATUS_FAILURE, 'Unable to Process'
+UNIFIED_PROCEDURE_STEP_SERVICE_CLASS_STATUS.update(
+    dict.fromkeys(
+        range(0xC000, 0xCFFF + 1), (STATUS_FAILURE, 'Unable to Process')
     )
+)
 
 UNIFIED_PROCEDURE_STEP_SERVICE_CLASS_STATUS.update({
     0x0001 : (STATUS_WARNING,
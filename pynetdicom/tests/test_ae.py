@@ -582,6 +582,38 @@ class TestAEGoodMiscSetters(object):
         ae.maximum_pdu_size = 5000
         assert ae.maximum_pdu_size == 5000
 
+    def test_store_recv_spill_threshold(self):
+        """Check AE store_recv_spill_threshold change produces good value"""
+        ae = AE()
+        assert ae.store_recv_spill_threshold is None
+        ae.store_recv_spill_threshold = 0
+        assert ae.store_recv_spill_threshold == 0
+        ae.store_recv_spill_threshold = 5000
+        assert ae.store_recv_spill_threshold == 5000
+        ae.store_recv_spill_threshold = -10
+        assert ae.store_recv_spill_threshold is None
+        ae.store_recv_spill_threshold = 5000
+        ae.store_recv_spill_threshold = 'a'
+        assert ae.store_recv_spill_threshold is None
+
+    def test_codec_processes(self):
+        """Check AE codec_processes change produces good value"""
+        ae = AE()
+        assert ae.codec_processes is None
+        assert ae._codec_pool is None
+        ae.codec_processes = 2
+        assert ae.codec_processes == 2
+        pool = ae._codec_pool
+        assert pool.processes == 2
+        ae.codec_processes = 4
+        assert ae._codec_pool is not pool
+        assert ae._codec_pool.processes == 4
+        ae.codec_processes = 0
+        assert ae.codec_processes is None
+        assert ae._codec_pool is None
+        ae.codec_processes = 'a'
+        assert ae.codec_processes is None
+
     def test_require_calling_aet(self):
         """Test AE.require_calling_aet"""
         self.ae = ae = AE()
@@ -32,7 +32,9 @@ from pynetdicom import (
 )
 from pynetdicom.association import Association
 from pynetdicom.dimse_primitives import C_STORE, C_FIND, C_GET, C_MOVE
-from pynetdicom.dsutils import encode, decode
+from pynetdicom.dsutils import (
+    encode, decode, split_dataset, EncodedDataset, _ENCODE_CACHE
+)
 from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR, MODE_ACCEPTOR
 from pynetdicom.pdu_primitives import (
@@ -134,6 +136,115 @@ class TestAssociation(object):
 
         scp.shutdown()
 
+    def test_negotiation_cache(self):
+        """Test the server's negotiation results are reused."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.add_requested_context(VerificationSOPClass)
+        ae.add_requested_context(MRImageStorage)
+        results = []
+        for ii in range(2):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            contexts = assoc.accepted_contexts + assoc.rejected_contexts
+            results.append([(cx.abstract_syntax, cx.result) for cx in contexts])
+            assoc.release()
+
+        assert results[0] == results[1]
+        assert (VerificationSOPClass, 0x00) == results[0][0]
+        assert (MRImageStorage, 0x03) == results[0][1]
+
+        cache = scp._negotiation_cache
+        assert 1 == cache.hits
+        assert 1 == cache.misses
+
+        scp.shutdown()
+
+    def test_negotiation_cache_replaced_contexts(self):
+        """Test the cache isn't used if the supported contexts are replaced."""
+        def handle_req(event):
+            event.assoc.acceptor.supported_contexts = [
+                build_context(CTImageStorage)
+            ]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        hh = [(evt.EVT_REQUESTED, handle_req)]
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=hh)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.release()
+
+        cache = scp._negotiation_cache
+        assert 0 == cache.hits
+        assert 0 == cache.misses
+
+        scp.shutdown()
+
+    def test_shared_contexts(self):
+        """Test the server's contexts are only copied when accessed."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.add_requested_context(VerificationSOPClass)
+        assoc_a = ae.associate('localhost', 11112)
+        assoc_b = ae.associate('localhost', 11112)
+        assert assoc_a.is_established
+        assert assoc_b.is_established
+
+        acceptors = [assoc.acceptor for assoc in scp.active_associations]
+        assert 2 == len(acceptors)
+        for acceptor in acceptors:
+            assert acceptor._shared_contexts
+            assert acceptor._contexts is scp.contexts
+
+        contexts = acceptors[0].supported_contexts
+        assert not acceptors[0]._shared_contexts
+        assert contexts is not scp.contexts
+        assert contexts == scp.contexts
+        contexts[0].scp_role = True
+        assert scp.contexts[0].scp_role is None
+        assert acceptors[1]._contexts is scp.contexts
+
+        assoc_a.release()
+        assoc_b.release()
+        scp.shutdown()
+
+    def test_server_contexts_snapshot(self):
+        """Test changing the AE's contexts doesn't affect a running server."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+        ae.add_supported_context(
+            VerificationSOPClass, scu_role=True, scp_role=True
+        )
+        assert scp.contexts[0].scu_role is None
+
+        ae.add_requested_context(VerificationSOPClass)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.release()
+
+        scp.shutdown()
+
     def test_peer_releases_assoc(self):
         """Test peer releases association"""
         self.ae = ae = AE()
@@ -1198,6 +1309,9 @@ class TestAssociationSendCStore(object):
             self.ae.shutdown()
 
         _config.STORE_SEND_CHUNKED_DATASET = False
+        _config.STORE_SEND_CACHE_SIZE = None
+        _config.PDATA_QUEUE_SIZE = 16
+        _ENCODE_CACHE.clear()
 
     def test_must_be_associated(self):
         """Test SCU can't send without association."""
@@ -1637,7 +1751,450 @@ class TestAssociationSendCStore(object):
         recv = []
 
         def handle_store(event):
-            recv.append(event.dataset)
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+
+        assert assoc.is_established
+        assert isinstance(DATASET_PATH, str)
+        status = assoc.send_c_store(DATASET_PATH)
+        assert status.Status == 0x0000
+
+        p = Path(DATASET_PATH).resolve()
+        assert isinstance(p, Path)
+        status = assoc.send_c_store(p)
+        assert status.Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 2 == len(recv)
+        for ds in recv:
+            assert "CompressedSamples^CT1" == ds.PatientName
+            assert "DataSetTrailingPadding" in ds
+
+    def test_using_filepath_chunks(self):
+        """Test chunking send."""
+        _config.STORE_SEND_CHUNKED_DATASET = True
+
+        recv = []
+
+        def handle_store(event):
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        assoc = ae.associate('localhost', 11112)
+
+        assert assoc.is_established
+        assert isinstance(DATASET_PATH, str)
+        status = assoc.send_c_store(DATASET_PATH)
+        assert status.Status == 0x0000
+
+        p = Path(DATASET_PATH).resolve()
+        assert isinstance(p, Path)
+        status = assoc.send_c_store(p)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        ae.maximum_pdu_size = 0
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        status = assoc.send_c_store(p)
+        assert status.Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 3 == len(recv)
+        for ds in recv:
+            assert not hasattr(ds, "file_meta")
+            assert "CompressedSamples^CT1" == ds.PatientName
+            assert 126 == len(ds.DataSetTrailingPadding)
+
+    def test_using_encoded_dataset(self):
+        """Test sending an EncodedDataset from each type of source."""
+        recv = []
+
+        def handle_store(event):
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        file_meta, offset = split_dataset(DATASET_PATH)
+        with open(DATASET_PATH, 'rb') as f:
+            f.seek(offset)
+            raw = f.read()
+
+        def chunks():
+            for ii in range(0, len(raw), 1000):
+                yield raw[ii:ii + 1000]
+
+        uids = (
+            DATASET.SOPClassUID,
+            DATASET.SOPInstanceUID,
+            ExplicitVRLittleEndian
+        )
+        with open(DATASET_PATH, 'rb') as f:
+            f.seek(offset)
+            status = assoc.send_c_store(EncodedDataset(f, *uids))
+            assert status.Status == 0x0000
+
+        for source in [raw, memoryview(raw), chunks()]:
+            status = assoc.send_c_store(EncodedDataset(source, *uids))
+            assert status.Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 4 == len(recv)
+        for ds in recv:
+            assert "CompressedSamples^CT1" == ds.PatientName
+            assert 126 == len(ds.DataSetTrailingPadding)
+
+    def test_encoded_dataset_queue_bounded(self):
+        """Test an EncodedDataset is only read as fast as it's sent."""
+        _config.PDATA_QUEUE_SIZE = 4
+        recv = []
+
+        def handle_store(event):
+            recv.append(len(event.request.DataSet.getvalue()))
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        assoc = ae.associate('localhost', 11112, max_pdu=16382)
+        assert assoc.is_established
+
+        # 2 MB of Pixel Data read in 64 kB chunks
+        length = 2 * 1024**2
+        header = b'\xe0\x7f\x10\x00OB\x00\x00' + length.to_bytes(4, 'little')
+        depths = []
+        dul = assoc.dul
+
+        def chunks():
+            yield header
+            for ii in range(length // 65536):
+                depths.append(dul.to_provider_queue.qsize())
+                yield b'\x00' * 65536
+
+        ds = EncodedDataset(
+            chunks(), CTImageStorage, '1.2.3', ExplicitVRLittleEndian
+        )
+        assert assoc.send_c_store(ds).Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert [length + 12] == recv
+        assert 32 == len(depths)
+        assert max(depths) <= 4
+
+    def test_using_encoded_dataset_no_match(self):
+        """Test EncodedDataset requires a matching or convertible transfer
+        syntax.
+        """
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRBigEndian)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        ds = EncodedDataset(
+            b'', CTImageStorage, '1.2.3', ExplicitVRLittleEndian
+        )
+        msg = r"No presentation context for 'CT Image Storage' has been"
+        with pytest.raises(ValueError, match=msg):
+            assoc.send_c_store(ds)
+
+        assoc.release()
+        scp.shutdown()
+
+    def test_encoded_dataset_convert_invalid(self, caplog):
+        """Test an EncodedDataset that can't be converted."""
+        recv = []
+
+        def handle_store(event):
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage, ImplicitVRLittleEndian)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, ImplicitVRLittleEndian)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        # Implicit VR data declared as Explicit VR, detected before sending
+        raw = encode(DATASET, True, True)
+        ds = EncodedDataset(
+            raw, CTImageStorage, '1.2.3', ExplicitVRLittleEndian
+        )
+        msg = (
+            r"Unable to convert the encoded dataset from 'Explicit VR Little "
+            r"Endian' to 'Implicit VR Little Endian': Unable to convert the "
+            r"dataset as the element at offset 0 has an invalid VR"
+        )
+        with pytest.raises(ValueError, match=msg):
+            assoc.send_c_store(ds)
+
+        assert assoc.is_established
+        assert [] == recv
+
+        # Truncated data, detected while sending
+        raw = encode(DATASET, False, True)
+        ds = EncodedDataset(
+            raw[:-3], CTImageStorage, '1.2.3', ExplicitVRLittleEndian
+        )
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            status = assoc.send_c_store(ds)
+            assert Dataset() == status
+            assert (
+                "Failed to send the C-STORE request's dataset, aborting the "
+                "association"
+            ) in caplog.text
+            assert "The encoded dataset ended unexpectedly" in caplog.text
+
+        assert assoc.is_aborted
+        assert [] == recv
+
+        scp.shutdown()
+
+    def test_encoded_dataset_deflate(self):
+        """Test deflating/inflating an EncodedDataset while sending it."""
+        recv = []
+
+        def handle_store(event):
+            recv.append(
+                (event.context.transfer_syntax, event.file_meta, event.dataset)
+            )
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        ae.add_supported_context(
+            SecondaryCaptureImageStorage, ExplicitVRLittleEndian
+        )
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        ae.add_requested_context(
+            SecondaryCaptureImageStorage, ExplicitVRLittleEndian
+        )
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        # Explicit VR Little Endian -> Deflated Explicit VR Little Endian
+        file_meta, offset = split_dataset(DATASET_PATH)
+        with open(DATASET_PATH, 'rb') as f:
+            f.seek(offset)
+            raw = f.read()
+
+        ds = EncodedDataset(
+            raw,
+            DATASET.SOPClassUID,
+            DATASET.SOPInstanceUID,
+            ExplicitVRLittleEndian
+        )
+        assert assoc.send_c_store(ds).Status == 0x0000
+
+        # Deflated Explicit VR Little Endian -> Explicit VR Little Endian
+        deflated = encode(DEFL_DATASET, False, True, True)
+        ds = EncodedDataset(
+            BytesIO(deflated),
+            DEFL_DATASET.SOPClassUID,
+            DEFL_DATASET.SOPInstanceUID,
+            DeflatedExplicitVRLittleEndian
+        )
+        assert assoc.send_c_store(ds).Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 2 == len(recv)
+        tsyntax, file_meta, ds = recv[0]
+        assert tsyntax == DeflatedExplicitVRLittleEndian
+        assert file_meta.TransferSyntaxUID == ExplicitVRLittleEndian
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert 126 == len(ds.DataSetTrailingPadding)
+
+        tsyntax, file_meta, ds = recv[1]
+        assert tsyntax == ExplicitVRLittleEndian
+        assert file_meta.TransferSyntaxUID == ExplicitVRLittleEndian
+        assert '^^^^' == ds.PatientName
+
+    @pytest.mark.parametrize(
+        'tsyntax', [ExplicitVRLittleEndian, DeflatedExplicitVRLittleEndian]
+    )
+    def test_encode_cache(self, tsyntax):
+        """Test sending the same dataset to several destinations."""
+        _config.STORE_SEND_CACHE_SIZE = 10 * 1024**2
+
+        recv = []
+
+        def handle_store(event):
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage, tsyntax)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage, tsyntax)
+        assoc_a = ae.associate('localhost', 11112)
+        assoc_b = ae.associate('localhost', 11112)
+        assert assoc_a.is_established
+        assert assoc_b.is_established
+
+        ds = dcmread(DATASET_PATH)
+        assert assoc_a.send_c_store(ds).Status == 0x0000
+        assert assoc_b.send_c_store(ds).Status == 0x0000
+        assert 1 == _ENCODE_CACHE.hits
+        assert 1 == _ENCODE_CACHE.misses
+
+        # A modified dataset is encoded again
+        ds.PatientName = 'Test^Name'
+        assert assoc_a.send_c_store(ds).Status == 0x0000
+        assert 2 == _ENCODE_CACHE.misses
+
+        assoc_a.release()
+        assoc_b.release()
+        scp.shutdown()
+
+        assert 3 == len(recv)
+        assert "CompressedSamples^CT1" == recv[0].PatientName
+        assert "CompressedSamples^CT1" == recv[1].PatientName
+        assert "Test^Name" == recv[2].PatientName
+        assert recv[0].PixelData == recv[2].PixelData
+
+    @pytest.mark.parametrize('cache_size', [None, 10 * 1024**2])
+    def test_codec_pool(self, cache_size):
+        """Test encoding and decoding using the AE's process pool."""
+        _config.STORE_SEND_CACHE_SIZE = cache_size
+
+        recv = []
+
+        def handle_store(event):
+            recv.append(event.dataset)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.codec_processes = 2
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        ds = dcmread(DATASET_PATH)
+        assert assoc.send_c_store(ds).Status == 0x0000
+        assert assoc.send_c_store(ds).Status == 0x0000
+        assert ae._codec_pool._executor is not None
+
+        assoc.release()
+        scp.shutdown()
+
+        assert 2 == len(recv)
+        for received in recv:
+            assert "CompressedSamples^CT1" == received.PatientName
+            assert ds.PixelData == received.PixelData
+
+        ae.shutdown()
+        assert ae._codec_pool._executor is None
+
+    @pytest.mark.parametrize(
+        'original, tsyntax',
+        [
+            (ImplicitVRLittleEndian, ExplicitVRLittleEndian),
+            (ImplicitVRLittleEndian, DeflatedExplicitVRLittleEndian),
+            (ExplicitVRLittleEndian, ImplicitVRLittleEndian),
+            (DeflatedExplicitVRLittleEndian, ImplicitVRLittleEndian),
+        ]
+    )
+    def test_encoded_dataset_transcode(self, original, tsyntax):
+        """Test converting an EncodedDataset's VR encoding while sending."""
+        recv = []
+
+        def handle_store(event):
+            recv.append((event.context.transfer_syntax, event.dataset))
             return 0x0000
 
         handlers = [(evt.EVT_C_STORE, handle_store)]
@@ -1646,34 +2203,40 @@ class TestAssociationSendCStore(object):
         ae.acse_timeout = 5
         ae.dimse_timeout = 5
         ae.network_timeout = 5
-        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(RTImageStorage, tsyntax)
         scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
 
-        ae.add_requested_context(CTImageStorage)
-        assoc = ae.associate('localhost', 11112)
-
+        ae.add_requested_context(RTImageStorage, tsyntax)
+        assoc = ae.associate('localhost', 11112, max_pdu=16382)
         assert assoc.is_established
-        assert isinstance(DATASET_PATH, str)
-        status = assoc.send_c_store(DATASET_PATH)
-        assert status.Status == 0x0000
 
-        p = Path(DATASET_PATH).resolve()
-        assert isinstance(p, Path)
-        status = assoc.send_c_store(p)
-        assert status.Status == 0x0000
+        raw = encode(
+            BIG_DATASET,
+            original.is_implicit_VR,
+            True,
+            original.is_deflated
+        )
+        ds = EncodedDataset(
+            BytesIO(raw),
+            BIG_DATASET.SOPClassUID,
+            BIG_DATASET.SOPInstanceUID,
+            original
+        )
+        assert assoc.send_c_store(ds).Status == 0x0000
 
         assoc.release()
         assert assoc.is_released
 
         scp.shutdown()
 
-        assert 2 == len(recv)
-        for ds in recv:
-            assert "CompressedSamples^CT1" == ds.PatientName
-            assert "DataSetTrailingPadding" in ds
+        assert 1 == len(recv)
+        assert tsyntax == recv[0][0]
+        ds = recv[0][1]
+        for elem in BIG_DATASET:
+            assert elem.value == ds[elem.tag].value
 
-    def test_using_filepath_chunks(self):
-        """Test chunking send."""
+    def test_filepath_chunks_deflate(self):
+        """Test deflating a dataset read from file while sending it."""
         _config.STORE_SEND_CHUNKED_DATASET = True
 
         recv = []
@@ -1688,28 +2251,14 @@ class TestAssociationSendCStore(object):
         ae.acse_timeout = 5
         ae.dimse_timeout = 5
         ae.network_timeout = 5
-        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
         scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
 
-        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
         assoc = ae.associate('localhost', 11112)
-
         assert assoc.is_established
-        assert isinstance(DATASET_PATH, str)
-        status = assoc.send_c_store(DATASET_PATH)
-        assert status.Status == 0x0000
-
-        p = Path(DATASET_PATH).resolve()
-        assert isinstance(p, Path)
-        status = assoc.send_c_store(p)
-        assert status.Status == 0x0000
-        assoc.release()
-        assert assoc.is_released
 
-        ae.maximum_pdu_size = 0
-        assoc = ae.associate('localhost', 11112)
-        assert assoc.is_established
-        status = assoc.send_c_store(p)
+        status = assoc.send_c_store(DATASET_PATH)
         assert status.Status == 0x0000
 
         assoc.release()
@@ -1717,11 +2266,9 @@ class TestAssociationSendCStore(object):
 
         scp.shutdown()
 
-        assert 3 == len(recv)
-        for ds in recv:
-            assert not hasattr(ds, "file_meta")
-            assert "CompressedSamples^CT1" == ds.PatientName
-            assert 126 == len(ds.DataSetTrailingPadding)
+        assert 1 == len(recv)
+        assert "CompressedSamples^CT1" == recv[0].PatientName
+        assert 126 == len(recv[0].DataSetTrailingPadding)
 
     def test_using_filepath_chunks_missing(self):
         """Test receiving a success response from the peer"""
@@ -2392,6 +2939,307 @@ class TestAssociationSendCFind(object):
             )
             assert msg in caplog.text
 
+    def _start_find_scp(self, handle):
+        """Return an established association with a C-FIND SCP."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_supported_context(VerificationSOPClass)
+        ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_FIND, handle)]
+        )
+
+        ae.add_requested_context(
+            PatientRootQueryRetrieveInformationModelFind,
+            ExplicitVRLittleEndian
+        )
+        ae.add_requested_context(VerificationSOPClass)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        return assoc
+
+    def test_raw_identifiers(self):
+        """Test yielding the encoded response identifiers"""
+        def handle(event):
+            yield 0xFF00, self.ds
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            decode_identifiers=False
+        ))
+        assert 2 == len(results)
+        status, identifier = results[0]
+        assert status.Status == 0xFF00
+        assert isinstance(identifier, BytesIO)
+        assert identifier.getvalue() == encode(self.ds, False, True)
+        status, identifier = results[1]
+        assert status.Status == 0x0000
+        assert identifier is None
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_keywords(self):
+        """Test only decoding the given keywords"""
+        def handle(event):
+            ds = Dataset()
+            ds.SpecificCharacterSet = 'ISO_IR 100'
+            ds.PatientName = 'Test^Name'
+            ds.PatientID = '1234'
+            ds.QueryRetrieveLevel = 'PATIENT'
+            yield 0xFF00, ds
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            keywords=['PatientID']
+        ))
+        status, identifier = results[0]
+        assert status.Status == 0xFF00
+        assert ['PatientID', 'SpecificCharacterSet'] == identifier.dir()
+        assert '1234' == identifier.PatientID
+        assert results[1][0].Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_keywords_unknown(self):
+        """Test an unknown keyword raises an exception"""
+        def handle(event):
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        msg = r"Unknown element keyword 'PatientNom' in 'keywords'"
+        with pytest.raises(ValueError, match=msg):
+            assoc.send_c_find(
+                self.ds,
+                PatientRootQueryRetrieveInformationModelFind,
+                keywords=['PatientID', 'PatientNom']
+            )
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_max_results(self):
+        """Test a C-CANCEL is sent after the maximum number of results"""
+        cancelled = []
+
+        def handle(event):
+            for ii in range(20):
+                time.sleep(0.01)
+                if event.is_cancelled:
+                    cancelled.append(ii)
+                    yield 0xFE00, None
+                    return
+
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            max_results=3
+        ))
+        assert 4 == len(results)
+        assert ['0', '1', '2'] == [ds.PatientID for _, ds in results[:3]]
+        assert [0xFF00] * 3 == [status.Status for status, _ in results[:3]]
+        assert results[3][0].Status == 0xFE00
+        assert results[3][1] is None
+        assert cancelled and cancelled[0] < 20
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_max_results_invalid(self):
+        """Test max_results less than 1 raises an exception"""
+        def handle(event):
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        msg = r"'max_results' must be at least 1"
+        for value in (0, -1):
+            with pytest.raises(ValueError, match=msg):
+                assoc.send_c_find(
+                    self.ds,
+                    PatientRootQueryRetrieveInformationModelFind,
+                    max_results=value
+                )
+
+        # The association is still usable
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            max_results=1
+        ))
+        assert results[-1][0].Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_max_results_not_reached(self):
+        """Test no C-CANCEL is sent if the maximum isn't reached"""
+        def handle(event):
+            assert not event.is_cancelled
+            yield 0xFF00, self.ds
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            max_results=3
+        ))
+        assert [0xFF00, 0x0000] == [status.Status for status, _ in results]
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_prefetch(self):
+        """Test receiving and decoding the responses in advance"""
+        def handle(event):
+            for ii in range(20):
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        responses = assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            prefetch=5
+        )
+        results = []
+        for status, identifier in responses:
+            time.sleep(0.01)
+            results.append((status.Status, identifier))
+
+        assert 21 == len(results)
+        assert (
+            [str(ii) for ii in range(20)]
+            == [ds.PatientID for _, ds in results[:20]]
+        )
+        assert [0xFF00] * 20 == [status for status, _ in results[:20]]
+        assert results[20] == (0x0000, None)
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_prefetch_max_results(self):
+        """Test prefetching with a maximum number of results"""
+        def handle(event):
+            for ii in range(20):
+                time.sleep(0.01)
+                if event.is_cancelled:
+                    yield 0xFE00, None
+                    return
+
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            max_results=5,
+            prefetch=2,
+            keywords=['PatientID']
+        ))
+        assert 6 == len(results)
+        assert (
+            ['0', '1', '2', '3', '4'] == [ds.PatientID for _, ds in results[:5]]
+        )
+        assert results[5][0].Status == 0xFE00
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_prefetch_closed(self):
+        """Test closing the prefetcher before the final response"""
+        cancelled = []
+
+        def handle(event):
+            for ii in range(50):
+                time.sleep(0.01)
+                if event.is_cancelled:
+                    cancelled.append(ii)
+                    yield 0xFE00, None
+                    return
+
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        for close in (True, False):
+            responses = assoc.send_c_find(
+                self.ds,
+                PatientRootQueryRetrieveInformationModelFind,
+                prefetch=2
+            )
+            for ii, (status, identifier) in enumerate(responses):
+                assert status.Status == 0xFF00
+                if ii == 2:
+                    break
+
+            if close:
+                responses.close()
+            else:
+                del responses
+
+            # The remaining C-FIND responses aren't taken by later requests
+            status = assoc.send_c_echo()
+            assert status.Status == 0x0000
+
+        assert 2 == len(cancelled)
+        assert all(ii < 50 for ii in cancelled)
+
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            prefetch=2
+        ))
+        assert 51 == len(results)
+        assert results[-1][0].Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+    def test_prefetch_no_response(self):
+        """Test prefetching when the peer doesn't respond"""
+        def handle(event):
+            time.sleep(0.5)
+            yield 0x0000, None
+
+        assoc = self._start_find_scp(handle)
+        assoc.dimse_timeout = 0.1
+        results = list(assoc.send_c_find(
+            self.ds,
+            PatientRootQueryRetrieveInformationModelFind,
+            prefetch=2
+        ))
+        assert 1 == len(results)
+        assert results[0] == (Dataset(), None)
+        assert assoc.is_aborted
+
 
 class TestAssociationSendCCancel(object):
     """Run tests on Assocation send_c_cancel."""
@@ -4800,14 +5648,68 @@ class TestGetValidContext(object):
         assoc = ae.associate('localhost', 11112)
         assert assoc.is_established
 
+        # Encoded datasets can be converted between the little endian
+        #   transfer syntaxes while being sent
+        cx = assoc._get_valid_context(
+            CTImageStorage,
+            ExplicitVRLittleEndian,
+            'scu',
+            allow_conversion=False
+        )
+        assert cx.transfer_syntax[0] == ImplicitVRLittleEndian
+
+        msg = (
+            r"No presentation context for 'CT Image Storage' has been "
+            r"accepted by the peer with 'Explicit VR Big"
+        )
+        with pytest.raises(ValueError, match=msg):
+            assoc._get_valid_context(
+                CTImageStorage,
+                ExplicitVRBigEndian,
+                'scu',
+                allow_conversion=False
+            )
+
+        assoc.release()
+        scp.shutdown()
+
+    def test_stream_convertible(self):
+        """Test little endian contexts may be used for each other."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        cx = assoc._get_valid_context(
+            CTImageStorage,
+            ExplicitVRLittleEndian,
+            'scu',
+            allow_conversion=False
+        )
+        assert cx.transfer_syntax[0] == DeflatedExplicitVRLittleEndian
+
+        cx = assoc._get_valid_context(
+            CTImageStorage,
+            ImplicitVRLittleEndian,
+            'scu',
+            allow_conversion=False
+        )
+        assert cx.transfer_syntax[0] == DeflatedExplicitVRLittleEndian
+
         msg = (
             r"No presentation context for 'CT Image Storage' has been "
-            r"accepted by the peer with 'Explicit VR"
+            r"accepted by the peer with 'Explicit VR Big"
         )
         with pytest.raises(ValueError, match=msg):
             assoc._get_valid_context(
                 CTImageStorage,
-                ExplicitVRLittleEndian,
+                ExplicitVRBigEndian,
                 'scu',
                 allow_conversion=False
             )
@@ -4815,6 +5717,81 @@ class TestGetValidContext(object):
         assoc.release()
         scp.shutdown()
 
+    def accepted(self, assoc, contexts):
+        """Set `contexts` as the accepted contexts for `assoc`."""
+        for ii, cx in enumerate(contexts):
+            cx.context_id = 2 * ii + 1
+            cx.result = 0x00
+            cx._as_scu = True
+            cx._as_scp = False
+
+        assoc._accepted_cx = {cx.context_id: cx for cx in contexts}
+
+    def test_cached(self):
+        """Test matching contexts are only searched for once."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        self.accepted(
+            assoc,
+            [
+                build_context(CTImageStorage, ImplicitVRLittleEndian),
+                build_context(CTImageStorage, ExplicitVRLittleEndian),
+            ]
+        )
+
+        calls = []
+        find = assoc._find_valid_context
+
+        def find_valid_context(*args):
+            calls.append(args)
+            return find(*args)
+
+        assoc._find_valid_context = find_valid_context
+
+        cx = assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu'
+        )
+        assert 3 == cx.context_id
+        assert cx is assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu'
+        )
+        assert 1 == len(calls)
+
+        # Unknown context IDs are the same as no ID
+        assert cx is assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu', context_id=7
+        )
+        assert 1 == len(calls)
+
+        # Different parameters are searched for separately
+        cx = assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu', context_id=1
+        )
+        assert 1 == cx.context_id
+        assert 2 == len(calls)
+
+        # Failed searches aren't cached
+        msg = r"No presentation context for 'CT Image Storage'"
+        for ii in range(2):
+            with pytest.raises(ValueError, match=msg):
+                assoc._get_valid_context(CTImageStorage, '', 'scp')
+
+        assert 4 == len(calls)
+
+    def test_cache_accepted_replaced(self):
+        """Test the cache isn't used after the accepted contexts change."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        self.accepted(
+            assoc, [build_context(CTImageStorage, ImplicitVRLittleEndian)]
+        )
+        cx = assoc._get_valid_context(CTImageStorage, '', 'scu')
+        assert ImplicitVRLittleEndian == cx.transfer_syntax[0]
+
+        self.accepted(
+            assoc, [build_context(CTImageStorage, ExplicitVRLittleEndian)]
+        )
+        cx = assoc._get_valid_context(CTImageStorage, '', 'scu')
+        assert ExplicitVRLittleEndian == cx.transfer_syntax[0]
+
 
 class TestEventHandlingAcceptor(object):
     """Test the transport events and handling as acceptor."""
@@ -6155,6 +7132,59 @@ class TestEventHandlingRequestor(object):
         assoc.release()
         scp.shutdown()
 
+    def test_bound_events(self):
+        """Test the bound notification events are kept up to date."""
+        def dummy(event):
+            pass
+
+        self.ae = ae = AE()
+        assoc = Association(ae, 'requestor')
+        assert assoc._bound_events == frozenset()
+
+        assoc.bind(evt.EVT_DATA_SENT, dummy)
+        assoc.bind(evt.EVT_FSM_TRANSITION, dummy)
+        assoc.bind(evt.EVT_C_ECHO, dummy)
+        assert assoc._bound_events == {
+            evt.EVT_DATA_SENT, evt.EVT_FSM_TRANSITION
+        }
+
+        assoc.unbind(evt.EVT_DATA_SENT, dummy)
+        assoc.unbind(evt.EVT_C_ECHO, dummy)
+        assert assoc._bound_events == {evt.EVT_FSM_TRANSITION}
+
+        assoc.unbind(evt.EVT_FSM_TRANSITION, dummy)
+        assert assoc._bound_events == frozenset()
+
+    def test_per_pdu_events(self):
+        """Test the per-PDU events are only triggered when bound."""
+        triggered = []
+        def handle(event):
+            triggered.append(event.event)
+
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.send_c_echo()
+        assert triggered == []
+
+        events = (
+            evt.EVT_DATA_RECV, evt.EVT_DATA_SENT, evt.EVT_FSM_TRANSITION
+        )
+        for event in events:
+            assoc.bind(event, handle)
+
+        assoc.send_c_echo()
+        assoc.release()
+        assert assoc.is_released
+        for event in events:
+            assert event in triggered
+
+        scp.shutdown()
+
     def test_unbind_not_event(self):
         """Test unbind a handler if no events bound."""
         def dummy(event):
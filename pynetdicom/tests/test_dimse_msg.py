@@ -9,6 +9,8 @@ from pydicom.dataset import Dataset
 from pydicom.uid import UID
 
 from pynetdicom.dimse_messages import (
+    _encode_command_set, _decode_command_set, _encode_response_command_set,
+    _RESPONSE_TEMPLATES, _MemoryBudget, _Reservation, _STORE_RECV_MEMORY,
     C_STORE_RQ, C_STORE_RSP, DIMSEMessage, C_ECHO_RQ, C_ECHO_RSP, C_FIND_RQ,
     C_FIND_RSP, C_MOVE_RQ, C_MOVE_RSP, C_GET_RQ, C_GET_RSP, N_EVENT_REPORT_RQ,
     N_EVENT_REPORT_RSP, N_SET_RQ, N_SET_RSP, N_GET_RQ, N_GET_RSP, N_ACTION_RQ,
@@ -132,6 +134,31 @@ class TestDIMSEMessage(object):
         assert p_data_list[0].presentation_data_value_list[0][1] == c_store_rq_cmd
         assert p_data_list[1].presentation_data_value_list[0][1] == c_store_ds
 
+    def test_fragment_source(self):
+        """Test fragmenting streaming dataset sources."""
+        frag = DIMSEMessage._generate_source_fragments
+        data = bytes(range(100))
+
+        def chunks():
+            for ii in range(0, 100, 7):
+                yield data[ii:ii + 7]
+
+        for source in [BytesIO(data), data, memoryview(data), chunks()]:
+            result = list(frag(source, 16))
+            assert 10 == len(result)
+            assert [False] * 9 + [True] == [ii[1] for ii in result]
+            assert data == b''.join([ii[0] for ii in result])
+
+        for source in [BytesIO(data), data, memoryview(data), chunks()]:
+            result = list(frag(source, 0))
+            assert [(data, True)] == [(bytes(ii[0]), ii[1]) for ii in result]
+
+        for source in [BytesIO(), b'', iter([])]:
+            assert [(b'', True)] == list(frag(source, 16))
+
+        with pytest.raises(ValueError):
+            next(frag(data, 6))
+
     def test_encode_zero(self):
         """Test encoding with a 0 max pdu length."""
         primitive = C_STORE()
@@ -216,6 +243,44 @@ class TestDIMSEMessage(object):
         msg = C_STORE_RSP()
         assert not msg.decode_msg(c_store_rsp_cmd)
 
+    def test_decode_fragments(self):
+        """Test the fragments are only joined once complete."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = '1.1.1'
+        primitive.AffectedSOPInstanceUID = '1.2.1'
+        primitive.DataSet = BytesIO(b'\x01\x02' * 100)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+        p_data = list(msg.encode_msg(12, 24))
+
+        msg = DIMSEMessage()
+        for pdata in p_data[:-1]:
+            assert not msg.decode_msg(pdata)
+
+        assert msg.data_set.getvalue() == b''
+        assert 11 == len(msg._data_set_fragments)
+        assert isinstance(msg._data_set_fragments[0], memoryview)
+
+        assert msg.decode_msg(p_data[-1])
+        assert msg._data_set_fragments == []
+        assert msg.data_set.getvalue() == b'\x01\x02' * 100
+
+    def test_encode_no_copy(self):
+        """Test the dataset buffer is released after encoding."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = '1.1.1'
+        primitive.AffectedSOPInstanceUID = '1.2.1'
+        primitive.DataSet = BytesIO(b'\x01\x02' * 100)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+        p_data = list(msg.encode_msg(12, 24))
+        assert b'\x02\x01\x02' == p_data[-1].presentation_data_value_list[0][1]
+
+        # BytesIO can't be resized while the buffer is exported
+        primitive.DataSet.write(b'\x00')
+
     def test_primitive_to_message(self):
         """Test converting a DIMSE primitive to a DIMSE message."""
         primitive = C_STORE()
@@ -676,6 +741,143 @@ class TestDIMSEMessage(object):
         assert primitive.RequestedSOPInstanceUID is None
 
 
+class TestCommandSetCodec(object):
+    """Tests for the Command Set encoder and decoder."""
+    def test_roundtrip(self):
+        """Test the codec matches pydicom for the encoded messages."""
+        for cmd in [
+            c_echo_rq_cmd, c_echo_rsp_cmd, c_store_rq_cmd, c_store_rsp_cmd,
+            c_find_rq_cmd, c_find_rsp_cmd, c_get_rq_cmd, c_get_rsp_cmd,
+            c_move_rq_cmd, c_move_rsp_cmd, n_er_rq_cmd, n_er_rsp_cmd,
+            n_get_rq_cmd, n_get_rsp_cmd, n_delete_rq_cmd, n_delete_rsp_cmd,
+            n_action_rq_cmd, n_action_rsp_cmd, n_create_rq_cmd,
+            n_create_rsp_cmd, n_set_rq_cmd, n_set_rsp_cmd,
+            n_create_rq_cmd_empty, n_set_rq_cmd_empty,
+        ]:
+            values = _decode_command_set(cmd[1:])
+            ds = decode(BytesIO(cmd[1:]), True, True)
+            for elem in ds:
+                if elem.value in ['', None]:
+                    assert values[elem.keyword] in ['', None]
+                else:
+                    assert values[elem.keyword] == elem.value
+
+            assert _encode_command_set(values) == cmd[1:]
+            assert _encode_command_set(values) == encode(ds, True, True)
+
+    def test_group_length(self):
+        """Test the Command Group Length is always recalculated."""
+        values = _decode_command_set(c_move_rsp_cmd_with_dup[1:])
+        assert 0x72 == values['CommandGroupLength']
+        encoded = _encode_command_set(values)
+        assert b'\x8a\x00\x00\x00' == encoded[8:12]
+        assert encoded[12:] == c_move_rsp_cmd_with_dup[13:]
+
+    def test_encode_values(self):
+        """Test encoding the VRs used by the command set."""
+        values = {
+            'CommandGroupLength': None,
+            'AffectedSOPClassUID': UID('1.2.3'),
+            'CommandField': 0x0021,
+            'MessageID': 0,
+            'MoveDestination': b'SOME_AE',
+            'ErrorComment': 'Some error',
+            'OffendingElement': [0x00100010, (0x0010, 0x0020)],
+            'AffectedSOPInstanceUID': None,
+        }
+        ds = Dataset()
+        for keyword, value in values.items():
+            setattr(ds, keyword, value)
+
+        del ds.CommandGroupLength
+        encoded = encode(ds, True, True)
+        ds.CommandGroupLength = len(encoded)
+        assert encode(ds, True, True) == _encode_command_set(values)
+
+    def test_decode_skips_unknown(self, caplog):
+        """Test decoding skips non-DIMSE elements."""
+        ds = Dataset()
+        ds.CommandField = 0x0030
+        ds.NumberOfMatches = 12
+        ds.PatientID = '1234'
+        with caplog.at_level(logging.DEBUG, logger='pynetdicom'):
+            values = _decode_command_set(encode(ds, True, True))
+
+        assert {'CommandField': 0x0030} == values
+        assert (
+            "Skipping non-DIMSE element (0000,0850) in the received "
+            "Command Set"
+        ) in caplog.text
+        assert "(0010,0020)" in caplog.text
+
+    def test_modified_command_set(self):
+        """Test changes to the command set dataset are encoded."""
+        primitive = C_ECHO()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.1.1'
+        primitive.Status = 0x0000
+        msg = C_ECHO_RSP()
+        msg.primitive_to_message(primitive)
+        assert msg._command_set is None
+
+        msg.command_set.Status = 0xC000
+        msg.command_set.NumberOfMatches = 1
+        pdata = next(msg.encode_msg(1, 0))
+        cs = decode(
+            BytesIO(pdata.presentation_data_value_list[0][1][1:]), True, True
+        )
+        assert 0xC000 == cs.Status
+        assert 1 == cs.NumberOfMatches
+        assert len(encode(cs, True, True)) - 12 == cs.CommandGroupLength
+
+
+class TestResponseTemplates(object):
+    """Tests for the pre-encoded response Command Set templates."""
+    def test_template_matches(self):
+        """Test the templates encode the same as the standard encoder."""
+        primitive = C_STORE()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+        primitive.Status = 0x0000
+        for uid in ['1.2', '1.2.3', '1.2.3.4.5.6.7.8.9.10']:
+            primitive.AffectedSOPInstanceUID = uid
+            msg = C_STORE_RSP()
+            msg.primitive_to_message(primitive)
+            encoded = _encode_command_set(msg._command_values)
+            assert encoded == msg._encoded_command_values
+            assert len(encoded) - 12 == msg.command_set.CommandGroupLength
+
+        primitive = C_GET()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+        primitive.Status = 0xFF00
+        primitive.NumberOfRemainingSuboperations = 10
+        primitive.NumberOfCompletedSuboperations = 65535
+        primitive.NumberOfFailedSuboperations = 0
+        primitive.NumberOfWarningSuboperations = 2
+        msg = C_GET_RSP()
+        msg.primitive_to_message(primitive)
+        encoded = _encode_command_set(msg._command_values)
+        assert encoded == msg._encoded_command_values
+
+    def test_no_template(self):
+        """Test elements with other VRs don't use a template."""
+        primitive = C_ECHO()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.1.1'
+        primitive.Status = 0x0000
+        primitive.ErrorComment = 'Some comment'
+        _RESPONSE_TEMPLATES.clear()
+        msg = C_ECHO_RSP()
+        msg.primitive_to_message(primitive)
+        assert [None] == list(_RESPONSE_TEMPLATES.values())
+
+        values = msg._command_values
+        encoded = _encode_response_command_set('C-ECHO-RSP', values)
+        assert encoded == _encode_command_set(values)
+        assert encoded == msg._encoded_command_values
+
+
 class TestThreadSafety(object):
     """Tests for the thread safety of DIMSEMessage classes."""
 
@@ -746,7 +948,72 @@ class TestThreadSafety(object):
 
     def test_message_builder_regression(self):
         """Regression test for DIMSEMessage class builder."""
-        with pytest.raises(AttributeError, match=r"no attribute 'command_set'"):
-            assert C_STORE_RQ.command_set.MessageID
+        # The command set dataset belongs to each instance
+        assert isinstance(DIMSEMessage.__dict__['command_set'], property)
+        msg_a, msg_b = C_STORE_RQ(), C_STORE_RQ()
+        assert msg_a.command_set is not msg_b.command_set
+        assert msg_a.command_set is msg_a.command_set
         with pytest.raises(AttributeError, match=r"no attribute 'data_set'"):
             assert C_STORE_RQ.data_set.get_value() == b''
+
+
+class TestMemoryBudget(object):
+    """Tests for dimse_messages._MemoryBudget"""
+    def test_no_budget(self):
+        """Test reserving memory without a budget"""
+        budget = _MemoryBudget()
+        assert budget.reserve(1000, None)
+        assert budget.reserve(1000, None)
+        assert 2000 == budget.used
+        budget.release(1500)
+        assert 500 == budget.used
+
+    def test_budget(self):
+        """Test reserving memory with a budget"""
+        budget = _MemoryBudget()
+        assert budget.reserve(600, 1000)
+        assert not budget.reserve(600, 1000)
+        assert 600 == budget.used
+        assert budget.reserve(400, 1000)
+        assert not budget.reserve(1, 1000)
+        budget.release(1000)
+        assert 0 == budget.used
+
+    def test_partial_message_released(self):
+        """Test a partially received dataset releases its memory"""
+        used = _STORE_RECV_MEMORY.used
+        msg = C_STORE_RQ()
+        assert _STORE_RECV_MEMORY.reserve(100, None)
+        msg._data_set_reserved = 100
+        assert used + 100 == _STORE_RECV_MEMORY.used
+        del msg
+        assert used == _STORE_RECV_MEMORY.used
+
+    def test_reservation_passed_to_primitive(self):
+        """Test the memory reserved for a dataset is kept by the primitive"""
+        used = _STORE_RECV_MEMORY.used
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = '1.2.840.10008.5.1.4.1.1.2'
+        primitive.AffectedSOPInstanceUID = '1.2.3'
+        primitive.Priority = 0
+        primitive.DataSet = BytesIO(b'\x00' * 100)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+        assert _STORE_RECV_MEMORY.reserve(100, None)
+        msg._data_set_reserved = 100
+        primitive = msg.message_to_primitive()
+        del msg
+        assert used + 100 == _STORE_RECV_MEMORY.used
+        primitive._dataset_reservation.release()
+        assert used == _STORE_RECV_MEMORY.used
+        primitive._dataset_reservation.release()
+        assert used == _STORE_RECV_MEMORY.used
+
+    def test_reservation_released(self):
+        """Test a reservation releases its memory when garbage collected"""
+        used = _STORE_RECV_MEMORY.used
+        assert _STORE_RECV_MEMORY.reserve(100, None)
+        reservation = _Reservation(100)
+        del reservation
+        assert used == _STORE_RECV_MEMORY.used
@@ -2,7 +2,10 @@
 
 from copy import deepcopy
 from io import BytesIO
+import gc
 import logging
+from struct import pack
+import zlib
 
 import pytest
 
@@ -10,10 +13,20 @@ from pydicom import config
 from pydicom.dataset import Dataset
 from pydicom.dataelem import DataElement
 from pydicom.valuerep import DA, DSfloat, DSdecimal, DT, IS, TM
-from pydicom.uid import UID
-
-from pynetdicom import debug_logger
-from pynetdicom.dsutils import decode, encode, pretty_dataset, pretty_element
+from pydicom.uid import (
+    UID, ImplicitVRLittleEndian, ExplicitVRLittleEndian,
+    DeflatedExplicitVRLittleEndian
+)
+
+from pynetdicom import debug_logger, _config
+from pynetdicom.dsutils import (
+    decode, encode, pretty_dataset, pretty_element, _read_chunks,
+    _iter_source, _deflate, _inflate, _EncodeCache, _encode_dataset,
+    _ENCODE_CACHE, _transcode, _convert, _StreamReader, _CodecPool,
+    _estimate_length, _read_first, _pack_dataset, _unpack_dataset,
+    _pool_decode, _SharedValue
+)
+from pynetdicom import dsutils
 
 
 #debug_logger()
@@ -106,6 +119,18 @@ class TestDecode(object):
         ds = decode(bytestring, False, False)
         assert ds.PatientName == 'CITIZEN^Snips'
 
+    def test_specific_tags(self):
+        """Test only decoding specific elements."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Snips'
+        ds.PatientID = '1234'
+        ds.StudyInstanceUID = '1.2.3'
+        bytestring = BytesIO(encode(ds, False, True))
+        ds = decode(
+            bytestring, False, True, specific_tags=['PatientID', 0x0020000D]
+        )
+        assert ['PatientID', 'StudyInstanceUID'] == ds.dir()
+
 
 class TestDecodeFailure(object):
     """Tests that ensure dataset decoding fails as expected"""
@@ -621,3 +646,476 @@ class TestPrettyDataset(object):
         for line in out:
             print(line)
         assert ref == pretty_dataset(ds)
+
+
+class TestReadChunks(object):
+    """Test dsutils._read_chunks"""
+    def test_read(self, tmp_path):
+        """Test reading a file in chunks"""
+        fpath = tmp_path / 'test.raw'
+        fpath.write_bytes(b'\x00\x01\x02\x03\x04\x05\x06')
+
+        chunks = list(_read_chunks(fpath, chunk_size=3))
+        assert [b'\x00\x01\x02', b'\x03\x04\x05', b'\x06'] == chunks
+
+    def test_offset(self, tmp_path):
+        """Test reading from an offset"""
+        fpath = tmp_path / 'test.raw'
+        fpath.write_bytes(b'\x00\x01\x02\x03\x04\x05\x06')
+
+        chunks = list(_read_chunks(fpath, offset=4))
+        assert [b'\x04\x05\x06'] == chunks
+        assert [] == list(_read_chunks(fpath, offset=7))
+
+
+class TestIterSource(object):
+    """Test dsutils._iter_source"""
+    def test_sources(self):
+        """Test the different types of source"""
+        data = b'\x00\x01\x02\x03\x04\x05\x06'
+        ref = [b'\x00\x01\x02', b'\x03\x04\x05', b'\x06']
+        assert ref == list(_iter_source(BytesIO(data), 3))
+        assert ref == [bytes(c) for c in _iter_source(data, 3)]
+        assert ref == [bytes(c) for c in _iter_source(bytearray(data), 3)]
+        assert ref == [bytes(c) for c in _iter_source(memoryview(data), 3)]
+        assert ref == list(_iter_source(iter(ref), 1))
+        assert [] == list(_iter_source(b''))
+
+
+class TestDeflate(object):
+    """Test dsutils._deflate and dsutils._inflate"""
+    def test_roundtrip(self):
+        """Test deflating then inflating the data"""
+        data = bytes(range(256)) * 1000
+        deflated = b''.join(_deflate(data, chunk_size=1000))
+        assert len(deflated) < len(data)
+        assert 0 == len(deflated) % 2
+
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        assert data == decompressor.decompress(deflated)
+
+        assert data == b''.join(_inflate(deflated, chunk_size=3))
+        assert data == b''.join(_inflate(BytesIO(deflated)))
+
+    def test_even_length(self):
+        """Test the deflated data is padded to an even length"""
+        for length in range(1, 20):
+            deflated = b''.join(_deflate(b'\x01' * length))
+            assert 0 == len(deflated) % 2
+            assert b'\x01' * length == b''.join(_inflate(deflated))
+
+    def test_inflate_invalid(self):
+        """Test inflating invalid data raises"""
+        with pytest.raises(zlib.error):
+            list(_inflate(b'\xff' * 100))
+
+
+class TestEncodeCache(object):
+    """Test dsutils._EncodeCache"""
+    def setup(self):
+        """Run prior to each test"""
+        self.ds = Dataset()
+        self.ds.PatientName = 'Test'
+        self.ds.BeamSequence = [Dataset()]
+        self.ds.BeamSequence[0].PatientID = '1234'
+
+    def teardown(self):
+        """Clear the cache"""
+        _config.STORE_SEND_CACHE_SIZE = None
+        _ENCODE_CACHE.clear()
+
+    def test_hit(self):
+        """Test reusing the encoded dataset"""
+        cache = _EncodeCache()
+        out = cache.encode(self.ds, True, True, False, 1000)
+        assert out == encode(self.ds, True, True)
+        assert out is cache.encode(self.ds, True, True, False, 1000)
+        assert (1, 1) == (cache.hits, cache.misses)
+        assert len(out) == cache.size
+
+    def test_transfer_syntax(self):
+        """Test the encoding is part of the key"""
+        cache = _EncodeCache()
+        for args in [(True, True), (False, True), (False, False)]:
+            out = cache.encode(self.ds, *args, False, 1000)
+            assert out == encode(self.ds, *args)
+
+        out = cache.encode(self.ds, False, True, True, 1000)
+        assert out == encode(self.ds, False, True, True)
+        assert (0, 4) == (cache.hits, cache.misses)
+
+    def test_modified(self):
+        """Test a modified dataset is encoded again"""
+        cache = _EncodeCache()
+        cache.encode(self.ds, True, True, False, 1000)
+        self.ds.PatientName = 'Test2'
+        out = cache.encode(self.ds, True, True, False, 1000)
+        assert out == encode(self.ds, True, True)
+
+        self.ds.BeamSequence[0].PatientID = '5678'
+        out = cache.encode(self.ds, True, True, False, 1000)
+        assert out == encode(self.ds, True, True)
+
+        del self.ds.PatientName
+        out = cache.encode(self.ds, True, True, False, 1000)
+        assert out == encode(self.ds, True, True)
+
+        self.ds.BeamSequence.append(Dataset())
+        out = cache.encode(self.ds, True, True, False, 1000)
+        assert out == encode(self.ds, True, True)
+        assert (0, 5) == (cache.hits, cache.misses)
+        assert 1 == len(cache._cache)
+        assert len(out) == cache.size
+
+    def test_eviction(self):
+        """Test the least recently used dataset is removed"""
+        cache = _EncodeCache()
+        datasets = [deepcopy(self.ds) for ii in range(3)]
+        size = len(encode(self.ds, True, True))
+        for ds in datasets:
+            cache.encode(ds, True, True, False, size * 2)
+
+        assert size * 2 == cache.size
+        cache.encode(datasets[1], True, True, False, size * 2)
+        assert 1 == cache.hits
+        cache.encode(datasets[0], True, True, False, size * 2)
+        assert 1 == cache.hits
+
+        # Too large to cache
+        cache.clear()
+        cache.encode(self.ds, True, True, False, size - 1)
+        assert 0 == cache.size
+
+    def test_collected(self):
+        """Test the entry is removed when the dataset is collected"""
+        cache = _EncodeCache()
+        ds = deepcopy(self.ds)
+        cache.encode(ds, True, True, False, 1000)
+        cache.encode(self.ds, True, True, False, 1000)
+        assert 2 == len(cache._cache)
+
+        del ds
+        gc.collect()
+        assert 1 == len(cache._cache)
+        assert len(encode(self.ds, True, True)) == cache.size
+
+    def test_collected_locked(self):
+        """Test a dataset collected while the lock is held"""
+        cache = _EncodeCache()
+        ds = deepcopy(self.ds)
+        cache.encode(ds, True, True, False, 1000)
+
+        with cache._lock:
+            del ds
+            gc.collect()
+            assert 1 == len(cache._cache)
+            assert 1 == len(cache._dead)
+
+        # Removed the next time the cache is used
+        cache.encode(self.ds, True, True, False, 1000)
+        assert 1 == len(cache._cache)
+        assert [] == cache._dead
+        assert len(encode(self.ds, True, True)) == cache.size
+
+    def test_encode_dataset(self):
+        """Test the cache is only used if enabled"""
+        _encode_dataset(self.ds, True, True)
+        assert 0 == _ENCODE_CACHE.size
+
+        _config.STORE_SEND_CACHE_SIZE = 1000
+        _encode_dataset(self.ds, True, True)
+        assert 0 != _ENCODE_CACHE.size
+
+        _config.STORE_SEND_CACHE_SIZE = None
+        _encode_dataset(self.ds, True, True)
+        assert 0 == _ENCODE_CACHE.size
+
+
+def _join(chunks):
+    """Return the `chunks` joined together as bytes"""
+    return b''.join(bytes(c) for c in chunks)
+
+
+class TestTranscode(object):
+    """Test dsutils._transcode and dsutils._convert"""
+    def setup(self):
+        """Run prior to each test"""
+        ds = Dataset()
+        ds.PatientName = 'Citizen^Jan'
+        ds.PixelRepresentation = 1
+        ds.SmallestImagePixelValue = -1
+        ds.add_new(0x00090010, 'LO', 'Private Creator')
+        ds.add_new(0x00091001, 'UN', b'\x00\x01\x02\x03')
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].PatientID = '1234'
+        ds.BeamSequence[1].BeamSequence = [Dataset()]
+        ds.BeamSequence[1].BeamSequence[0].PatientID = '5678'
+        ds.ReferencedImageSequence = []
+        ds.BitsAllocated = 8
+        ds.add_new(0x7FE00010, 'OB', b'\x00\x01' * 20)
+        self.ds = ds
+
+    def check(self, ds, is_implicit_vr):
+        """Check the decoded `ds` matches the original"""
+        assert ds == self.ds
+        assert -1 == ds.SmallestImagePixelValue
+        if not is_implicit_vr:
+            assert 'SS' == ds['SmallestImagePixelValue'].VR
+            assert 'OB' == ds['PixelData'].VR
+            assert 'LO' == ds[0x00090010].VR
+            assert 'UN' == ds[0x00091001].VR
+
+    def test_implicit_to_explicit(self):
+        """Test converting implicit VR to explicit VR"""
+        raw = encode(self.ds, True, True)
+        for chunk_size in (1, 3, 7, 1000):
+            out = _join(_transcode(raw, False, chunk_size))
+            self.check(decode(BytesIO(out), False, True), False)
+
+    def test_explicit_to_implicit(self):
+        """Test converting explicit VR to implicit VR"""
+        raw = encode(self.ds, False, True)
+        for chunk_size in (1, 3, 7, 1000):
+            out = _join(_transcode(raw, True, chunk_size))
+            self.check(decode(BytesIO(out), True, True), True)
+
+    def test_undefined_length(self):
+        """Test converting sequences and items with undefined length"""
+        self.ds.BeamSequence.is_undefined_length = True
+        self.ds.BeamSequence[0].is_undefined_length_sequence_item = True
+        for is_implicit_vr in (True, False):
+            raw = encode(self.ds, is_implicit_vr, True)
+            out = _join(_transcode(raw, is_implicit_vr is False))
+            self.check(
+                decode(BytesIO(out), not is_implicit_vr, True),
+                not is_implicit_vr
+            )
+
+    def test_long_value(self):
+        """Test a value too long for the explicit VR is converted to UN"""
+        ds = Dataset()
+        ds.PatientName = 'A' * 0x10000
+        out = _join(_transcode(encode(ds, True, True), False))
+        assert b'UN' == out[4:6]
+        elem = decode(BytesIO(out), False, True)['PatientName']
+        assert b'A' * 0x10000 == elem.value
+
+    def test_un_sequence(self):
+        """Test converting an undefined length UN sequence"""
+        item = encode(self.ds.BeamSequence[0], True, True)
+        raw = (
+            b'\x0a\x30\xb0\x00UN\x00\x00\xff\xff\xff\xff'
+            b'\xfe\xff\x00\xe0' + pack('<L', len(item)) + item
+            + b'\xfe\xff\xdd\xe0\x00\x00\x00\x00'
+        )
+        out = _join(_transcode(raw, True))
+        ds = decode(BytesIO(out), True, True)
+        assert '1234' == ds.BeamSequence[0].PatientID
+
+    def test_encapsulated_raises(self):
+        """Test encapsulated data can't be converted"""
+        raw = b'\xe0\x7f\x10\x00OB\x00\x00\xff\xff\xff\xff'
+        msg = r"Unable to convert the dataset as it contains encapsulated"
+        with pytest.raises(ValueError, match=msg):
+            _join(_transcode(raw, True))
+
+    def test_truncated_raises(self):
+        """Test a truncated dataset raises"""
+        raw = encode(self.ds, True, True)
+        msg = r"The encoded dataset ended unexpectedly"
+        with pytest.raises(EOFError, match=msg):
+            _join(_transcode(raw[:-3], False))
+
+        with pytest.raises(EOFError, match=msg):
+            _join(_transcode(raw[:19], False))
+
+    def test_invalid_vr_raises(self):
+        """Test an explicit VR element with an invalid VR raises"""
+        # Implicit VR data declared as explicit VR
+        raw = encode(self.ds, True, True)
+        msg = (
+            r"Unable to convert the dataset as the element at offset 0 has an "
+            r"invalid VR"
+        )
+        with pytest.raises(ValueError, match=msg):
+            next(_transcode(raw, True))
+
+    def test_implicit_vr_cache_bounded(self, monkeypatch):
+        """Test the cache of implicit VRs is bounded"""
+        monkeypatch.setattr(dsutils, '_IMPLICIT_VR_SIZE', 5)
+        dsutils._IMPLICIT_VR.clear()
+        ds = Dataset()
+        for ii in range(1, 20):
+            ds.add_new(0x00111000 + ii, 'UN', b'\x00\x01')
+
+        out = _join(_transcode(encode(ds, True, True), False))
+        assert ds == decode(BytesIO(out), False, True)
+        assert 0 < len(dsutils._IMPLICIT_VR) <= 5
+
+    def test_read_first(self):
+        """Test _read_first() reads the first chunk straight away"""
+        raw = encode(self.ds, True, True)
+        chunks = _read_first(_transcode(raw, False))
+        out = _join(chunks)
+        self.check(decode(BytesIO(out), False, True), False)
+
+        assert [] == list(_read_first(iter([])))
+        with pytest.raises(ValueError, match=r"has an invalid VR"):
+            _read_first(_transcode(raw, True))
+
+    def test_convert(self):
+        """Test converting between the transfer syntaxes"""
+        syntaxes = [
+            ImplicitVRLittleEndian,
+            ExplicitVRLittleEndian,
+            DeflatedExplicitVRLittleEndian
+        ]
+        for original in syntaxes:
+            raw = encode(
+                self.ds,
+                original.is_implicit_VR,
+                True,
+                original.is_deflated
+            )
+            for tsyntax in syntaxes:
+                out = _join(_convert(BytesIO(raw), original, tsyntax))
+                ds = decode(
+                    BytesIO(out),
+                    tsyntax.is_implicit_VR,
+                    True,
+                    tsyntax.is_deflated
+                )
+                self.check(ds, tsyntax.is_implicit_VR)
+
+
+class TestStreamReader(object):
+    """Test dsutils._StreamReader"""
+    def test_read_stream(self):
+        """Test reading and streaming data"""
+        chunks = [b'\x00\x01\x02', b'\x03\x04', b'\x05\x06\x07\x08']
+        reader = _StreamReader(iter(chunks))
+        assert b'\x00\x01' == reader.read(2)
+        assert 2 == reader.tell()
+        assert b'\x02\x03\x04\x05' == _join(reader.stream(4))
+        assert 6 == reader.tell()
+        assert b'\x06' == reader.read(1)
+        assert b'\x07\x08' == _join(reader.stream(2))
+        assert b'' == reader.read(1)
+        assert 9 == reader.tell()
+
+
+class TestCodecPool(object):
+    """Test dsutils._CodecPool"""
+    def setup(self):
+        """Run prior to each test"""
+        self.ds = Dataset()
+        self.ds.PatientName = 'CITIZEN^Snips'
+        self.ds.PatientID = '1234'
+        self.ds.BeamSequence = [Dataset(), Dataset()]
+        self.ds.BeamSequence[0].BeamNumber = 1
+        self.ds.BeamSequence[1].BeamNumber = 2
+        self.ds.PixelData = b'\x00\x01' * 10000
+        self.ds['PixelData'].VR = 'OB'
+        self.ds.BitsAllocated = 8
+
+        self.pool = _CodecPool(2)
+
+    def teardown(self):
+        """Clear any active threads"""
+        self.pool.shutdown()
+        _config.CODEC_POOL_THRESHOLD = 16384
+
+    def test_estimate_length(self):
+        """Test estimating the encoded length of a dataset"""
+        assert 0 == _estimate_length(Dataset())
+        encoded = encode(self.ds, True, True)
+        for ds in (self.ds, decode(BytesIO(encoded), True, True)):
+            length = _estimate_length(ds)
+            assert len(encoded) * 0.9 < length < len(encoded) * 1.1
+
+    @pytest.mark.parametrize("syntax", [
+        ImplicitVRLittleEndian,
+        ExplicitVRLittleEndian,
+        DeflatedExplicitVRLittleEndian
+    ])
+    def test_encode_decode(self, syntax):
+        """Test encoding and decoding using the pool"""
+        args = (syntax.is_implicit_VR, True, syntax.is_deflated)
+        raw = encode(self.ds, *args)
+        assert raw == self.pool.encode(self.ds, *args)
+        assert self.pool._executor is not None
+
+        ds = self.pool.decode(BytesIO(raw), *args)
+        assert ds == self.ds
+        assert 1 == ds.BeamSequence[0].BeamNumber
+
+    def test_pack_shared(self):
+        """Test packing large values for shared memory"""
+        self.ds.BeamSequence[1].PerimeterValue = b'\x02\x03' * 1000
+        shared = []
+        packed = _pack_dataset(self.ds, shared)
+        assert [0, 2000] == [offset for offset, value in shared]
+        assert self.ds.BeamSequence[1].PerimeterValue == shared[0][1]
+        assert self.ds.PixelData == shared[1][1]
+        assert (
+            (0x7FE00010, 'OB', _SharedValue(2000, 20000), False) in packed[1]
+        )
+
+        buffer = memoryview(b''.join(value for offset, value in shared))
+        ds = _unpack_dataset(packed, buffer)
+        assert isinstance(ds.PixelData, memoryview)
+        assert ds.PixelData == self.ds.PixelData
+        assert encode(ds, True, True) == encode(self.ds, True, True)
+
+    def test_encode_shared(self):
+        """Test encoding a dataset with large values in sequences"""
+        self.ds.BeamSequence[1].PerimeterValue = b'\x02\x03' * 1000
+        raw = encode(self.ds, False, True)
+        assert raw == self.pool.encode(self.ds, False, True)
+
+    @pytest.mark.parametrize("deflated", [False, True])
+    def test_decode_shared(self, deflated):
+        """Test large decoded values are passed by position"""
+        raw = encode(self.ds, True, True, deflated)
+        packed = _pool_decode(raw, True, True, deflated)
+        pixel_data = [
+            elem[2] for elem in packed[1] if elem[0] == 0x7FE00010
+        ][0]
+        assert isinstance(pixel_data, _SharedValue) is not deflated
+
+        ds = _unpack_dataset(packed, raw)
+        assert isinstance(ds.PixelData, bytes)
+        assert self.ds == ds
+
+    def test_below_threshold(self):
+        """Test small datasets are encoded and decoded locally"""
+        del self.ds.PixelData
+        raw = encode(self.ds, True, True)
+        assert raw == self.pool.encode(self.ds, True, True)
+        assert self.ds == self.pool.decode(BytesIO(raw), True, True)
+        assert self.pool._executor is None
+
+    def test_encode_failure(self, caplog):
+        """Test failing to encode a dataset using the pool"""
+        _config.CODEC_POOL_THRESHOLD = 0
+        self.ds.PerimeterValue = b'\x00\x01'
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            assert self.pool.encode(self.ds, False, True) is None
+
+    def test_decode_unconverted(self):
+        """Test elements that fail to convert in the pool"""
+        del self.ds.BitsAllocated
+        raw = encode(self.ds, True, True)
+        ds = self.pool.decode(BytesIO(raw), True, True)
+        assert 'CITIZEN^Snips' == ds._dict[0x00100010].value
+        assert 'OB or OW' == ds._dict[0x7FE00010].VR
+        assert self.ds.PixelData == ds._dict[0x7FE00010].value
+
+    def test_shutdown(self):
+        """Test the pool is restarted after being shutdown"""
+        _config.CODEC_POOL_THRESHOLD = 0
+        raw = self.pool.encode(self.ds, True, True)
+        self.pool.shutdown()
+        assert self.pool._executor is None
+        assert raw == self.pool.encode(self.ds, True, True)
+        assert self.pool._executor is not None
@@ -6,6 +6,7 @@ from io import BytesIO
 import logging
 import os
 import sys
+import threading
 import time
 
 import pytest
@@ -24,11 +25,14 @@ from pynetdicom.events import (
     _sop_extended_handler, _user_identity_handler, _c_echo_handler,
     _c_get_handler, _c_find_handler, _c_move_handler, _c_store_handler,
     _n_action_handler, _n_create_handler, _n_delete_handler,
-    _n_event_report_handler, _n_get_handler, _n_set_handler
+    _n_event_report_handler, _n_get_handler, _n_set_handler,
+    _c_store_sink_handler, _NotificationDispatcher, dispatch_statistics,
+    wait_for_dispatch
 )
 from pynetdicom.dimse_messages import (
     N_ACTION, N_CREATE, N_EVENT_REPORT, N_SET, N_GET, N_DELETE, C_STORE
 )
+from pynetdicom.dimse_primitives import C_FIND
 from pynetdicom.sop_class import VerificationSOPClass
 
 
@@ -197,6 +201,17 @@ class TestEvent(object):
         with pytest.raises(AttributeError, match=msg):
             event.dataset_path
 
+        msg = (
+            r"The corresponding event is not a C-STORE request and has no "
+            r"'Data Set' parameter"
+        )
+        with pytest.raises(AttributeError, match=msg):
+            event.dataset_sink
+        with pytest.raises(AttributeError, match=msg):
+            event.dataset_sink_error
+        with pytest.raises(AttributeError, match=msg):
+            event.encoded_dataset
+
     def test_is_cancelled_non(self):
         """Test Event.is_cancelled with wrong event type."""
         event = evt.Event(None, evt.EVT_DATA_RECV)
@@ -318,6 +333,48 @@ class TestEvent(object):
         event._hash = None
         assert 'PatientID' not in event.event_information
 
+    def test_request_decoded(self):
+        """Test Event uses a dataset already decoded for the request."""
+        request = C_FIND()
+        request.Identifier = BytesIO(
+            b'\x08\x00\x52\x00\x08\x00\x00\x00PATIENT '
+        )
+        ds = Dataset()
+        ds.PatientID = '1234'
+        request._decoded = ('Identifier', hash(request.Identifier), ds)
+
+        event = Event(
+            None,
+            evt.EVT_C_FIND,
+            {'request' : request, 'context' : self.context.as_tuple}
+        )
+        assert event.identifier is ds
+        assert request._decoded is None
+        assert event._hash == hash(request.Identifier)
+        assert event._decoded is ds
+
+        # Decoded dataset is only used once
+        event._hash = None
+        assert 'PATIENT' == event.identifier.QueryRetrieveLevel
+        assert 'PatientID' not in event.identifier
+
+    def test_request_decoded_mismatch(self):
+        """Test Event ignores a decoded dataset for another parameter."""
+        request = C_FIND()
+        request.Identifier = BytesIO(
+            b'\x08\x00\x52\x00\x08\x00\x00\x00PATIENT '
+        )
+        ds = Dataset()
+        request._decoded = ('DataSet', hash(request.Identifier), ds)
+
+        event = Event(
+            None,
+            evt.EVT_C_FIND,
+            {'request' : request, 'context' : self.context.as_tuple}
+        )
+        assert event.identifier is not ds
+        assert 'PATIENT' == event.identifier.QueryRetrieveLevel
+
     def test_file_meta(self):
         """Test Event.file_meta."""
         request = C_STORE()
@@ -492,14 +549,107 @@ INTERVENTION_HANDLERS = [
     _sop_extended_handler, _user_identity_handler, _c_echo_handler,
     _c_get_handler, _c_find_handler, _c_move_handler, _c_store_handler,
     _n_action_handler, _n_create_handler, _n_delete_handler,
-    _n_event_report_handler, _n_get_handler, _n_set_handler
+    _n_event_report_handler, _n_get_handler, _n_set_handler,
+    _c_store_sink_handler
 ]
 
 @pytest.mark.parametrize('handler', INTERVENTION_HANDLERS)
 def test_default_handlers(handler):
     if handler not in [_sop_common_handler, _sop_extended_handler,
-                       _c_echo_handler]:
+                       _c_echo_handler, _c_store_sink_handler]:
         with pytest.raises(NotImplementedError):
             handler(None)
     else:
         handler(None)
+
+
+class TestNotificationDispatcher(object):
+    """Tests for calling notification handlers asynchronously."""
+    def setup(self):
+        self.assoc = Association(AE(), 'requestor')
+
+    def teardown(self):
+        _config.ASYNC_NOTIFICATION_HANDLERS = False
+
+    def test_synchronous(self):
+        """Test notification handlers are called synchronously by default."""
+        threads = []
+        def handle(event):
+            threads.append(threading.current_thread())
+
+        self.assoc.bind(evt.EVT_DATA_SENT, handle)
+        trigger(self.assoc, evt.EVT_DATA_SENT, {'data': b'\x00'})
+        assert threads == [threading.current_thread()]
+
+    def test_asynchronous(self):
+        """Test notification handlers are called from the dispatcher."""
+        _config.ASYNC_NOTIFICATION_HANDLERS = True
+        events = []
+        def handle(event, arg):
+            events.append((event, arg, threading.current_thread()))
+
+        self.assoc.bind(evt.EVT_DATA_SENT, handle, ['a'])
+        before = dispatch_statistics()['dispatched']
+        for ii in range(5):
+            trigger(self.assoc, evt.EVT_DATA_SENT, {'data': bytes([ii])})
+
+        wait_for_dispatch()
+        assert [ee[0].data for ee in events] == [
+            b'\x00', b'\x01', b'\x02', b'\x03', b'\x04'
+        ]
+        assert all(ee[1] == 'a' for ee in events)
+        assert all(ee[2].name == 'NotificationDispatcher' for ee in events)
+
+        stats = dispatch_statistics()
+        assert stats['dispatched'] == before + 5
+        assert stats['queued'] == 0
+        assert stats['peak'] >= 1
+
+    def test_asynchronous_raises(self, caplog):
+        """Test exceptions in asynchronous handlers are logged."""
+        _config.ASYNC_NOTIFICATION_HANDLERS = True
+        def handle(event):
+            raise ValueError("Exception in handler")
+
+        self.assoc.bind(evt.EVT_DATA_SENT, handle)
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            trigger(self.assoc, evt.EVT_DATA_SENT, {'data': b'\x00'})
+            wait_for_dispatch()
+
+        assert (
+            "Exception raised in user's 'evt.EVT_DATA_SENT' event handler "
+            "'handle'"
+        ) in caplog.text
+        assert "Exception in handler" in caplog.text
+
+    def test_intervention_synchronous(self):
+        """Test intervention handlers are always called synchronously."""
+        _config.ASYNC_NOTIFICATION_HANDLERS = True
+        threads = []
+        def handle(event):
+            threads.append(threading.current_thread())
+            return 0x0000
+
+        self.assoc.bind(evt.EVT_C_ECHO, handle)
+        assert 0x0000 == trigger(self.assoc, evt.EVT_C_ECHO, {})
+        assert threads == [threading.current_thread()]
+
+    def test_dropped(self, caplog):
+        """Test events are dropped when the queue is full."""
+        dispatcher = _NotificationDispatcher(2)
+        with caplog.at_level(logging.WARNING, logger='pynetdicom'):
+            assert dispatcher.put(None, [])
+            assert dispatcher.put(None, [])
+            assert not dispatcher.put(None, [])
+            assert not dispatcher.put(None, [])
+
+        assert dispatcher.dropped == 2
+        assert dispatcher.peak == 2
+        assert dispatcher.queued == 2
+        assert 1 == caplog.text.count("notification event queue is full")
+
+        # Events are accepted again once there's space
+        dispatcher.start()
+        dispatcher.wait()
+        assert dispatcher.dispatched == 2
+        assert dispatcher.put(None, [])
@@ -0,0 +1,84 @@
+"""Tests for the pynetdicom package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pynetdicom
+from pynetdicom import _LAZY_IMPORTS
+from pynetdicom.ae import ApplicationEntity
+from pynetdicom.presentation import StoragePresentationContexts
+
+
+def run_python(code):
+    """Return the output from running `code` in a new interpreter."""
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return out.decode('utf-8').strip()
+
+
+class TestLazyImports(object):
+    """Tests for the package's convenience imports."""
+    def test_import_is_lazy(self):
+        """Test importing pynetdicom doesn't import the submodules."""
+        out = run_python(
+            "import sys; import pynetdicom; "
+            "print(sorted(m for m in sys.modules if 'pynetdicom.' in m))"
+        )
+        assert "['pynetdicom._version']" == out
+
+    def test_import_on_access(self):
+        """Test the submodule is imported when the name is used."""
+        out = run_python(
+            "import sys; from pynetdicom import AE; "
+            "print('pynetdicom.association' in sys.modules)"
+        )
+        assert 'True' == out
+
+    def test_names(self):
+        """Test the convenience imports are the expected objects."""
+        assert ApplicationEntity is pynetdicom.AE
+        assert StoragePresentationContexts is (
+            pynetdicom.StoragePresentationContexts
+        )
+        assert pynetdicom.evt.EVT_C_STORE
+        for name in _LAZY_IMPORTS:
+            assert getattr(pynetdicom, name) is not None
+
+    def test_dir(self):
+        """Test dir() includes the convenience imports."""
+        names = dir(pynetdicom)
+        for name in _LAZY_IMPORTS:
+            assert name in names
+
+        assert 'debug_logger' in names
+
+    def test_unknown_raises(self):
+        """Test an unknown name raises AttributeError."""
+        msg = r"module 'pynetdicom' has no attribute 'Unknown'"
+        with pytest.raises(AttributeError, match=msg):
+            pynetdicom.Unknown
+
+        with pytest.raises(ImportError):
+            from pynetdicom import Unknown
+
+    def test_star_import(self):
+        """Test `from pynetdicom import *` includes the convenience imports."""
+        namespace = {}
+        exec("from pynetdicom import *", namespace)
+        for name in _LAZY_IMPORTS:
+            assert namespace[name] is getattr(pynetdicom, name)
+
+        assert namespace['AE'] is ApplicationEntity
+        assert namespace['debug_logger'] is pynetdicom.debug_logger
+        assert 'PYNETDICOM_IMPLEMENTATION_UID' in namespace
+        assert '_LAZY_IMPORTS' not in namespace
+        assert 'sys' not in namespace
+
+    def test_star_import_new_interpreter(self):
+        """Test `from pynetdicom import *` in a new interpreter."""
+        out = run_python(
+            "from pynetdicom import *; "
+            "print(AE.__name__, len(StoragePresentationContexts))"
+        )
+        assert f"ApplicationEntity {len(StoragePresentationContexts)}" == out
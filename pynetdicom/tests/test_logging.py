@@ -17,6 +17,7 @@ from pydicom.uid import (
 
 from pynetdicom import build_context, evt, AE, build_role, debug_logger
 from pynetdicom.acse import ACSE, APPLICATION_CONTEXT_NAME
+from pynetdicom.association import Association
 from pynetdicom.dimse_primitives import C_MOVE, N_EVENT_REPORT, N_GET, N_DELETE
 from pynetdicom._handlers import (
     doc_handle_echo, doc_handle_find, doc_handle_c_get, doc_handle_move,
@@ -25,7 +26,9 @@ from pynetdicom._handlers import (
     doc_handle_async, doc_handle_sop_common, doc_handle_sop_extended,
     doc_handle_userid, doc_handle_acse, doc_handle_dimse, doc_handle_data,
     doc_handle_pdu, doc_handle_transport, doc_handle_assoc, doc_handle_fsm,
-    debug_fsm, debug_data
+    debug_fsm, debug_data, standard_pdu_recv_handler,
+    standard_pdu_sent_handler, standard_dimse_recv_handler,
+    standard_dimse_sent_handler
 )
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ, A_ASSOCIATE_AC,
@@ -1318,6 +1321,79 @@ class TestStandardLogging(object):
             scp.shutdown()
 
 
+class TestStandardLoggingLevel(object):
+    """Tests for the standard logging handlers and the logging level."""
+    def setup(self):
+        """Setup each test."""
+        self.ae = None
+
+    def teardown(self):
+        """Cleanup after each test"""
+        if self.ae:
+            self.ae.shutdown()
+
+    @pytest.mark.parametrize('level, pdu, dimse', [
+        (logging.DEBUG, True, True),
+        (logging.INFO, False, True),
+        (logging.WARNING, False, False),
+    ])
+    def test_is_enabled(self, level, pdu, dimse, caplog):
+        """Test the handlers are only enabled for the levels they use."""
+        with caplog.at_level(level, logger='pynetdicom'):
+            assert standard_pdu_recv_handler._is_enabled() is pdu
+            assert standard_pdu_sent_handler._is_enabled() is pdu
+            assert standard_dimse_recv_handler._is_enabled() is dimse
+            assert standard_dimse_sent_handler._is_enabled() is dimse
+
+    def test_trigger_skips_disabled(self):
+        """Test trigger() doesn't call disabled handlers."""
+        events = []
+        def enabled(event):
+            events.append(event)
+
+        def disabled(event):
+            events.append(None)
+
+        disabled._is_enabled = lambda: False
+
+        self.ae = ae = AE()
+        assoc = Association(ae, 'requestor')
+        assoc.unbind(evt.EVT_DIMSE_SENT, standard_dimse_sent_handler)
+        assoc.bind(evt.EVT_DIMSE_SENT, disabled)
+        evt.trigger(assoc, evt.EVT_DIMSE_SENT, {'message': None})
+        assert events == []
+
+        assoc.bind(evt.EVT_DIMSE_SENT, enabled)
+        evt.trigger(assoc, evt.EVT_DIMSE_SENT, {'message': None})
+        assert len(events) == 1
+        assert events[0] is not None
+
+    @pytest.mark.parametrize('level', [
+        logging.DEBUG, logging.INFO, logging.WARNING
+    ])
+    def test_logging_level(self, level, caplog):
+        """Test only the output for the current level is produced."""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        with caplog.at_level(level, logger='pynetdicom'):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            assoc.send_c_echo()
+            assoc.release()
+            assert assoc.is_released
+
+        scp.shutdown()
+
+        text = caplog.text
+        assert ('Received Echo Response' in text) is (level <= logging.INFO)
+        assert ('Received Echo Request' in text) is (level <= logging.INFO)
+        assert ('INCOMING DIMSE MESSAGE' in text) is (level == logging.DEBUG)
+        assert ('Request Parameters' in text) is (level == logging.DEBUG)
+
+
 class TestDebuggingLogging(object):
     """Tests for debugging handlers."""
     def setup(self):
@@ -1,5 +1,6 @@
 """Tests for the presentation module."""
 
+from copy import deepcopy
 import logging
 import sys
 
@@ -16,6 +17,7 @@ from pynetdicom.presentation import (
     PresentationContext,
     negotiate_as_acceptor,
     negotiate_as_requestor,
+    _NegotiationCache,
     DEFAULT_TRANSFER_SYNTAXES,
     ApplicationEventLoggingPresentationContexts,
     BasicWorklistManagementPresentationContexts,
@@ -194,6 +196,37 @@ class TestPresentationContext(object):
         cx_d.transfer_syntax[1] = '1.2.3.5'
         assert hash(cx_c) == hash(cx_d)
 
+    def test_deepcopy(self):
+        """Test deep copying the context"""
+        cx_a = build_context('1.2.3', ['1.2.3.4', '1.2.3.5'])
+        cx_a.context_id = 3
+        cx_a.scu_role = True
+        cx_a.result = 0x00
+        cx_a._as_scp = True
+        cx_a.extra = [1, 2]
+
+        cx_b = deepcopy(cx_a)
+        assert cx_a == cx_b
+        assert cx_a is not cx_b
+        assert cx_b.abstract_syntax == '1.2.3'
+        assert isinstance(cx_b.abstract_syntax, UID)
+        assert 3 == cx_b.context_id
+        assert cx_b.scu_role
+        assert cx_b.scp_role is None
+        assert cx_b.as_scp
+
+        # Mutable values aren't shared
+        assert cx_a.transfer_syntax is not cx_b.transfer_syntax
+        cx_b.transfer_syntax.append('1.2.3.6')
+        cx_b.add_transfer_syntax('1.2.3.7')
+        assert ['1.2.3.4', '1.2.3.5'] == cx_a.transfer_syntax
+        assert cx_a.extra is not cx_b.extra
+        assert [1, 2] == cx_b.extra
+
+        # Contexts in the same container are only copied once
+        contexts = deepcopy([cx_a, cx_a])
+        assert contexts[0] is contexts[1]
+
     def test_string_output(self):
         """Test string output"""
         pc = PresentationContext()
@@ -974,6 +1007,147 @@ class TestNegotiateAsAcceptorWithRoleSelection(object):
             assert cx.as_scp is False
 
 
+class TestNegotiationCache(object):
+    """Tests for _NegotiationCache."""
+    def teardown(self):
+        """Run after each test"""
+        _config.NEGOTIATION_CACHE_SIZE = 128
+
+    @staticmethod
+    def summarise(contexts, roles):
+        """Return the negotiation results as comparable values."""
+        return (
+            [
+                (
+                    cx.context_id, cx.abstract_syntax, cx.transfer_syntax,
+                    cx.result, cx.as_scu, cx.as_scp
+                ) for cx in contexts
+            ],
+            [(rr.sop_class_uid, rr.scu_role, rr.scp_role) for rr in roles]
+        )
+
+    @pytest.mark.parametrize("req, acc, out", REFERENCE_ROLES)
+    def test_matches_uncached(self, req, acc, out):
+        """Test the cached results match negotiate_as_acceptor()."""
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+        rq_roles = {'1.2.3.4' : (req[0], req[1])}
+        rq2 = build_context('1.2.3.5', '1.2.840.10008.1.2.2')
+        rq2.context_id = 3
+
+        ac = build_context(
+            '1.2.3.4', ['1.2.840.10008.1.2.1', '1.2.840.10008.1.2']
+        )
+        ac.scu_role = acc[0]
+        ac.scp_role = acc[1]
+        ac2 = build_context('1.2.3.5', '1.2.840.10008.1.2')
+
+        expected = self.summarise(
+            *negotiate_as_acceptor([rq, rq2], [ac, ac2], rq_roles)
+        )
+
+        cache = _NegotiationCache([ac, ac2])
+        for ii in range(2):
+            result = cache.negotiate([rq, rq2], rq_roles)
+            assert expected == self.summarise(*result)
+
+        assert 1 == cache.hits
+        assert 1 == cache.misses
+
+    def test_no_contexts(self):
+        """Test the results with no requested or supported contexts."""
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+
+        cache = _NegotiationCache([])
+        assert ([], []) == cache.negotiate([])
+        for ii in range(2):
+            contexts, roles = cache.negotiate([rq])
+            assert 0x03 == contexts[0].result
+            assert [] == roles
+
+    def test_new_objects(self):
+        """Test new objects are returned for each negotiation."""
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+        cache = _NegotiationCache([build_context('1.2.3.4')])
+
+        contexts = [cache.negotiate([rq])[0][0] for ii in range(3)]
+        assert contexts[0] is not contexts[1]
+        assert contexts[1] is not contexts[2]
+        assert contexts[1].transfer_syntax is not contexts[2].transfer_syntax
+        assert contexts[1].as_scp
+        assert not contexts[1].as_scu
+
+    def test_fingerprint(self):
+        """Test different proposals aren't confused."""
+        ac = build_context('1.2.3.4', ['1.2.840.10008.1.2'])
+        ac.scu_role = True
+        ac.scp_role = True
+        cache = _NegotiationCache([ac])
+
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+        contexts, roles = cache.negotiate([rq])
+        assert 1 == contexts[0].context_id
+        assert [] == roles
+
+        # Different context ID
+        rq.context_id = 3
+        contexts, roles = cache.negotiate([rq])
+        assert 3 == contexts[0].context_id
+
+        # Different roles
+        contexts, roles = cache.negotiate([rq], {'1.2.3.4': (True, True)})
+        assert contexts[0].as_scu
+        assert 1 == len(roles)
+
+        # Different transfer syntaxes
+        rq.transfer_syntax = ['1.2.840.10008.1.2.1']
+        contexts, roles = cache.negotiate([rq])
+        assert 0x04 == contexts[0].result
+
+        assert 0 == cache.hits
+        assert 4 == cache.misses
+        assert 4 == len(cache._cache)
+
+    def test_size(self):
+        """Test the least recently used results are removed."""
+        _config.NEGOTIATION_CACHE_SIZE = 2
+        cache = _NegotiationCache([build_context('1.2.3.4')])
+        proposals = []
+        for ii in range(3):
+            rq = build_context('1.2.3.4')
+            rq.context_id = ii * 2 + 1
+            proposals.append([rq])
+
+        cache.negotiate(proposals[0])
+        cache.negotiate(proposals[1])
+        cache.negotiate(proposals[0])
+        cache.negotiate(proposals[2])
+        assert 2 == len(cache._cache)
+        assert 1 == cache.hits
+
+        cache.negotiate(proposals[0])
+        assert 2 == cache.hits
+        cache.negotiate(proposals[1])
+        assert 2 == cache.hits
+
+    def test_disabled(self):
+        """Test no results are cached if the size is 0."""
+        _config.NEGOTIATION_CACHE_SIZE = 0
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+        cache = _NegotiationCache([build_context('1.2.3.4')])
+        for ii in range(3):
+            contexts, roles = cache.negotiate([rq])
+            assert 0x00 == contexts[0].result
+
+        assert 0 == cache.hits
+        assert 3 == cache.misses
+        assert 0 == len(cache._cache)
+
+
 class TestNegotiateAsRequestorWithRoleSelection(object):
     """Tests negotiate_as_requestor with role selection."""
     @pytest.mark.parametrize("req, acc, out", REFERENCE_ROLES)
@@ -1,6 +1,8 @@
 """Tests for the service_class module."""
 
 import queue
+import threading
+import time
 
 import pytest
 
@@ -8,6 +10,7 @@ from pydicom.dataset import Dataset
 
 from pynetdicom import build_context
 from pynetdicom.dimse_primitives import C_STORE, C_GET, C_MOVE, C_CANCEL
+from pynetdicom.dsutils import encode
 from pynetdicom.service_class import (
     StorageServiceClass,
     ServiceClass
@@ -19,6 +22,11 @@ class DummyAssoc(object):
         self.dimse = DummyDIMSE()
 
 
+class DummyAE(object):
+    def __init__(self):
+        self._codec_pool = None
+
+
 class DummyDIMSE(object):
     def __init__(self):
         self.msg_queue = queue.Queue()
@@ -148,3 +156,64 @@ class TestServiceClass(object):
         assert service.is_cancelled(2) is False
         assert service.is_cancelled(3) is False
         assert cancel not in assoc.dimse.cancel_req.values()
+
+    def test_is_cancelled_threads(self):
+        """Test is_cancelled called from several threads at once."""
+        class SlowDict(dict):
+            """A dict that gives other threads a chance to run."""
+            def keys(self):
+                keys = list(super().keys())
+                time.sleep(0.01)
+                return keys
+
+        assoc = DummyAssoc()
+        assoc.dimse.cancel_req = SlowDict()
+        cancel = C_CANCEL()
+        cancel.MessageIDBeingRespondedTo = 3
+        assoc.dimse.cancel_req[3] = cancel
+        service = ServiceClass(assoc)
+
+        results = []
+        errors = []
+
+        def check():
+            try:
+                results.append(service.is_cancelled(3))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=check) for ii in range(4)]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert [] == errors
+        assert [True, False, False, False] == sorted(results, reverse=True)
+        assert {} == assoc.dimse.cancel_req
+
+    def test_encode(self):
+        """Test response datasets are encoded using the AE's pool"""
+        class DummyPool(object):
+            def __init__(self):
+                self.datasets = []
+
+            def encode(self, ds, is_implicit_vr, is_little_endian, deflated):
+                self.datasets.append(ds)
+                return encode(ds, is_implicit_vr, is_little_endian, deflated)
+
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Snips'
+        raw = encode(ds, True, True)
+
+        # No AE or no pool
+        assoc = DummyAssoc()
+        service = ServiceClass(assoc)
+        assert raw == service._encode(ds, True, True)
+        assoc.ae = DummyAE()
+        assert raw == service._encode(ds, True, True)
+
+        assoc.ae._codec_pool = DummyPool()
+        assert raw == service._encode(ds, True, True)
+        assert [ds] == assoc.ae._codec_pool.datasets
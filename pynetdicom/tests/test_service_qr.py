@@ -10,6 +10,7 @@
 """
 
 from io import BytesIO
+import logging
 import os
 import time
 
@@ -21,7 +22,7 @@ from pydicom.uid import ImplicitVRLittleEndian, ExplicitVRLittleEndian
 
 from pynetdicom import (
     AE, build_context, StoragePresentationContexts, evt, build_role,
-    debug_logger
+    debug_logger, _config
 )
 from pynetdicom.dimse_primitives import C_FIND, C_GET, C_MOVE, C_STORE
 from pynetdicom.presentation import PresentationContext
@@ -72,6 +73,8 @@ class TestQRFindServiceClass(object):
         if self.ae:
             self.ae.shutdown()
 
+        _config.CODEC_POOL_THRESHOLD = 16384
+
     def test_bad_req_identifier(self):
         """Test SCP handles a bad request identifier"""
         def handle(event):
@@ -114,6 +117,89 @@ class TestQRFindServiceClass(object):
         assert assoc.is_released
         scp.shutdown()
 
+    def test_bad_req_identifier_logged(self, caplog):
+        """Test SCP handles a bad request identifier when logging it"""
+        def handle(event):
+            try:
+                ds = event.identifier
+                for elem in ds.iterall():
+                    pass
+            except:
+                yield 0xC310, None
+                return
+
+            yield 0x0000, None
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(
+            PatientRootQueryRetrieveInformationModelFind,
+            ExplicitVRLittleEndian
+        )
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        req = C_FIND()
+        req.MessageID = 1
+        req.AffectedSOPClassUID = PatientRootQueryRetrieveInformationModelFind
+        req.Priority = 2
+        req.Identifier = BytesIO(b'\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49')
+        assoc._reactor_checkpoint.clear()
+        with caplog.at_level(logging.INFO, logger='pynetdicom'):
+            assoc.dimse.send_msg(req, 1)
+            with pytest.warns(UserWarning):
+                cx_id, rsp = assoc.dimse.get_msg(True)
+        assoc._reactor_checkpoint.set()
+        assert rsp.Status == 0xC310
+
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+    @pytest.mark.parametrize('level, shared', [
+        (logging.INFO, True), (logging.WARNING, False)
+    ])
+    def test_req_identifier_decoded_once(self, level, shared, caplog):
+        """Test the Identifier decoded for logging is used by the handler"""
+        attrs = {}
+        def handle(event):
+            attrs['decoded'] = event.request._decoded
+            attrs['identifier'] = event.identifier
+            yield 0x0000, None
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        with caplog.at_level(level, logger='pynetdicom'):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            result = assoc.send_c_find(
+                self.query, PatientRootQueryRetrieveInformationModelFind
+            )
+            status, identifier = next(result)
+            assert status.Status == 0x0000
+            assoc.release()
+            assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 'PATIENT' == attrs['identifier'].QueryRetrieveLevel
+        if shared:
+            assert 'Find SCP Request Identifier:' in caplog.text
+            assert attrs['decoded'][0] == 'Identifier'
+            assert attrs['decoded'][2] is attrs['identifier']
+        else:
+            assert 'Find SCP Request Identifier:' not in caplog.text
+            assert attrs['decoded'] is None
+
     def test_handler_status_dataset(self):
         """Test handler yielding a Dataset status"""
         def handle(event):
@@ -1081,6 +1167,198 @@ class TestQRFindServiceClass(object):
         scp.shutdown()
 
 
+    def test_codec_pool(self):
+        """Test encoding the Identifiers using the AE's process pool"""
+        _config.CODEC_POOL_THRESHOLD = 0
+
+        def handle(event):
+            for ii in range(5):
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                ds.OtherPatientIDsSequence = [Dataset()]
+                ds.OtherPatientIDsSequence[0].PatientID = str(ii + 10)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.codec_processes = 1
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        results = list(
+            assoc.send_c_find(
+                self.query, PatientRootQueryRetrieveInformationModelFind
+            )
+        )
+        assert 6 == len(results)
+        for ii, (status, identifier) in enumerate(results[:-1]):
+            assert status.Status == 0xFF00
+            assert identifier.PatientID == str(ii)
+            assert (
+                identifier.OtherPatientIDsSequence[0].PatientID == str(ii + 10)
+            )
+
+        assert results[-1][0].Status == 0x0000
+        assert ae._codec_pool._executor is not None
+
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+
+class TestQRFindServiceClassPipelined(TestQRFindServiceClass):
+    """Test the QueryRetrieveFindServiceClass with FIND_SCP_PIPELINE_DEPTH"""
+    def setup(self):
+        """Run prior to each test"""
+        super().setup()
+        _config.FIND_SCP_PIPELINE_DEPTH = 5
+
+    def teardown(self):
+        """Clear any active threads"""
+        super().teardown()
+        _config.FIND_SCP_PIPELINE_DEPTH = None
+
+    def test_handler_aborts_during(self):
+        """Test handler aborts during any yields."""
+        # The handler runs ahead of the responses being sent, so the
+        #   association may be aborted before any are sent
+        def handle(event):
+            yield 0xFF00, self.query
+            event.assoc.abort()
+            yield 0xFF01, self.query
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        results = list(
+            assoc.send_c_find(
+                self.query, PatientRootQueryRetrieveInformationModelFind
+            )
+        )
+        assert 0xFF01 not in [status.get('Status') for status, _ in results]
+
+        time.sleep(0.1)
+        assert assoc.is_aborted
+        scp.shutdown()
+
+    def test_handler_aborts_after(self):
+        """Test handler aborts after any yields."""
+        def handle(event):
+            yield 0xFF00, self.query
+            yield 0xFF01, self.query
+            event.assoc.abort()
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        results = list(
+            assoc.send_c_find(
+                self.query, PatientRootQueryRetrieveInformationModelFind
+            )
+        )
+        assert 0x0000 not in [status.get('Status') for status, _ in results]
+
+        time.sleep(0.1)
+        assert assoc.is_aborted
+        scp.shutdown()
+
+    def test_pipeline_order(self):
+        """Test the responses are sent in the order they're yielded"""
+        def handle(event):
+            for ii in range(50):
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                yield 0xFF00, ds
+
+            yield 0x0000, None
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        results = list(
+            assoc.send_c_find(
+                self.query, PatientRootQueryRetrieveInformationModelFind
+            )
+        )
+        assert 51 == len(results)
+        for ii, (status, identifier) in enumerate(results[:-1]):
+            assert status.Status == 0xFF00
+            assert identifier.PatientID == str(ii)
+
+        assert results[-1][0].Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+    def test_pipeline_cancel(self):
+        """Test results fetched in advance aren't sent after a C-CANCEL"""
+        def handle(event):
+            for ii in range(1000):
+                if event.is_cancelled:
+                    yield 0xFE00, None
+                    return
+
+                ds = Dataset()
+                ds.PatientID = str(ii)
+                time.sleep(0.005)
+                yield 0xFF00, ds
+
+        handlers = [(evt.EVT_C_FIND, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        results = assoc.send_c_find(
+            self.query,
+            PatientRootQueryRetrieveInformationModelFind,
+            msg_id=11142
+        )
+        status, identifier = next(results)
+        assert status.Status == 0xFF00
+        assoc.send_c_cancel(11142, 1)
+
+        statuses = [status.Status for status, identifier in results]
+        assert statuses[-1] == 0xFE00
+        assert len(statuses) < 999
+
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+
 class TestQRGetServiceClass(object):
     def setup(self):
         """Run prior to each test"""
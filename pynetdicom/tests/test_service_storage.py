@@ -1,18 +1,24 @@
 """Tests for the StorageServiceClass."""
 
 from io import BytesIO
+import logging
 import os
 from pathlib import Path
+import threading
 import time
 
 import pytest
 
 from pydicom import dcmread
 from pydicom.dataset import Dataset, FileMetaDataset
-from pydicom.uid import ExplicitVRLittleEndian
+from pydicom.uid import (
+    ExplicitVRLittleEndian, DeflatedExplicitVRLittleEndian
+)
 
 from pynetdicom import AE, _config, evt, build_role, debug_logger
+from pynetdicom.dimse_messages import _STORE_RECV_MEMORY
 from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dsutils import EncodedDataset, encode
 from pynetdicom.pdu_primitives import SOPClassExtendedNegotiation
 from pynetdicom.service_class import StorageServiceClass
 from pynetdicom.sop_class import (
@@ -44,6 +50,7 @@ class TestStorageServiceClass(object):
             self.ae.shutdown()
 
         _config.STORE_RECV_CHUNKED_DATASET = False
+        _config.STORE_RECV_MEMORY_BUDGET = None
 
     @pytest.mark.skipif(not HAS_STATUS, reason="No Status class available")
     def test_status_enum(self):
@@ -495,6 +502,483 @@ class TestStorageServiceClass(object):
 
         scp.shutdown()
 
+    def test_scp_handler_dataset_sink(self):
+        """Test the dataset is written to the EVT_C_STORE_SINK sink"""
+        attrs = {}
+
+        def handle_sink(event):
+            attrs['context'] = event.context
+            attrs['request'] = event.request
+            attrs['sink'] = sink = BytesIO()
+            return sink
+
+        def handle(event):
+            attrs['dataset_sink'] = event.dataset_sink
+            attrs['dataset'] = event.dataset
+            return 0x0000
+
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [
+            (evt.EVT_C_STORE, handle), (evt.EVT_C_STORE_SINK, handle_sink)
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage, ExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112, max_pdu=1000)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        cx = attrs['context']
+        assert cx.transfer_syntax == ExplicitVRLittleEndian
+        req = attrs['request']
+        assert req.AffectedSOPInstanceUID == DATASET.SOPInstanceUID
+        assert req.DataSet.getvalue() == b''
+        assert attrs['dataset_sink'] is attrs['sink']
+        assert attrs['dataset'] == Dataset()
+
+        ds = dcmread(
+            BytesIO(attrs['sink'].getvalue()),
+            force=True
+        )
+        ds.is_little_endian = True
+        ds.is_implicit_VR = False
+        assert ds.PatientName == DATASET.PatientName
+        assert ds.PixelData == DATASET.PixelData
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_sink_none(self):
+        """Test a handler returning None receives the dataset normally"""
+        attrs = {}
+
+        def handle(event):
+            attrs['dataset_sink'] = event.dataset_sink
+            attrs['dataset'] = event.dataset
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_C_STORE, handle), (evt.EVT_C_STORE_SINK, lambda x: None)
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        assert attrs['dataset_sink'] is None
+        assert attrs['dataset'].PatientName == DATASET.PatientName
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_sink_raises(self, caplog):
+        """Test an exception in the EVT_C_STORE_SINK handler"""
+        attrs = {}
+
+        def handle_sink(event):
+            raise ValueError("Bad sink")
+
+        def handle(event):
+            attrs['dataset_sink'] = event.dataset_sink
+            attrs['dataset'] = event.dataset
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_C_STORE, handle), (evt.EVT_C_STORE_SINK, handle_sink)
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            status = assoc.send_c_store(DATASET)
+            assert status.Status == 0x0000
+            assoc.release()
+            assert assoc.is_released
+
+            assert (
+                "Exception in the handler bound to 'evt.EVT_C_STORE_SINK'"
+            ) in caplog.text
+            assert "Bad sink" in caplog.text
+
+        assert attrs['dataset_sink'] is None
+        assert attrs['dataset'].PatientName == DATASET.PatientName
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_sink_write_raises(self, caplog):
+        """Test an exception when writing to the sink"""
+        attrs = {}
+
+        class Sink:
+            def __init__(self):
+                self.writes = 0
+
+            def write(self, data):
+                self.writes += 1
+                raise OSError("Disk full")
+
+        def handle(event):
+            attrs['dataset_sink'] = event.dataset_sink
+            attrs['dataset_sink_error'] = event.dataset_sink_error
+            return attrs['status']
+
+        handlers = [
+            (evt.EVT_C_STORE, handle), (evt.EVT_C_STORE_SINK, lambda x: Sink())
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            assoc = ae.associate('localhost', 11112, max_pdu=1000)
+            assert assoc.is_established
+            # Success and warning statuses are replaced by a failure
+            for status in (0x0000, 0xB000):
+                attrs['status'] = status
+                rsp = assoc.send_c_store(DATASET)
+                assert rsp.Status == 0xA700
+                assert attrs['dataset_sink'].writes == 1
+                error = attrs['dataset_sink_error']
+                assert isinstance(error, OSError)
+                assert "Disk full" == str(error)
+
+            # Failure statuses are sent unchanged
+            attrs['status'] = 0xC000
+            rsp = assoc.send_c_store(DATASET)
+            assert rsp.Status == 0xC000
+            assoc.release()
+            assert assoc.is_released
+
+            assert (
+                "Exception raised writing to the C-STORE request's dataset "
+                "sink, the rest of the dataset will be discarded"
+            ) in caplog.text
+            assert (
+                "The C-STORE request's dataset wasn't completely written to "
+                "the dataset sink"
+            ) in caplog.text
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_sink_error_none(self):
+        """Test Event.dataset_sink_error when the sink doesn't raise"""
+        attrs = {}
+
+        def handle(event):
+            attrs['dataset_sink_error'] = event.dataset_sink_error
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_C_STORE, handle),
+            (evt.EVT_C_STORE_SINK, lambda x: BytesIO())
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        assert attrs['dataset_sink_error'] is None
+
+        scp.shutdown()
+
+    @pytest.mark.parametrize(
+        'threshold, budget, spilled',
+        [
+            (None, None, False),
+            (0, None, True),
+            (1000, None, True),
+            (10000000, None, False),
+            (None, 1000, True),
+            (None, 10000000, False),
+            (10000000, 1000, True),
+        ]
+    )
+    def test_scp_spill_to_file(self, threshold, budget, spilled):
+        """Test receiving a dataset that's too large for memory"""
+        attrs = {}
+
+        def handle(event):
+            attrs['dataset_path'] = event.dataset_path
+            attrs['dataset'] = event.dataset
+            attrs['used'] = _STORE_RECV_MEMORY.used
+            if event.dataset_path is None:
+                attrs['size'] = len(event.request.DataSet.getvalue())
+
+            return 0x0000
+
+        _config.STORE_RECV_MEMORY_BUDGET = budget
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.store_recv_spill_threshold = threshold
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112, max_pdu=1000)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        # The memory is reserved until the handler has returned
+        assert _STORE_RECV_MEMORY.used == 0
+        dataset_path = attrs['dataset_path']
+        if spilled:
+            assert attrs['used'] == 0
+            assert isinstance(dataset_path, Path)
+            assert not dataset_path.exists()
+        else:
+            assert dataset_path is None
+            if threshold is None and budget is None:
+                assert attrs['used'] == 0
+            else:
+                assert attrs['used'] == attrs['size']
+
+        ds = attrs['dataset']
+        assert ds.PatientName == DATASET.PatientName
+        assert ds.PixelData == DATASET.PixelData
+
+        scp.shutdown()
+
+    def test_scp_spill_concurrent(self):
+        """Test a dataset spills while another is still being handled"""
+        size = len(encode(DATASET, True, True))
+        attrs = {'paths': []}
+        handling = threading.Event()
+        finish = threading.Event()
+
+        def handle(event):
+            attrs['paths'].append(event.dataset_path)
+            if len(attrs['paths']) == 1:
+                attrs['used'] = _STORE_RECV_MEMORY.used
+                handling.set()
+                finish.wait(10)
+
+            return 0x0000
+
+        # Room for the first dataset and the copy made while joining its
+        #   fragments, but not for a second dataset as well
+        _config.STORE_RECV_MEMORY_BUDGET = int(size * 2.5)
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc_a = ae.associate('localhost', 11112, max_pdu=1000)
+        assoc_b = ae.associate('localhost', 11112, max_pdu=1000)
+        assert assoc_a.is_established
+        assert assoc_b.is_established
+
+        statuses = []
+        thread = threading.Thread(
+            target=lambda: statuses.append(assoc_a.send_c_store(DATASET))
+        )
+        thread.start()
+        assert handling.wait(10)
+        assert attrs['used'] == size
+
+        # The first dataset is still being handled
+        assert assoc_b.send_c_store(DATASET).Status == 0x0000
+        finish.set()
+        thread.join()
+        assert statuses[0].Status == 0x0000
+
+        assert attrs['paths'][0] is None
+        assert isinstance(attrs['paths'][1], Path)
+        assert _STORE_RECV_MEMORY.used == 0
+
+        assoc_a.release()
+        assoc_b.release()
+        scp.shutdown()
+
+    def test_scp_handler_encoded_dataset_sink(self):
+        """Test encoded_dataset raises if the dataset was sent to a sink"""
+        attrs = {}
+
+        def handle(event):
+            try:
+                event.encoded_dataset
+            except AttributeError as exc:
+                attrs['exc'] = exc
+
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_C_STORE, handle),
+            (evt.EVT_C_STORE_SINK, lambda x: BytesIO())
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        assert "written to the sink returned by" in str(attrs['exc'])
+
+        scp.shutdown()
+
+    @pytest.mark.parametrize('chunked', [False, True])
+    def test_scp_handler_forward_encoded_dataset(self, chunked):
+        """Test forwarding the encoded dataset to another SCP"""
+        attrs = {}
+
+        def handle_final(event):
+            attrs['dataset'] = event.dataset
+            attrs['context'] = event.context
+            return 0x0000
+
+        def handle_router(event):
+            ds = event.encoded_dataset
+            attrs['encoded'] = ds
+            return forward.send_c_store(ds).Status
+
+        _config.STORE_RECV_CHUNKED_DATASET = chunked
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage, ExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        final = ae.start_server(
+            ('', 11113),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, handle_final)]
+        )
+        router = ae.start_server(
+            ('', 11112),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, handle_router)]
+        )
+
+        forward = ae.associate('localhost', 11113)
+        assert forward.is_established
+
+        assoc = ae.associate('localhost', 11112, max_pdu=1000)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+        forward.release()
+        assert forward.is_released
+
+        encoded = attrs['encoded']
+        assert encoded.sop_class_uid == CTImageStorage
+        assert encoded.sop_instance_uid == DATASET.SOPInstanceUID
+        assert encoded.transfer_syntax == ExplicitVRLittleEndian
+
+        assert attrs['context'].transfer_syntax == ExplicitVRLittleEndian
+        ds = attrs['dataset']
+        assert ds.PatientName == DATASET.PatientName
+        assert ds.PixelData == DATASET.PixelData
+
+        router.shutdown()
+        final.shutdown()
+
+    @pytest.mark.parametrize('chunked', [False, True])
+    def test_scp_handler_deflated(self, chunked):
+        """Test a deflated dataset is inflated as it's received"""
+        attrs = {}
+
+        def handle(event):
+            attrs['request'] = event.request
+            attrs['dataset'] = event.dataset
+            attrs['file_meta'] = event.file_meta
+            attrs['encoded'] = event.encoded_dataset
+            return 0x0000
+
+        _config.STORE_RECV_CHUNKED_DATASET = chunked
+
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        scp = ae.start_server(
+            ('', 11112),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, handle)]
+        )
+
+        assoc = ae.associate('localhost', 11112, max_pdu=1000)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        req = attrs['request']
+        assert req._dataset_transfer_syntax == ExplicitVRLittleEndian
+        assert attrs['file_meta'].TransferSyntaxUID == ExplicitVRLittleEndian
+        assert attrs['encoded'].transfer_syntax == ExplicitVRLittleEndian
+        ds = attrs['dataset']
+        assert ds.PatientName == DATASET.PatientName
+        assert ds.PixelData == DATASET.PixelData
+
+        scp.shutdown()
+
+    def test_scp_handler_deflated_invalid(self, caplog):
+        """Test receiving invalid deflated data aborts the association"""
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ds = EncodedDataset(
+            b'\xff' * 2000,
+            CTImageStorage,
+            '1.2.3',
+            DeflatedExplicitVRLittleEndian
+        )
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            assoc = ae.associate('localhost', 11112, max_pdu=1000)
+            assert assoc.is_established
+            status = assoc.send_c_store(ds)
+            assert status == Dataset()
+            while assoc.is_alive():
+                time.sleep(0.001)
+
+            assert assoc.is_aborted
+            scp.shutdown()
+
+        assert "Unable to inflate the received C-STORE" in caplog.text
+
     def test_scp_handler_move_origin(self):
         """Test handler event's request property with MoveOriginator"""
         attrs = {}
@@ -4,6 +4,7 @@ import pytest
 
 from pydicom._uid_dict import UID_dictionary
 
+from pynetdicom import sop_class
 from pynetdicom.sop_class import (
     uid_to_sop_class,
     uid_to_service_class,
@@ -54,6 +55,8 @@ from pynetdicom.sop_class import (
     _UNIFIED_PROCEDURE_STEP_CLASSES,
     UnifiedProcedureStepPullSOPClass,
     _VERIFICATION_CLASSES,
+    _SOP_CLASS_UIDS,
+    _UID_TO_SERVICE_CLASS,
     VerificationSOPClass,
     DisplaySystemSOPInstance,
     PrinterConfigurationRetrievalSOPInstance,
@@ -412,3 +415,57 @@ class TestSOPClass(object):
         assert sop_class == sop_class_b
         assert sop_class_b == '1.2.3'
         assert sop_class_b.service_class == ServiceClass
+
+
+class TestLazySOPClass(object):
+    """Tests for creating the SOP Classes on first access"""
+    def test_created_once(self):
+        """Test the same SOP Class is returned each time"""
+        uid = '1.2.840.10008.5.1.4.1.1.481.9'
+        assert 'RTIonBeamsTreatmentRecordStorage' in _SOP_CLASS_UIDS
+        first = sop_class.RTIonBeamsTreatmentRecordStorage
+        assert first == uid
+        assert first.service_class == StorageServiceClass
+        assert first.__doc__ == f"``{uid}``"
+        assert first is sop_class.RTIonBeamsTreatmentRecordStorage
+        assert first is uid_to_sop_class(uid)
+
+    def test_unknown_name(self):
+        """Test accessing an unknown attribute raises"""
+        msg = r"module 'pynetdicom.sop_class' has no attribute 'FooStorage'"
+        with pytest.raises(AttributeError, match=msg):
+            sop_class.FooStorage
+
+        with pytest.raises(ImportError):
+            from pynetdicom.sop_class import FooStorage
+
+    def test_dir(self):
+        """Test dir() includes the SOP Classes"""
+        names = dir(sop_class)
+        assert 'uid_to_sop_class' in names
+        for name in _SOP_CLASS_UIDS:
+            assert name in names
+
+    def test_star_import(self):
+        """Test `from pynetdicom.sop_class import *` includes the SOP
+        Classes"""
+        namespace = {}
+        exec("from pynetdicom.sop_class import *", namespace)
+        for name, uid in _SOP_CLASS_UIDS.items():
+            assert namespace[name] == uid
+            assert namespace[name] is getattr(sop_class, name)
+
+        assert namespace['uid_to_sop_class'] is uid_to_sop_class
+        assert namespace['SOPClass'] is SOPClass
+        assert 'VerificationSOPClass' in namespace
+        assert 'DisplaySystemSOPInstance' in namespace
+        assert '_SOP_CLASS_UIDS' not in namespace
+        assert 'sys' not in namespace
+
+    def test_all_sop_classes(self):
+        """Test every SOP Class can be created"""
+        for name, uid in _SOP_CLASS_UIDS.items():
+            obj = getattr(sop_class, name)
+            assert isinstance(obj, SOPClass)
+            assert obj == uid
+            assert obj.service_class == _UID_TO_SERVICE_CLASS[uid]
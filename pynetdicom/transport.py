@@ -23,6 +23,7 @@ from pynetdicom._handlers import (
     standard_dimse_recv_handler, standard_dimse_sent_handler,
     standard_pdu_recv_handler, standard_pdu_sent_handler,
 )
+from pynetdicom.presentation import _NegotiationCache
 
 
 LOGGER = logging.getLogger('pynetdicom.transport')
@@ -347,7 +348,10 @@ class AssociationSocket(object):
                 nr_sent = self.socket.send(bytestream[total_sent:])
                 total_sent += nr_sent
 
-            evt.trigger(self.assoc, evt.EVT_DATA_SENT, {'data' : bytestream})
+            if evt.EVT_DATA_SENT in self.assoc._bound_events:
+                evt.trigger(
+                    self.assoc, evt.EVT_DATA_SENT, {'data' : bytestream}
+                )
         except (socket.error, socket.timeout):
             # Evt17: Transport connection closed
             self.event_queue.put('Evt17')
@@ -456,7 +460,12 @@ class RequestHandler(BaseRequestHandler):
         assoc.acceptor.implementation_version_name = (
             self.ae.implementation_version_name
         )
-        assoc.acceptor.supported_contexts = deepcopy(self.server.contexts)
+        # The server's contexts are only copied if they're accessed
+        # pylint: disable=protected-access
+        assoc.acceptor._share_contexts(
+            self.server.contexts, self.server._negotiation_cache
+        )
+        # pylint: enable=protected-access
 
         # Association Requestor object -> remote AE
         assoc.requestor.address = self.remote[0]
@@ -533,7 +542,10 @@ class AssociationServer(TCPServer):
         """
         self.ae = ae
         self.ae_title = ae_title
-        self.contexts = contexts
+        # Use a snapshot of the contexts as they're shared by the
+        #   associations, so repeated proposals are only negotiated once
+        self.contexts = deepcopy(contexts)
+        self._negotiation_cache = _NegotiationCache(self.contexts)
         self.ssl_context = ssl_context
         self.allow_reuse_address = True
         self.socket = None